@@ -0,0 +1,41 @@
+"""Mede o tempo de abertura do KeywordsApp com 15, 500 e 5.000 keywords sintéticas.
+
+Uso (precisa de um display, real ou virtual como o Xvfb):
+    python benchmarks/bench_lista_keywords.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import keywords as modulo_keywords  # noqa: E402
+
+TAMANHOS = (15, 500, 5000)
+REPETICOES = 5
+
+
+def keywords_sinteticas(quantidade):
+    return {f"KEYWORD{i:05d}": f"Descrição sintética da keyword {i}." for i in range(quantidade)}
+
+
+def medir_abertura(quantidade):
+    """Menor tempo, em ms, para construir e desenhar a janela de Keywords"""
+    originais = modulo_keywords.keywords
+    modulo_keywords.keywords = keywords_sinteticas(quantidade)
+    try:
+        tempos = []
+        for _ in range(REPETICOES):
+            inicio = time.perf_counter()
+            app = modulo_keywords.KeywordsApp()
+            app.update_idletasks()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+            app.destroy()
+        return min(tempos)
+    finally:
+        modulo_keywords.keywords = originais
+
+
+if __name__ == "__main__":
+    for quantidade in TAMANHOS:
+        print(f"{quantidade:>6} keywords: {medir_abertura(quantidade):8.2f} ms")
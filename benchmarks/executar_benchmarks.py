@@ -0,0 +1,273 @@
+"""Suíte de benchmarks: importação, construção das janelas e latência das consultas.
+
+Uso:
+    python benchmarks/executar_benchmarks.py [-o resultados.json] [--baseline baseline.json]
+                                             [--limiar 0.25] [--salvar-baseline]
+
+As medidas de interface precisam de um display. Sem DISPLAY, a suíte tenta subir
+um Xvfb; se não houver nenhum, essas medidas são puladas. Os tempos vão para um
+JSON (em ms, menor é melhor) e são comparados com o baseline: qualquer medida
+mais lenta que baseline * (1 + limiar) é uma regressão e o script sai com código 1.
+Sem baseline o script também sai com código 1, a não ser com --salvar-baseline.
+Um módulo que não importa (por exemplo, sem o BaseApp) tem a medida pulada.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(PASTA)
+sys.path.insert(0, RAIZ)
+
+BASELINE = os.path.join(PASTA, "baseline.json")
+RESULTADOS = os.path.join(PASTA, "resultados.json")
+ESCALAS = (1, 10, 100)
+
+
+def cronometrar(funcao, repeticoes=5, chamadas=1):
+    """Mediana, em ms por chamada, de `repeticoes` rodadas de `chamadas` execuções"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000 / chamadas)
+    return statistics.median(tempos)
+
+
+def rodar_medida(nome, codigo):
+    """Roda o código num interpretador novo; devolve o stdout, ou None (com um aviso) se ele falhar"""
+    saida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True)
+    if saida.returncode:
+        linhas = saida.stderr.strip().splitlines()
+        print(f"{nome}: medida pulada ({linhas[-1] if linhas else f'código {saida.returncode}'})", file=sys.stderr)
+        return None
+    return saida.stdout
+
+
+def tempo_importacao(modulo, repeticoes=5):
+    """Tempo de importação em um interpretador novo, para não medir o cache de módulos (None se não importa)"""
+    codigo = f"import time; t = time.perf_counter(); import {modulo}; print(time.perf_counter() - t)"
+    tempos = []
+    for _ in range(repeticoes):
+        saida = rodar_medida(f"importacao.{modulo}", codigo)
+        if saida is None:
+            return None
+        tempos.append(float(saida.strip()) * 1000)
+    return statistics.median(tempos)
+
+
+def tempo_primeira_janela(repeticoes=5):
+    """Do início do interpretador até a página inicial desenhada; as tabelas de dados não podem entrar nessa conta"""
+    codigo = ("import sys, time; t = time.perf_counter(); from pagina_inicial import PaginaInicial; "
+              "app = PaginaInicial(); carregou = 'nucleo' in sys.modules; app.update_idletasks(); "
+              "print(time.perf_counter() - t, carregou); app.destroy()")
+    tempos = []
+    for _ in range(repeticoes):
+        saida = rodar_medida("inicio.primeira_janela", codigo)
+        if saida is None:
+            return None
+        tempo, carregou = saida.split()
+        if carregou == "True":
+            print("aviso: nucleo foi importado antes da primeira janela", file=sys.stderr)
+        tempos.append(float(tempo) * 1000)
+    return statistics.median(tempos)
+
+
+def subir_display_virtual(numero=99):
+    """Sobe um Xvfb quando não há display; devolve o processo (ou None)"""
+    if os.environ.get("DISPLAY") or sys.platform == "win32":
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None
+    processo = subprocess.Popen([xvfb, f":{numero}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    soquete = f"/tmp/.X11-unix/X{numero}"
+    for _ in range(50):
+        if os.path.exists(soquete):
+            break
+        time.sleep(0.1)
+    os.environ["DISPLAY"] = f":{numero}"
+    return processo
+
+
+def display_disponivel():
+    import tkinter as tk
+    try:
+        tk.Tk().destroy()
+        return True
+    except tk.TclError:
+        return False
+
+
+def construir(classe):
+    app = classe()
+    app.update_idletasks()
+    app.destroy()
+
+
+def benchmarks_interface(resultados):
+    import elementosbotoes
+    import keywords
+    import nucleo
+    from bench_lista_keywords import TAMANHOS, medir_abertura
+    from pagina_inicial import PaginaInicial
+
+    resultados["janela.PaginaInicial"] = cronometrar(lambda: construir(PaginaInicial))
+    primeira_janela = tempo_primeira_janela()
+    if primeira_janela is not None:
+        resultados["inicio.primeira_janela"] = primeira_janela
+    resultados["janela.KeywordsApp"] = cronometrar(lambda: construir(keywords.KeywordsApp))
+    resultados["janela.ElementosApp"] = cronometrar(lambda: construir(elementosbotoes.ElementosApp))
+    for quantidade in TAMANHOS:
+        resultados[f"janela.KeywordsApp.{quantidade}_keywords"] = medir_abertura(quantidade)
+
+    app = elementosbotoes.ElementosApp()
+    simbolos = [element["symbol"] for element in nucleo.elements]
+    resultados["chamada.show_element_info"] = cronometrar(
+        lambda: [app.show_element_info(simbolo) for simbolo in simbolos], chamadas=10) / len(simbolos)
+    app.destroy()
+
+    app = keywords.KeywordsApp()
+    nomes = list(keywords.keywords)
+    resultados["chamada.mostrar_descricao"] = cronometrar(
+        lambda: [app.mostrar_descricao(nome) for nome in nomes], chamadas=10) / len(nomes)
+    app.destroy()
+
+
+def methods_data_sintetico(methods_data, escala):
+    """Repete os métodos atuais `escala` vezes com nomes novos"""
+    return {f"{metodo}_{i}": elems for i in range(escala) for metodo, elems in methods_data.items()}
+
+
+def keywords_sinteticas(keywords, escala):
+    return {f"{nome}_{i}": texto for i in range(escala) for nome, texto in keywords.items()}
+
+
+def benchmarks_consultas(resultados):
+    import nucleo
+    from busca_keywords import IndiceBusca
+    from pacote_keywords import KeywordsEmpacotadas, empacotar
+
+    keywords = nucleo.keywords
+    originais = nucleo.methods_data
+    moleculas = [{"C", "H", "O"}, {"C", "H", "N", "O", "S"}, {"Fe", "C", "H"}, {"La", "Cl"}, {"Pt", "P", "C", "H"}]
+    descricoes = {nome: keywords[nome] for nome in keywords}
+    try:
+        for escala in ESCALAS:
+            nucleo.methods_data = methods_data_sintetico(originais, escala)
+            resultados[f"indice.build_index.x{escala}"] = cronometrar(nucleo.build_index)
+
+            def consultar():
+                nucleo.methods_for_mask.cache_clear()
+                for simbolos in moleculas:
+                    nucleo.methods_supporting(simbolos)
+            resultados[f"indice.methods_supporting.x{escala}"] = cronometrar(consultar, chamadas=100) / len(moleculas)
+
+            sinteticas = keywords_sinteticas(descricoes, escala)
+            resultados[f"busca.construcao.x{escala}"] = cronometrar(lambda: IndiceBusca(sinteticas), repeticoes=3)
+            indice = IndiceBusca(sinteticas)
+
+            def buscar():
+                for consulta in ("hessian", "orth", "gnorm let", "scf criterion", "m"):
+                    indice.cache.clear()
+                    indice.buscar(consulta)
+            resultados[f"busca.consulta.x{escala}"] = cronometrar(buscar, chamadas=20) / 5
+
+            with tempfile.TemporaryDirectory() as pasta:
+                fonte = os.path.join(pasta, "keywords.json")
+                pacote = os.path.join(pasta, "keywords.pack")
+                with open(fonte, "w", encoding="utf-8") as arquivo:
+                    json.dump(sinteticas, arquivo, ensure_ascii=False)
+                empacotar(fonte, pacote)
+                nome = next(iter(sinteticas))
+
+                def abrir_e_ler():
+                    store = KeywordsEmpacotadas(pacote)
+                    store[nome]
+                    store.mapa.close()
+                resultados[f"pacote.abrir_e_ler.x{escala}"] = cronometrar(abrir_e_ler, chamadas=20)
+    finally:
+        nucleo.methods_data = originais
+        nucleo.build_index()
+
+
+def comparar(resultados, baseline, limiar):
+    """Lista as medidas que ficaram mais lentas que o baseline além do limiar"""
+    regressoes = []
+    for nome, valor in sorted(resultados.items()):
+        referencia = baseline.get(nome)
+        if referencia and valor > referencia * (1 + limiar):
+            regressoes.append((nome, referencia, valor))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa os benchmarks e compara com o baseline.")
+    parser.add_argument("-o", "--saida", default=RESULTADOS, help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", default=BASELINE, help="arquivo JSON de referência")
+    parser.add_argument("--limiar", type=float, default=0.25, help="piora relativa tolerada (0.25 = 25%%)")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava os resultados atuais como baseline")
+    parser.add_argument("--sem-interface", action="store_true", help="pula as medidas que precisam de display")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for modulo in ("pagina_inicial", "keywords", "elementosbotoes", "nucleo"):
+        tempo = tempo_importacao(modulo)
+        if tempo is not None:
+            resultados[f"importacao.{modulo}"] = tempo
+    benchmarks_consultas(resultados)
+
+    xvfb = None
+    try:
+        if not args.sem_interface:
+            xvfb = subir_display_virtual()
+            if display_disponivel():
+                benchmarks_interface(resultados)
+            else:
+                print("Sem display (nem Xvfb): medidas de interface puladas.", file=sys.stderr)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    relatorio = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "resultados_ms": resultados,
+    }
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, indent=2)
+    for nome, valor in sorted(resultados.items()):
+        print(f"{nome:<45} {valor:10.4f} ms")
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+        print(f"Baseline gravado em {args.baseline}.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Sem baseline em {args.baseline}; use --salvar-baseline para criar um.", file=sys.stderr)
+        return 1
+    with open(args.baseline, encoding="utf-8") as arquivo:
+        baseline = json.load(arquivo)
+    faltando = sorted(set(baseline) - set(resultados))
+    if faltando:
+        print(f"Medidas do baseline que não rodaram: {', '.join(faltando)}", file=sys.stderr)
+    regressoes = comparar(resultados, baseline, args.limiar)
+    for nome, referencia, valor in regressoes:
+        print(f"REGRESSÃO {nome}: {referencia:.4f} ms -> {valor:.4f} ms", file=sys.stderr)
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import math
+import re
+from collections import OrderedDict
+
+TOKEN = re.compile(r"\w+")
+
+# Pesos de cada tipo de casamento entre o termo buscado e o token do índice
+PESO_EXATO = 1.0
+PESO_PREFIXO = 0.7
+PESO_SUBSTRING = 0.4
+PESO_NOME = 3.0  # Termos que aparecem no nome da keyword valem mais
+
+
+def tokenizar(texto):
+    return TOKEN.findall(texto.casefold())
+
+
+def tokens_do_nome(nome):
+    """Tokens do nome da keyword sem a forma do valor: GNORM=n.nn -> ('gnorm',), LOCATE-TS -> ('locate', 'ts')"""
+    return tuple(tokenizar(nome.split("=")[0].split("(")[0]))
+
+
+def trigramas(token):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class IndiceBusca:
+    """Índice invertido em memória sobre as keywords, com postings de tokens, prefixos e trigramas.
+
+    As buscas nunca relêem os textos: cada termo é resolvido no vocabulário
+    (exato, prefixo ou substring via trigramas) e os postings dos tokens
+    encontrados são somados com peso tf-idf.
+    """
+
+    def __init__(self, documentos, tamanho_cache=256):
+        self.nomes = list(documentos)
+        self.postings = {}   # token -> {id do documento: peso}
+        self.prefixos = {}   # prefixo -> tokens do vocabulário que começam com ele
+        self.trigramas = {}  # trigrama -> tokens do vocabulário que o contêm
+        self.cache = OrderedDict()
+        self.tamanho_cache = tamanho_cache
+        self.tokens_nomes = [tokens_do_nome(nome) for nome in self.nomes]
+
+        frequencias = {}
+        for doc_id, nome in enumerate(self.nomes):
+            contagem = {}
+            for token in tokenizar(documentos[nome]):
+                contagem[token] = contagem.get(token, 0) + 1
+            for token in tokenizar(nome):
+                contagem[token] = contagem.get(token, 0) + PESO_NOME
+            for token, tf in contagem.items():
+                frequencias.setdefault(token, {})[doc_id] = tf
+
+        total = len(self.nomes)
+        for token, docs in frequencias.items():
+            idf = math.log(1 + total / len(docs))
+            self.postings[token] = {doc_id: (1 + math.log(tf)) * idf for doc_id, tf in docs.items()}
+            for tamanho in range(1, len(token) + 1):
+                self.prefixos.setdefault(token[:tamanho], []).append(token)
+            for trigrama in trigramas(token):
+                self.trigramas.setdefault(trigrama, set()).add(token)
+
+    def _casamentos(self, termo):
+        """Tokens do vocabulário que casam com o termo, com o peso do tipo de casamento"""
+        casamentos = {token: PESO_PREFIXO for token in self.prefixos.get(termo, ())}
+        if termo in self.postings:
+            casamentos[termo] = PESO_EXATO
+        if len(termo) >= 3:
+            candidatos = None
+            for trigrama in trigramas(termo):
+                tokens = self.trigramas.get(trigrama, set())
+                candidatos = tokens if candidatos is None else candidatos & tokens
+                if not candidatos:
+                    break
+            for token in candidatos or ():
+                if token not in casamentos and termo in token:
+                    casamentos[token] = PESO_SUBSTRING
+        return casamentos
+
+    def nivel_nome(self, doc_id, termos):
+        """Quanto a consulta casa com o nome: 3 nome exato, 2 começo do nome, 1 todo termo é prefixo de um token do nome"""
+        tokens = self.tokens_nomes[doc_id]
+        if tokens == tuple(termos):
+            return 3
+        if " ".join(tokens).startswith(" ".join(termos)):
+            return 2
+        if all(any(token.startswith(termo) for token in tokens) for termo in termos):
+            return 1
+        return 0
+
+    def buscar(self, consulta, limite=None):
+        """Retorna os nomes das keywords que contêm todos os termos, do mais relevante ao menos
+
+        A lista devolvida é uma cópia: quem chama pode ordená-la ou filtrá-la sem mexer no cache.
+        """
+        termos = tokenizar(consulta)
+        if not termos:
+            return list(self.nomes[:limite] if limite else self.nomes)
+
+        chave = (" ".join(termos), limite)
+        if chave in self.cache:
+            self.cache.move_to_end(chave)
+            return list(self.cache[chave])
+
+        pontuacao = None
+        for termo in termos:
+            parcial = {}
+            for token, peso in self._casamentos(termo).items():
+                for doc_id, valor in self.postings[token].items():
+                    parcial[doc_id] = max(parcial.get(doc_id, 0.0), peso * valor)
+            if pontuacao is None:
+                pontuacao = parcial
+            else:
+                pontuacao = {doc_id: valor + parcial[doc_id] for doc_id, valor in pontuacao.items() if doc_id in parcial}
+            if not pontuacao:
+                break
+
+        # O casamento com o nome vem antes da pontuação tf-idf: digitar o nome de uma keyword a põe no topo
+        ordem = sorted(pontuacao, key=lambda doc_id: (-self.nivel_nome(doc_id, termos), -pontuacao[doc_id], doc_id))
+        resultado = tuple(self.nomes[doc_id] for doc_id in ordem[:limite])
+
+        self.cache[chave] = resultado
+        if len(self.cache) > self.tamanho_cache:
+            self.cache.popitem(last=False)
+        return list(resultado)
@@ -0,0 +1,88 @@
+"""Teste de carga do servico_consultas em localhost.
+
+Uso:
+    python carga_servico.py [--porta 8765] [--conexoes 32] [--duracao 10]
+
+Abre várias conexões keep-alive, envia requisições sem parar durante o tempo
+pedido e mostra requisições por segundo e a latência observada pelo cliente.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from nucleo import elements, keywords
+
+MOLECULAS = ["C,H,O", "C,H,N,O,S", "Fe,C,H", "La,Cl", "Pt,P,C,H", "Na,Cl", "Si,O"]
+
+
+def requisicoes_exemplo():
+    """Mistura de rotas parecida com o uso real (com repetições, como acontece na prática)"""
+    simbolos = [element["symbol"] for element in elements]
+    nomes = list(keywords)
+    while True:
+        sorteio = random.random()
+        if sorteio < 0.5:
+            yield f"GET /elemento/{random.choice(simbolos)} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+        elif sorteio < 0.8:
+            yield f"GET /metodos?simbolos={random.choice(MOLECULAS)} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+        elif sorteio < 0.95:
+            yield f"GET /keyword/{random.choice(nomes).replace('=', '%3D')} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+        else:
+            corpo = json.dumps({"elementos": random.sample(simbolos, 5), "keywords": random.sample(nomes, 2)}).encode()
+            yield (f"POST /lote HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(corpo)}\r\n\r\n").encode() + corpo
+
+
+async def ler_resposta(leitor):
+    cabecalho = await leitor.readuntil(b"\r\n\r\n")
+    for linha in cabecalho.split(b"\r\n"):
+        if linha.lower().startswith(b"content-length:"):
+            await leitor.readexactly(int(linha.split(b":")[1]))
+            break
+    return cabecalho[9:12]
+
+
+async def cliente(host, porta, fim, latencias, erros):
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    gerador = requisicoes_exemplo()
+    while time.perf_counter() < fim:
+        inicio = time.perf_counter()
+        escritor.write(next(gerador))
+        status = await ler_resposta(leitor)
+        latencias.append(time.perf_counter() - inicio)
+        if status != b"200":
+            erros.append(status)
+    escritor.close()
+
+
+async def executar(host, porta, conexoes, duracao):
+    latencias, erros = [], []
+    inicio = time.perf_counter()
+    fim = inicio + duracao
+    await asyncio.gather(*(cliente(host, porta, fim, latencias, erros) for _ in range(conexoes)))
+    total = time.perf_counter() - inicio
+
+    latencias.sort()
+    print(f"{len(latencias)} requisições em {total:.1f} s: {len(latencias) / total:,.0f} req/s ({len(erros)} erros)")
+    for nome, p in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99)):
+        print(f"  latência {nome}: {latencias[int(p * (len(latencias) - 1))] * 1000:.2f} ms")
+
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    escritor.write(b"GET /estatisticas HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+    print("Servidor:", (await leitor.read()).split(b"\r\n\r\n", 1)[1].decode())
+    escritor.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga do serviço de consultas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--conexoes", type=int, default=32)
+    parser.add_argument("--duracao", type=float, default=10.0, help="segundos")
+    args = parser.parse_args(argv)
+    asyncio.run(executar(args.host, args.porta, args.conexoes, args.duracao))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Cobertura vetorizada (NumPy) de fórmulas moleculares pelos métodos semiempíricos.
+
+A matriz booleana elemento x método é montada a partir de methods_data, com os
+elementos na ordem da tabela `elements`. As moléculas entram em blocos — arrays
+de contagens (n x elementos), listas de fórmulas, uma coluna de CSV ou de Parquet —
+e cada bloco devolve a máscara de métodos de cada molécula, enquanto as
+estatísticas por método são acumuladas. A memória depende só do tamanho do bloco.
+
+Uso:
+    python cobertura.py formulas.csv --coluna formula [--mascaras saida.u64] [--bloco 100000]
+    python cobertura.py formulas.parquet --coluna formula
+
+As máscaras são gravadas como uint64 binário (leia com numpy.fromfile(..., dtype="<u8")):
+o bit i indica que o método i (na ordem de `metodos`) cobre a molécula. Com mais de
+64 métodos (contando os de metodos/) as máscaras não cabem em uint64 e não são geradas.
+Fórmulas vazias ou sem nenhum símbolo reconhecível não são cobertas por nenhum método.
+
+"primeiro_que_cobre" conta, para cada método, as moléculas em que ele é o primeiro
+da ordem de `metodos` a cobrir; não é uma estimativa de custo.
+"""
+import argparse
+import csv
+import json
+import re
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+from nucleo import elements, methods_data
+
+simbolos = [element["symbol"] for element in elements]
+coluna_do_simbolo = {simbolo: i for i, simbolo in enumerate(simbolos)}
+metodos = list(methods_data)
+
+# matriz[e, m] é True quando o método m tem parâmetros para o elemento e
+matriz = np.zeros((len(simbolos), len(metodos)), dtype=bool)
+for m, metodo in enumerate(metodos):
+    for element in methods_data[metodo]:
+        matriz[coluna_do_simbolo[element["symbol"]], m] = True
+
+# Elementos que cada método NÃO suporta, em float32 para a multiplicação usar BLAS
+nao_suportados = (~matriz).astype(np.float32)
+MAXIMO_METODOS_MASCARA = 64
+if len(metodos) <= MAXIMO_METODOS_MASCARA:
+    pesos_bits = np.uint64(1) << np.arange(len(metodos), dtype=np.uint64)
+else:
+    pesos_bits = None  # Não cabe em uint64: os blocos saem sem máscaras
+
+ELEMENTO = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+ResultadoBloco = namedtuple("ResultadoBloco", "mascaras cobertura primeiro")
+
+
+def cobrir(contagens, desconhecidos=None):
+    """Calcula a cobertura de um bloco de moléculas (contagens: n x elementos)
+
+    Devolve as máscaras uint64 (None com mais de 64 métodos), a matriz booleana
+    n x métodos e o índice do primeiro método (na ordem de `metodos`) que cobre cada
+    molécula, ou -1.
+    """
+    presenca = np.asarray(contagens) > 0
+    cobertura = (presenca.astype(np.float32) @ nao_suportados) == 0
+    cobertura &= presenca.any(axis=1)[:, None]  # Molécula sem nenhum elemento: nenhum método cobre
+    if desconhecidos is not None:
+        cobertura &= ~desconhecidos[:, None]  # Símbolos fora da tabela: nenhum método cobre
+    mascaras = None if pesos_bits is None else (cobertura * pesos_bits).sum(axis=1, dtype=np.uint64)
+    primeiro = np.where(cobertura.any(axis=1), cobertura.argmax(axis=1), -1).astype(np.int32)
+    return ResultadoBloco(mascaras, cobertura, primeiro)
+
+
+def ler_formula(formula):
+    """Colunas, quantidades e se há símbolo fora da tabela, para uma fórmula como "C6H12O6" """
+    colunas, quantidades, desconhecido = [], [], False
+    for simbolo, quantidade in ELEMENTO.findall(formula or ""):
+        coluna = coluna_do_simbolo.get(simbolo)
+        if coluna is None:
+            desconhecido = True
+            continue
+        colunas.append(coluna)
+        quantidades.append(int(quantidade or 1))
+    return colunas, quantidades, desconhecido
+
+
+def contagens_de_formulas(formulas, cache=None):
+    """Converte fórmulas em uma matriz de contagens e um vetor que marca símbolos desconhecidos"""
+    cache = {} if cache is None else cache
+    linhas, colunas, quantidades = [], [], []
+    desconhecidos = np.zeros(len(formulas), dtype=bool)
+    for i, formula in enumerate(formulas):
+        lida = cache.get(formula)
+        if lida is None:
+            lida = cache[formula] = ler_formula(formula)
+        linhas.extend([i] * len(lida[0]))
+        colunas.extend(lida[0])
+        quantidades.extend(lida[1])
+        desconhecidos[i] = lida[2]
+
+    contagens = np.zeros((len(formulas), len(simbolos)), dtype=np.int32)
+    np.add.at(contagens, (np.array(linhas, dtype=np.intp), np.array(colunas, dtype=np.intp)), quantidades)
+    return contagens, desconhecidos
+
+
+def blocos_de_formulas(formulas, tamanho=100_000):
+    """Gera ResultadoBloco para um iterável de fórmulas, `tamanho` por vez
+
+    Fórmulas repetidas dentro do bloco são calculadas uma vez só e depois espalhadas. As
+    fórmulas já lidas ficam num cache entre blocos, limitado ao tamanho do bloco.
+    """
+    cache = {}
+    iterador = iter(formulas)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        if len(cache) > tamanho:
+            cache.clear()
+        posicoes = {}
+        inversa = np.fromiter((posicoes.setdefault(formula, len(posicoes)) for formula in bloco),
+                              dtype=np.intp, count=len(bloco))
+        unicas = cobrir(*contagens_de_formulas(list(posicoes), cache))
+        mascaras = None if unicas.mascaras is None else unicas.mascaras[inversa]
+        yield ResultadoBloco(mascaras, unicas.cobertura[inversa], unicas.primeiro[inversa])
+
+
+def blocos_de_contagens(contagens, tamanho=100_000):
+    """Gera ResultadoBloco para um array (n x elementos), inclusive memory-mapped"""
+    for inicio in range(0, len(contagens), tamanho):
+        yield cobrir(contagens[inicio:inicio + tamanho])
+
+
+def formulas_csv(caminho, coluna):
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        leitor = csv.reader(arquivo)
+        indice = next(leitor).index(coluna)
+        for linha in leitor:
+            yield linha[indice] if indice < len(linha) else ""  # Linha em branco: fórmula vazia
+
+
+def formulas_parquet(caminho, coluna, tamanho=100_000):
+    import pyarrow.parquet as pq  # Dependência opcional, só para entradas em Parquet
+
+    for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho, columns=[coluna]):
+        yield from lote.column(0).to_pylist()
+
+
+class EstatisticasCobertura:
+    """Acumula, bloco a bloco, quantas moléculas cada método cobre"""
+
+    def __init__(self):
+        self.total = 0
+        self.cobertas = np.zeros(len(metodos), dtype=np.int64)
+        self.primeiro = np.zeros(len(metodos), dtype=np.int64)
+        self.nenhum = 0
+
+    def atualizar(self, resultado):
+        self.total += len(resultado.cobertura)
+        self.cobertas += resultado.cobertura.sum(axis=0)
+        escolhidos = resultado.primeiro
+        self.primeiro += np.bincount(escolhidos[escolhidos >= 0], minlength=len(metodos))
+        self.nenhum += int((escolhidos < 0).sum())
+
+    def como_dict(self):
+        return {
+            "total": self.total,
+            "sem_metodo": self.nenhum,
+            "metodos": {
+                metodo: {
+                    "cobertas": int(self.cobertas[m]),
+                    "fracao": float(self.cobertas[m] / self.total) if self.total else 0.0,
+                    "primeiro_que_cobre": int(self.primeiro[m]),
+                }
+                for m, metodo in enumerate(metodos)
+            },
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cobertura de fórmulas moleculares pelos métodos semiempíricos.")
+    parser.add_argument("entrada", help="arquivo .csv ou .parquet com as fórmulas")
+    parser.add_argument("--coluna", default="formula", help="coluna com as fórmulas")
+    parser.add_argument("--bloco", type=int, default=100_000, help="moléculas por bloco")
+    parser.add_argument("--mascaras", help="grava a máscara de cada molécula (uint64) neste arquivo")
+    args = parser.parse_args(argv)
+    if args.mascaras and pesos_bits is None:
+        parser.error(f"--mascaras usa uint64 e só funciona com até {MAXIMO_METODOS_MASCARA} métodos ({len(metodos)} carregados)")
+
+    if args.entrada.lower().endswith(".parquet"):
+        formulas = formulas_parquet(args.entrada, args.coluna, args.bloco)
+    else:
+        formulas = formulas_csv(args.entrada, args.coluna)
+
+    estatisticas = EstatisticasCobertura()
+    saida = open(args.mascaras, "wb") if args.mascaras else None
+    try:
+        for resultado in blocos_de_formulas(formulas, args.bloco):
+            estatisticas.atualizar(resultado)
+            if saida:
+                resultado.mascaras.astype("<u8").tofile(saida)
+    finally:
+        if saida:
+            saida.close()
+
+    json.dump({"ordem_metodos": metodos, **estatisticas.como_dict()}, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Sugestões de método e keywords mais baratos para decks de entrada do MOPAC.
+
+Cada deck é avaliado pelo número de átomos, pelos elementos (contra methods_data) e
+pelas keywords. As regras ficam em conselhos_keywords.json e, como no validador,
+cada uma cita o trecho da descrição da keyword que a justifica; ao carregar, os
+trechos são conferidos contra keywords.json. As regras são aplicadas em ordem
+sobre a linha de keywords sugerida, e uma sugestão que faria o validador acusar
+um problema novo é descartada.
+
+Uso:
+    python conselheiro.py PASTA_OU_DECKS... [-o conselhos.jsonl] [-j PROCESSOS] [--todos]
+
+Cada deck com conselhos gera uma linha JSON com as keywords originais, as
+sugeridas e os conselhos com a fonte citada.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from multiprocessing import freeze_support
+
+from lotes import mapear_em_lotes
+from nucleo import descricao_keyword, methods_data, methods_supporting
+from validador_keywords import analisar_linha, numero, validar_em_cache
+from verificador_decks import ATOMOS_IGNORADOS, detectar_metodo, ler_mop, ler_xyz, simbolo_do_atomo
+from varredura import listar_geometrias
+
+CONSELHOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conselhos_keywords.json")
+
+
+def carregar_conselhos(caminho=CONSELHOS):
+    """Lê as regras e confere se cada trecho citado está mesmo na descrição da keyword"""
+    with open(caminho, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    for conselho in dados["conselhos"]:
+        if conselho["trecho"] not in descricao_keyword(conselho["fonte"], ""):
+            raise ValueError(f"conselho {conselho['id']}: trecho não encontrado na descrição de {conselho['fonte']}")
+    return dados["conselhos"], frozenset(dados["elementos_organicos"])
+
+
+conselhos, organicos = carregar_conselhos()
+
+
+def ler_deck_com_atomos(caminho):
+    """Devolve (keywords, símbolos, número de átomos) de um .mop ou .xyz"""
+    geometria = []
+    leitor = ler_xyz if caminho.lower().endswith(".xyz") else ler_mop
+    with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+        palavras, simbolos = leitor(arquivo, geometria)
+    atomos = sum(1 for linha in geometria if linha.strip())
+    if simbolos & ATOMOS_IGNORADOS:
+        # Só decks com átomos fictícios precisam olhar o símbolo de cada linha de novo
+        atomos -= sum(1 for linha in geometria if simbolo_do_atomo(linha) in ATOMOS_IGNORADOS)
+    return palavras, simbolos - ATOMOS_IGNORADOS, atomos
+
+
+def aplica(conselho, por_nome, simbolos, atomos):
+    """Se as condições do conselho valem para o deck"""
+    if atomos < conselho.get("atomos_min", 0) or atomos > conselho.get("atomos_max", atomos):
+        return False
+    if conselho.get("somente_organicos") and not simbolos <= organicos:
+        return False
+    if any(nome not in por_nome for nome in conselho.get("presentes", ())):
+        return False
+    if any(nome in por_nome for nome in conselho.get("ausentes", ())):
+        return False
+    if "algum" in conselho and not any(nome in por_nome for nome in conselho["algum"]):
+        return False
+    for nome, limite in conselho.get("abaixo", {}).items():
+        keyword = por_nome.get(nome)
+        valor = numero(keyword.valor) if keyword else None
+        if keyword is not None and (valor is None or valor >= limite):
+            return False
+    return True
+
+
+def conselho_de_metodo(metodo, simbolos):
+    """Métodos que cobrem todos os elementos, quando o do deck não cobre"""
+    if metodo not in methods_data:
+        return None
+    suportados = methods_supporting(simbolos)
+    if metodo in suportados:
+        return None
+    return {
+        "id": "metodo",
+        "mensagem": f"{metodo} não tem parâmetros para todos os elementos do deck; "
+                    + (f"use {', '.join(suportados)}." if suportados else "nenhum método cobre todos."),
+        "alternativas": suportados,
+        "fonte": "methods_data",
+    }
+
+
+def aconselhar(palavras, simbolos, atomos):
+    """Devolve (keywords sugeridas, conselhos) para as keywords de um deck"""
+    linha = " ".join(palavras)
+    lidas = analisar_linha(linha)
+    metodo = detectar_metodo(palavras)
+    resultado = []
+
+    cobertura = conselho_de_metodo(metodo, simbolos)
+    if cobertura:
+        resultado.append(cobertura)
+        if cobertura["alternativas"]:
+            novo = cobertura["alternativas"][0]
+            lidas = [keyword for keyword in lidas if detectar_metodo([keyword.nome], None) != metodo]
+            lidas = analisar_linha(novo) + lidas
+
+    problemas = {p["mensagem"] for p in validar_em_cache(" ".join(k.texto for k in lidas))}
+    for conselho in conselhos:
+        por_nome = {keyword.nome: keyword for keyword in lidas}
+        if not aplica(conselho, por_nome, simbolos, atomos):
+            continue
+        remover = set(conselho.get("remover", ()))
+        candidata = [k for k in lidas if k.nome not in remover]
+        candidata += [k for k in analisar_linha(" ".join(conselho.get("adicionar", ())))
+                      if k.nome not in {existente.nome for existente in candidata}]
+        novos = {p["mensagem"] for p in validar_em_cache(" ".join(k.texto for k in candidata))}
+        if novos - problemas:
+            continue  # A sugestão criaria um conflito com o que já está no deck
+        lidas, problemas = candidata, novos
+        resultado.append({
+            "id": conselho["id"],
+            "mensagem": conselho["mensagem"],
+            "adicionar": conselho.get("adicionar", []),
+            "remover": sorted(remover & por_nome.keys()),
+            "fonte": conselho["fonte"],
+            "trecho": conselho["trecho"],
+        })
+    return " ".join(keyword.texto for keyword in lidas), resultado
+
+
+def aconselhar_deck(caminho):
+    try:
+        palavras, simbolos, atomos = ler_deck_com_atomos(caminho)
+    except (OSError, ValueError) as erro:
+        return {"arquivo": caminho, "erro": str(erro)}
+    sugeridas, resultado = aconselhar(palavras, simbolos, atomos)
+    return {
+        "arquivo": caminho,
+        "metodo": detectar_metodo(palavras),
+        "atomos": atomos,
+        "elementos": sorted(simbolos),
+        "keywords": " ".join(palavras),
+        "sugeridas": sugeridas,
+        "conselhos": resultado,
+    }
+
+
+def aconselhar_lote(caminhos):
+    """Avalia uma lista de decks — unidade de trabalho do pool"""
+    return [aconselhar_deck(caminho) for caminho in caminhos]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sugere métodos e keywords mais baratos para decks do MOPAC.")
+    parser.add_argument("entradas", nargs="+", help="arquivos .mop/.xyz ou pastas com eles")
+    parser.add_argument("-o", "--saida", help="arquivo JSON lines de saída (padrão: stdout)")
+    parser.add_argument("-j", "--processos", type=int, default=None, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument("--lote", type=int, default=64, help="decks por unidade de trabalho")
+    parser.add_argument("--todos", action="store_true", help="escreve também os decks sem conselhos")
+    args = parser.parse_args(argv)
+
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    total = erros = 0
+    por_conselho = Counter()
+    try:
+        for resultado in mapear_em_lotes(aconselhar_lote, listar_geometrias(args.entradas), args.processos, args.lote):
+            total += 1
+            if "erro" in resultado:
+                erros += 1
+            elif not resultado["conselhos"] and not args.todos:
+                continue
+            else:
+                por_conselho.update(conselho["id"] for conselho in resultado["conselhos"])
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    resumo = ", ".join(f"{nome}: {quantidade}" for nome, quantidade in por_conselho.most_common()) or "nenhum conselho"
+    print(f"{total} decks avaliados, {erros} com erro; {resumo}.", file=sys.stderr)
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import os
+import tkinter as tk
+from collections import OrderedDict
+
+# Quantas telas fechadas (escondidas) ficam guardadas antes de a mais antiga ser destruída
+LIMITE_OCULTAS = int(os.environ.get("JANELAS_OCULTAS_MAX", "4"))
+
+
+class GerenciadorJanelas:
+    """Mantém as telas em cache: fechar uma tela só a esconde, e abri-la de novo reaproveita a mesma instância"""
+
+    def __init__(self, limite_ocultas=LIMITE_OCULTAS):
+        self.janelas = {}              # chave -> janela viva
+        self.ocultas = OrderedDict()   # chaves escondidas, da mais antiga para a mais recente
+        self.limite_ocultas = limite_ocultas
+
+    def abrir(self, chave, fabrica):
+        """Mostra a tela `chave`, criando-a com `fabrica()` só se ainda não existir"""
+        janela = self.janelas.get(chave)
+        if janela is not None and not self.existe(janela):
+            self.esquecer(chave)
+            janela = None
+
+        if janela is None:
+            janela = fabrica()
+            janela.protocol("WM_DELETE_WINDOW", lambda: self.esconder(chave))
+            self.janelas[chave] = janela
+        else:
+            self.ocultas.pop(chave, None)
+            janela.deiconify()
+
+        janela.lift()
+        janela.focus_force()
+        return janela
+
+    def esconder(self, chave):
+        """Esconde a tela mantendo o estado, e descarta as ocultas que passarem do limite"""
+        janela = self.janelas.get(chave)
+        if janela is None:
+            return
+        janela.withdraw()
+        self.ocultas[chave] = None
+        self.ocultas.move_to_end(chave)
+        while len(self.ocultas) > self.limite_ocultas:
+            antiga, _ = self.ocultas.popitem(last=False)
+            self.destruir(antiga)
+
+    def destruir(self, chave):
+        """Destrói a tela de fato, liberando seus widgets"""
+        janela = self.janelas.get(chave)
+        self.esquecer(chave)
+        if janela is not None and self.existe(janela):
+            janela.destroy()
+
+    def esquecer(self, chave):
+        self.janelas.pop(chave, None)
+        self.ocultas.pop(chave, None)
+
+    @staticmethod
+    def existe(janela):
+        try:
+            return bool(janela.winfo_exists())
+        except tk.TclError:  # O interpretador da janela já foi destruído
+            return False
@@ -0,0 +1,103 @@
+"""Importação tardia dos módulos das telas, para a página inicial aparecer primeiro.
+
+A página inicial não importa as telas (nem, por tabela, as tabelas de dados do
+nucleo). Depois que a primeira janela é desenhada, `preaquecer` importa esses
+módulos numa thread em segundo plano e depois monta, na mesma thread, as estruturas
+caras que as telas montariam no primeiro uso (como o índice do corretor de
+keywords); se o usuário clicar antes disso, `importar` faz a importação na hora.
+O tempo de cada importação fica em `tempos`.
+
+Relatório de importação por módulo (cada um num interpretador novo, com -X importtime):
+    python importacao_tardia.py [MÓDULO ...]
+"""
+import importlib
+import sys
+import threading
+import time
+
+from instrumentacao import ATIVA, registrar
+
+MODULOS_DAS_TELAS = ("keywords", "elementosbotoes", "monitor")
+AQUECIMENTOS = (("sugestoes_keywords", "corretor_padrao"),)  # (módulo, função) chamadas depois das importações
+
+tempos = {}  # módulo -> (segundos, nome da thread que importou)
+_trava = threading.Lock()
+
+
+def importar(nome):
+    """Importa o módulo (ou devolve o já importado), registrando quanto tempo levou
+
+    Sempre passa por import_module: se outra thread ainda está importando o módulo,
+    ele espera a importação terminar em vez de devolver o módulo pela metade.
+    """
+    ja_carregado = nome in sys.modules
+    inicio = time.perf_counter()
+    modulo = importlib.import_module(nome)
+    if ja_carregado:
+        return modulo
+    duracao = time.perf_counter() - inicio
+    with _trava:
+        tempos.setdefault(nome, (duracao, threading.current_thread().name))
+    if ATIVA:
+        registrar(f"importacao.{nome}", duracao)
+    return modulo
+
+
+def preaquecer(nomes=MODULOS_DAS_TELAS, aquecimentos=AQUECIMENTOS):
+    """Importa os módulos e chama os aquecimentos numa thread daemon; erros ficam para o uso de verdade mostrar"""
+    def importar_todos():
+        for nome in nomes:
+            try:
+                importar(nome)
+            except Exception:
+                pass
+        for nome, funcao in aquecimentos:
+            try:
+                inicio = time.perf_counter()
+                getattr(importar(nome), funcao)()
+                if ATIVA:
+                    registrar(f"aquecimento.{nome}.{funcao}", time.perf_counter() - inicio)
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=importar_todos, name="preaquecimento", daemon=True)
+    thread.start()
+    return thread
+
+
+def perfil_importacao(modulo):
+    """Linhas de -X importtime para `modulo`: (tempo próprio em ms, acumulado em ms, nome), da mais cara para a mais barata"""
+    import subprocess  # Só para o relatório; fica fora da inicialização do app
+
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                           capture_output=True, text=True)
+    if saida.returncode:
+        raise ImportError(saida.stderr.strip().splitlines()[-1] if saida.stderr.strip() else modulo)
+    linhas = []
+    for linha in saida.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        linhas.append((int(proprio) / 1000, int(acumulado) / 1000, nome.strip()))
+    return sorted(linhas, key=lambda linha: linha[1], reverse=True)
+
+
+def main(argv=None):
+    modulos = (argv if argv is not None else sys.argv[1:]) or ("pagina_inicial",) + MODULOS_DAS_TELAS + ("nucleo",)
+    for modulo in modulos:
+        try:
+            linhas = perfil_importacao(modulo)
+        except ImportError as erro:
+            print(f"{modulo}: falhou ({erro})\n")
+            continue
+        total = next((acumulado for _, acumulado, nome in linhas if nome == modulo), 0.0)
+        print(f"{modulo}: {total:.1f} ms")
+        print(f"    {'próprio':>10} {'acumulado':>10}  módulo")
+        for proprio, acumulado, nome in linhas[:15]:
+            print(f"    {proprio:>8.2f}ms {acumulado:>8.2f}ms  {nome}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Medição opcional da latência dos eventos da interface.
+
+Desligada por padrão. Para ligar, defina a variável de ambiente INSTRUMENTACAO_UI
+com o arquivo do relatório (ou "1" para usar instrumentacao_ui.json na pasta atual):
+
+    INSTRUMENTACAO_UI=latencias.json python pagina_inicial.py
+
+Cada função decorada com @medir tem a duração de cada chamada guardada num buffer
+circular de tamanho fixo; um "batimento" agendado com after() mede quanto o laço
+de eventos do Tk atrasa (travamentos). Ao sair, os percentis vão para o arquivo.
+Desligada, @medir devolve a própria função e nada mais é feito.
+"""
+import atexit
+import functools
+import os
+import time
+from array import array
+
+ARQUIVO = os.environ.get("INSTRUMENTACAO_UI", "")
+ATIVA = bool(ARQUIVO) and ARQUIVO != "0"
+if ARQUIVO == "1":
+    ARQUIVO = "instrumentacao_ui.json"
+
+AMOSTRAS = int(os.environ.get("INSTRUMENTACAO_UI_AMOSTRAS", "4096"))
+
+
+class BufferCircular:
+    """Últimas `tamanho` medidas (em segundos), sem alocar nada depois de criado"""
+
+    def __init__(self, tamanho=AMOSTRAS):
+        self.valores = array("d", bytes(8 * tamanho))
+        self.proximo = 0
+        self.total = 0
+
+    def registrar(self, valor):
+        self.valores[self.proximo] = valor
+        self.proximo = (self.proximo + 1) % len(self.valores)
+        self.total += 1
+
+    def amostras(self):
+        return self.valores[:min(self.total, len(self.valores))]
+
+
+registros = {}  # nome -> BufferCircular
+
+
+def registrar(nome, duracao):
+    buffer = registros.get(nome)
+    if buffer is None:
+        buffer = registros[nome] = BufferCircular()
+    buffer.registrar(duracao)
+
+
+def cronometrada(funcao, nome):
+    @functools.wraps(funcao)
+    def medida(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            registrar(nome, time.perf_counter() - inicio)
+
+    return medida
+
+
+def medir(funcao):
+    """Decorador: mede cada chamada de `funcao` (com o nome qualificado, como ElementosApp.create_buttons)"""
+    if not ATIVA:
+        return funcao
+    return cronometrada(funcao, funcao.__qualname__)
+
+
+def instrumentar(classe, metodo):
+    """Mede um método de uma classe definida fora daqui (por exemplo, BaseApp.__init__)"""
+    original = getattr(classe, metodo)
+    if ATIVA and not hasattr(original, "__wrapped__"):
+        setattr(classe, metodo, cronometrada(original, f"{classe.__name__}.{metodo}"))
+
+
+def monitorar_laco(janela, intervalo_ms=50, limite_ms=200):
+    """Agenda um batimento a cada `intervalo_ms`; o atraso além do intervalo é tempo em que o laço ficou preso"""
+    if not ATIVA:
+        return
+    esperado = intervalo_ms / 1000
+
+    def batimento(anterior):
+        agora = time.perf_counter()
+        atraso = agora - anterior - esperado
+        registrar("laco_eventos.atraso", max(0.0, atraso))
+        if atraso * 1000 >= limite_ms:
+            registrar("laco_eventos.travamento", atraso)
+        janela.after(intervalo_ms, batimento, agora)
+
+    janela.after(intervalo_ms, batimento, time.perf_counter())
+
+
+def percentil(ordenadas, p):
+    return ordenadas[min(len(ordenadas) - 1, int(p * len(ordenadas)))] * 1000 if ordenadas else 0.0
+
+
+def resumo():
+    """Percentis (ms) de cada medida: chamadas totais e as estatísticas das amostras guardadas"""
+    resultado = {}
+    for nome, buffer in sorted(registros.items()):
+        ordenadas = sorted(buffer.amostras())
+        resultado[nome] = {
+            "chamadas": buffer.total,
+            "amostras": len(ordenadas),
+            "p50_ms": percentil(ordenadas, 0.50),
+            "p90_ms": percentil(ordenadas, 0.90),
+            "p99_ms": percentil(ordenadas, 0.99),
+            "max_ms": ordenadas[-1] * 1000 if ordenadas else 0.0,
+            "media_ms": sum(ordenadas) / len(ordenadas) * 1000 if ordenadas else 0.0,
+        }
+    return resultado
+
+
+def gravar_resumo(caminho=None):
+    import json
+
+    with open(caminho or ARQUIVO, "w", encoding="utf-8") as arquivo:
+        json.dump(resumo(), arquivo, indent=2)
+
+
+if ATIVA:
+    atexit.register(gravar_resumo)
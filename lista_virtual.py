@@ -0,0 +1,80 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class ListaVirtual(ttk.Frame):
+    """Lista rolável de botões que só cria widgets para as linhas visíveis.
+
+    Ao rolar, os mesmos botões são reaproveitados com outro texto, então o custo
+    de abrir a lista não depende da quantidade de itens.
+    """
+
+    def __init__(self, master, itens=(), comando=None, linhas=12, altura_linha=38, largura=20, **kwargs):
+        super().__init__(master, **kwargs)
+        self.itens = list(itens)
+        self.comando = comando
+        self.altura_linha = altura_linha
+        self.largura = largura
+        self.topo = 0      # Índice do primeiro item visível
+        self.botoes = []   # Botões reaproveitados, um por linha visível
+
+        self.area = tk.Frame(self, height=linhas * altura_linha, width=largura * 10)
+        self.barra = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        self.area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.area.bind("<Configure>", lambda event: self.redesenhar())
+        self.ligar_roda(self.area)
+
+    def ligar_roda(self, widget):
+        widget.bind("<MouseWheel>", lambda event: self.yview("scroll", -1 if event.delta > 0 else 1, "units"))
+        widget.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+
+    def visiveis(self):
+        return max(1, self.area.winfo_height() // self.altura_linha)
+
+    def definir_itens(self, itens):
+        """Troca os itens exibidos (por exemplo, o resultado de uma busca) e volta ao topo"""
+        self.itens = list(itens)
+        self.topo = 0
+        self.redesenhar()
+
+    def yview(self, *args):
+        """Protocolo de rolagem da Scrollbar: ("moveto", fração) ou ("scroll", n, "units"/"pages")"""
+        visiveis = self.visiveis()
+        if args[0] == "moveto":
+            self.topo = round(float(args[1]) * len(self.itens))
+        elif args[0] == "scroll":
+            passo = int(args[1]) * (visiveis if args[2] == "pages" else 1)
+            self.topo += passo
+        self.topo = max(0, min(self.topo, len(self.itens) - visiveis))
+        self.redesenhar()
+
+    def redesenhar(self):
+        """Posiciona os botões do pool sobre as linhas visíveis"""
+        visiveis = self.visiveis()
+        while len(self.botoes) < visiveis:
+            linha = len(self.botoes)
+            btn = ttk.Button(self.area, width=self.largura, command=lambda l=linha: self.clicar(l))
+            self.ligar_roda(btn)
+            self.botoes.append(btn)
+
+        for linha, btn in enumerate(self.botoes):
+            indice = self.topo + linha
+            if linha < visiveis and indice < len(self.itens):
+                btn.config(text=self.itens[indice])
+                btn.place(x=0, y=linha * self.altura_linha, relwidth=1, height=self.altura_linha - 6)
+            else:
+                btn.place_forget()
+
+        total = len(self.itens)
+        if total:
+            self.barra.set(self.topo / total, min(1.0, (self.topo + visiveis) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def clicar(self, linha):
+        indice = self.topo + linha
+        if self.comando and indice < len(self.itens):
+            self.comando(self.itens[indice])
@@ -0,0 +1,41 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+
+def agrupar(itens, tamanho):
+    """Divide um iterável em listas de até `tamanho` itens, sem materializá-lo inteiro"""
+    iterador = iter(itens)
+    while True:
+        lote = list(islice(iterador, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+def mapear_em_lotes(funcao, itens, processos=None, tamanho_lote=64, pendentes_por_processo=4):
+    """Aplica `funcao` a lotes de `itens` em um pool de processos e devolve os resultados conforme ficam prontos.
+
+    `funcao` recebe uma lista e devolve uma lista. Só existem no máximo
+    `processos * pendentes_por_processo` lotes em voo, então a memória fica limitada
+    mesmo com milhões de itens. A ordem dos resultados não é garantida.
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos == 1:
+        for lote in agrupar(itens, tamanho_lote):
+            yield from funcao(lote)
+        return
+
+    limite = processos * pendentes_por_processo
+    with ProcessPoolExecutor(processos) as pool:
+        pendentes = set()
+        for lote in agrupar(itens, tamanho_lote):
+            if len(pendentes) >= limite:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    yield from futuro.result()
+            pendentes.add(pool.submit(funcao, lote))
+        while pendentes:
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield from futuro.result()
@@ -0,0 +1,156 @@
+from BaseApp import BaseApp
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from instrumentacao import medir
+from seguidor_saidas import MonitorJobs, sparkline
+from tarefas import ExecutorTarefas
+
+INTERVALO_MS = 1000          # Entre consultas com a janela visível
+INTERVALO_OCULTA_MS = 5000   # Com a janela escondida ou minimizada
+INTERVALO_ATRASADO_MS = 50   # Quando algum arquivo cresceu mais que o limite de leitura
+MAXIMO_ALERTAS = 200
+
+COLUNAS = (
+    ("ciclo", "Ciclo", 60),
+    ("heat", "ΔHf", 100),
+    ("melhor", "Melhor ΔHf", 100),
+    ("gnorm", "GNORM", 80),
+    ("linha_heat", "ΔHf (recente)", 200),
+    ("linha_gnorm", "GNORM (recente)", 200),
+    ("estado", "Estado", 140),
+)
+
+
+def ler_jobs(monitor):
+    """Roda fora da thread do Tk: lê os bytes novos e verifica se algum arquivo ficou para trás"""
+    alterados, alertas = monitor.atualizar()
+    return alterados, alertas, monitor.atrasados()
+
+
+class MonitorApp(BaseApp):
+    """Classe para acompanhar os jobs em execução numa pasta"""
+    @medir
+    def __init__(self):
+        super().__init__("Monitor de jobs", "1200x600")
+        self.monitor = None
+        self.agendado = None
+        self.tarefas = ExecutorTarefas(self)
+
+        barra = ttk.Frame(self, padding=10)
+        barra.pack(fill=tk.X)
+        self.pasta = tk.StringVar(self)
+        ttk.Entry(barra, textvariable=self.pasta, width=60).pack(side=tk.LEFT, expand=True, fill=tk.X)
+        ttk.Button(barra, text="Escolher...", command=self.escolher_pasta).pack(side=tk.LEFT, padx=5)
+        ttk.Button(barra, text="Seguir", command=self.seguir).pack(side=tk.LEFT)
+        self.resumo = ttk.Label(barra, text="", foreground="#6c757d")
+        self.resumo.pack(side=tk.LEFT, padx=10)
+
+        # Uma linha por saída; só as linhas dos arquivos que cresceram são atualizadas
+        frame = ttk.Frame(self, padding=(10, 0))
+        frame.pack(expand=True, fill=tk.BOTH)
+        self.tabela = ttk.Treeview(frame, columns=[nome for nome, _, _ in COLUNAS])
+        self.tabela.heading("#0", text="Job")
+        self.tabela.column("#0", width=220)
+        for nome, titulo, largura in COLUNAS:
+            self.tabela.heading(nome, text=titulo)
+            self.tabela.column(nome, width=largura, anchor=tk.E if largura <= 100 else tk.W)
+        self.tabela.tag_configure("alerta", background="#fff3cd")
+        self.tabela.tag_configure("terminado", foreground="#6c757d")
+        barra_rolagem = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tabela.yview)
+        self.tabela.configure(yscrollcommand=barra_rolagem.set)
+        self.tabela.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        barra_rolagem.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Alertas mais recentes em cima
+        self.alertas = tk.Listbox(self, height=6, foreground="#856404")
+        self.alertas.pack(fill=tk.X, padx=10, pady=10)
+
+    def escolher_pasta(self):
+        pasta = filedialog.askdirectory(parent=self)
+        if pasta:
+            self.pasta.set(pasta)
+            self.seguir()
+
+    def seguir(self):
+        """Começa a seguir a pasta do campo, descartando o que era seguido antes"""
+        pasta = self.pasta.get().strip()
+        if not pasta:
+            return
+        if self.agendado is not None:
+            self.after_cancel(self.agendado)
+            self.agendado = None
+        self.monitor = MonitorJobs(pasta)
+        self.tabela.delete(*self.tabela.get_children())
+        self.alertas.delete(0, tk.END)
+        self.atualizar()
+
+    def atualizar(self):
+        """Lê os arquivos numa thread; substituir=True descarta a leitura de uma pasta seguida antes"""
+        self.agendado = None
+        self.tarefas.enviar("monitor", ler_jobs, self.monitor, substituir=True,
+                            ao_concluir=self.mostrar_atualizacao, ao_falhar=self.mostrar_falha)
+
+    @medir
+    def mostrar_atualizacao(self, resultado):
+        alterados, alertas, atrasados = resultado
+        for caminho in alterados:
+            self.mostrar_job(caminho, self.monitor.estados[caminho])
+        for alerta in alertas:
+            self.alertas.insert(0, alerta)
+        if alertas:
+            self.alertas.delete(MAXIMO_ALERTAS, tk.END)
+            self.bell()
+
+        estados = self.monitor.estados.values()
+        terminados = sum(estado.hf_final is not None for estado in estados)
+        self.resumo.config(text=f"{len(estados)} jobs, {terminados} terminados")
+
+        self.agendar(atrasados)
+
+    def mostrar_falha(self, erro):
+        self.alertas.insert(0, f"Falha ao ler a pasta: {erro}")
+        self.agendar(False)
+
+    def agendar(self, atrasados):
+        if atrasados:
+            intervalo = INTERVALO_ATRASADO_MS
+        elif self.winfo_viewable():
+            intervalo = INTERVALO_MS
+        else:
+            intervalo = INTERVALO_OCULTA_MS
+        self.agendado = self.after(intervalo, self.atualizar)
+
+    def mostrar_job(self, caminho, estado):
+        if estado.hf_final is not None:
+            situacao, tags = f"terminado ({estado.hf_final:.4f})", ("terminado",)
+        elif estado.alertas:
+            situacao, tags = ", ".join(sorted(estado.alertas)), ("alerta",)
+        else:
+            situacao, tags = "rodando", ()
+        heat = estado.heats[-1] if estado.heats else None
+        gnorm = estado.gnorms[-1] if estado.gnorms else None
+        valores = (
+            estado.ciclo or "",
+            "" if heat is None else f"{heat:.4f}",
+            "" if not estado.heats else f"{estado.melhor_hf:.4f}",
+            "" if gnorm is None else f"{gnorm:.3f}",
+            sparkline(estado.heats),
+            sparkline(estado.gnorms),
+            situacao,
+        )
+        if self.tabela.exists(caminho):
+            self.tabela.item(caminho, values=valores, tags=tags)
+        else:
+            self.tabela.insert("", tk.END, iid=caminho, text=estado.nome, values=valores, tags=tags)
+
+    def destroy(self):
+        self.tarefas.encerrar()
+        if self.agendado is not None:
+            self.after_cancel(self.agendado)
+            self.agendado = None
+        super().destroy()
+
+if __name__ == "__main__":
+    app = MonitorApp()
+    app.mainloop()
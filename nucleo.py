@@ -0,0 +1,787 @@
+"""Núcleo sem interface gráfica: dados dos métodos, tabela periódica, keywords e consultas.
+
+Não importa tkinter, então pode ser usado por scripts e pipelines sem display.
+Também funciona como linha de comando, lendo uma consulta por linha do stdin
+(ou dos argumentos) e escrevendo uma linha JSON por resposta:
+
+    python -m nucleo elemento H Fe La
+    python -m nucleo metodos < moleculas.txt      (uma molécula por linha: "C H O")
+    python -m nucleo keyword < nomes.txt
+    python -m nucleo relacionadas FORCE           (keywords a até 2 referências)
+
+Métodos extras (variantes como PM6-D3H4 ou reparametrizações próprias) são lidos
+de arquivos JSON na pasta metodos/ (ao lado do executável, ou em METODOS_DIR),
+um por método, e podem ser alterados com o programa aberto:
+
+    {"name": "PM6-D3H4", "base": "PM6"}
+    {"name": "PM7-TS", "base": "PM7", "remove": ["Li"]}
+    {"name": "PM6-ORG", "symbols": ["H", "C", "N", "O", "P", "S", "F", "Cl", "Br", "I"]}
+    {"name": "MEU-PM6", "elements": [{"symbol": "H", "name": "Hydrogen", "atomic_number": 1}]}
+
+Um arquivo com o nome de um método embutido o substitui; apagar o arquivo restaura
+o original.
+"""
+import os
+import sys
+from collections import deque
+from functools import lru_cache
+
+from pacote_keywords import carregar_keywords
+
+
+# Dados dos métodos 
+methods_data = {
+    "MNDO": [
+      {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+        {"symbol": "Li", "name": "Lithium", "atomic_number": 3},
+        {"symbol": "Be", "name": "Beryllium", "atomic_number": 4},
+        {"symbol": "B", "name": "Boron", "atomic_number": 5},
+        {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+        {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+        {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+        {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+        {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+        {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+        {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+        {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+        {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+        {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+        {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+        {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+        {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+        {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+        {"symbol": "Ga", "name": "Gallium", "atomic_number": 31},
+        {"symbol": "Ge", "name": "Germanium", "atomic_number": 32},
+        {"symbol": "As", "name": "Arsenic", "atomic_number": 33},
+        {"symbol": "Se", "name": "Selenium", "atomic_number": 34},
+        {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+        {"symbol": "Rb", "name": "Rubidium", "atomic_number": 37},
+        {"symbol": "Sr", "name": "Strontium", "atomic_number": 38},
+        {"symbol": "In", "name": "Indium", "atomic_number": 49},
+        {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+        {"symbol": "Sb", "name": "Antimony", "atomic_number": 51},
+        {"symbol": "Te", "name": "Tellurium", "atomic_number": 52},
+        {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+        {"symbol": "Cs", "name": "Cesium", "atomic_number": 55},
+        {"symbol": "Ba", "name": "Barium", "atomic_number": 56},
+        {"symbol": "Hg", "name": "Mercury", "atomic_number": 80},
+        {"symbol": "Tl", "name": "Thallium", "atomic_number": 81},
+        {"symbol": "Pb", "name": "Lead", "atomic_number": 82},
+        {"symbol": "Bi", "name": "Bismuth", "atomic_number": 83}
+    ],
+    "AM1": [
+        {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+        {"symbol": "Li", "name": "Lithium", "atomic_number": 3},
+        {"symbol": "Be", "name": "Beryllium", "atomic_number": 4},
+        {"symbol": "B", "name": "Boron", "atomic_number": 5},
+        {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+        {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+        {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+        {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+        {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+        {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+        {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+        {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+        {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+        {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+        {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+        {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+        {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+        {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+        {"symbol": "Ga", "name": "Gallium", "atomic_number": 31},
+        {"symbol": "Ge", "name": "Germanium", "atomic_number": 32},
+        {"symbol": "As", "name": "Arsenic", "atomic_number": 33},
+        {"symbol": "Se", "name": "Selenium", "atomic_number": 34},
+        {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+        {"symbol": "Rb", "name": "Rubidium", "atomic_number": 37},
+        {"symbol": "Sr", "name": "Strontium", "atomic_number": 38},
+        {"symbol": "In", "name": "Indium", "atomic_number": 49},
+        {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+        {"symbol": "Sb", "name": "Antimony", "atomic_number": 51},
+        {"symbol": "Te", "name": "Tellurium", "atomic_number": 52},
+        {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+        {"symbol": "Cs", "name": "Cesium", "atomic_number": 55},
+        {"symbol": "Ba", "name": "Barium", "atomic_number": 56},
+        {"symbol": "Hg", "name": "Mercury", "atomic_number": 80},
+        {"symbol": "Tl", "name": "Thallium", "atomic_number": 81},
+        {"symbol": "Pb", "name": "Lead", "atomic_number": 82},
+        {"symbol": "Bi", "name": "Bismuth", "atomic_number": 83},
+        {"symbol": "La", "name": "Lanthanum", "atomic_number": 57},
+        {"symbol": "Ce", "name": "Cerium", "atomic_number": 58},
+        {"symbol": "Pr", "name": "Praseodymium", "atomic_number": 59},
+        {"symbol": "Nd", "name": "Neodymium", "atomic_number": 60},
+        {"symbol": "Pm", "name": "Promethium", "atomic_number": 61},
+        {"symbol": "Sm", "name": "Samarium", "atomic_number": 62},
+        {"symbol": "Eu", "name": "Europium", "atomic_number": 63},
+        {"symbol": "Gd", "name": "Gadolinium", "atomic_number": 64},
+        {"symbol": "Tb", "name": "Terbium", "atomic_number": 65},
+        {"symbol": "Dy", "name": "Dysprosium", "atomic_number": 66},
+        {"symbol": "Ho", "name": "Holmium", "atomic_number": 67},
+        {"symbol": "Er", "name": "Erbium", "atomic_number": 68},
+        {"symbol": "Tm", "name": "Thulium", "atomic_number": 69},
+        {"symbol": "Yb", "name": "Ytterbium", "atomic_number": 70},
+        {"symbol": "Lu", "name": "Lutetium", "atomic_number": 71}
+    ],
+    "PM3": [
+        {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+        {"symbol": "Li", "name": "Lithium", "atomic_number": 3},
+        {"symbol": "Be", "name": "Beryllium", "atomic_number": 4},
+        {"symbol": "B", "name": "Boron", "atomic_number": 5},
+        {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+        {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+        {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+        {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+        {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+        {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+        {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+        {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+        {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+        {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+        {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+        {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+        {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+        {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+        {"symbol": "Ga", "name": "Gallium", "atomic_number": 31},
+        {"symbol": "Ge", "name": "Germanium", "atomic_number": 32},
+        {"symbol": "As", "name": "Arsenic", "atomic_number": 33},
+        {"symbol": "Se", "name": "Selenium", "atomic_number": 34},
+        {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+        {"symbol": "Rb", "name": "Rubidium", "atomic_number": 37},
+        {"symbol": "Sr", "name": "Strontium", "atomic_number": 38},
+        {"symbol": "Y", "name": "Yttrium", "atomic_number": 39},
+        {"symbol": "Zr", "name": "Zirconium", "atomic_number": 40},
+        {"symbol": "Mo", "name": "Molybdenum", "atomic_number": 42},
+        {"symbol": "Pd", "name": "Palladium", "atomic_number": 46},
+        {"symbol": "In", "name": "Indium", "atomic_number": 49},
+        {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+        {"symbol": "Sb", "name": "Antimony", "atomic_number": 51},
+        {"symbol": "Te", "name": "Tellurium", "atomic_number": 52},
+        {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+        {"symbol": "Cs", "name": "Cesium", "atomic_number": 55},
+        {"symbol": "Ba", "name": "Barium", "atomic_number": 56},
+        {"symbol": "Hg", "name": "Mercury", "atomic_number": 80},
+        {"symbol": "Tl", "name": "Thallium", "atomic_number": 81},
+        {"symbol": "Pb", "name": "Lead", "atomic_number": 82},
+        {"symbol": "Bi", "name": "Bismuth", "atomic_number": 83},
+        {"symbol": "La", "name": "Lanthanum", "atomic_number": 57},
+        {"symbol": "Ce", "name": "Cerium", "atomic_number": 58},
+        {"symbol": "Pr", "name": "Praseodymium", "atomic_number": 59},
+        {"symbol": "Nd", "name": "Neodymium", "atomic_number": 60},
+        {"symbol": "Pm", "name": "Promethium", "atomic_number": 61},
+        {"symbol": "Sm", "name": "Samarium", "atomic_number": 62},
+        {"symbol": "Eu", "name": "Europium", "atomic_number": 63},
+        {"symbol": "Gd", "name": "Gadolinium", "atomic_number": 64},
+        {"symbol": "Tb", "name": "Terbium", "atomic_number": 65},
+        {"symbol": "Dy", "name": "Dysprosium", "atomic_number": 66},
+        {"symbol": "Ho", "name": "Holmium", "atomic_number": 67},
+        {"symbol": "Er", "name": "Erbium", "atomic_number": 68},
+        {"symbol": "Tm", "name": "Thulium", "atomic_number": 69},
+        {"symbol": "Yb", "name": "Ytterbium", "atomic_number": 70},
+        {"symbol": "Lu", "name": "Lutetium", "atomic_number": 71}
+        
+    ],
+    "RM1": [
+        {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+        {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+        {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+        {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+        {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+        {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+        {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+        {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+        {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+        {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+        {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+        {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+        {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+        {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+        {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+        {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+        {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+        {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+        {"symbol": "La", "name": "Lanthanum", "atomic_number": 57},
+        {"symbol": "Ce", "name": "Cerium", "atomic_number": 58},
+        {"symbol": "Pr", "name": "Praseodymium", "atomic_number": 59},
+        {"symbol": "Nd", "name": "Neodymium", "atomic_number": 60},
+        {"symbol": "Pm", "name": "Promethium", "atomic_number": 61},
+        {"symbol": "Sm", "name": "Samarium", "atomic_number": 62},
+        {"symbol": "Eu", "name": "Europium", "atomic_number": 63},
+        {"symbol": "Gd", "name": "Gadolinium", "atomic_number": 64},
+        {"symbol": "Tb", "name": "Terbium", "atomic_number": 65},
+        {"symbol": "Dy", "name": "Dysprosium", "atomic_number": 66},
+        {"symbol": "Ho", "name": "Holmium", "atomic_number": 67},
+        {"symbol": "Er", "name": "Erbium", "atomic_number": 68},
+        {"symbol": "Tm", "name": "Thulium", "atomic_number": 69},
+        {"symbol": "Yb", "name": "Ytterbium", "atomic_number": 70},
+        {"symbol": "Lu", "name": "Lutetium", "atomic_number": 71}
+    ],
+    "PM6": [
+        {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+       {"symbol": "Li", "name": "Lithium", "atomic_number": 3},
+       {"symbol": "Be", "name": "Beryllium", "atomic_number": 4},
+       {"symbol": "B", "name": "Boron", "atomic_number": 5},
+       {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+       {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+       {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+       {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+       {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+       {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+       {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+       {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+       {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+       {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+       {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+       {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+       {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+       {"symbol": "Sc", "name": "Scandium", "atomic_number": 21},
+       {"symbol": "Ti", "name": "Titanium", "atomic_number": 22},
+       {"symbol": "V", "name": "Vanadium", "atomic_number": 23},
+       {"symbol": "Cr", "name": "Chromium", "atomic_number": 24},
+       {"symbol": "Mn", "name": "Manganese", "atomic_number": 25},
+       {"symbol": "Fe", "name": "Iron", "atomic_number": 26},
+       {"symbol": "Co", "name": "Cobalt", "atomic_number": 27},
+       {"symbol": "Ni", "name": "Nickel", "atomic_number": 28},
+       {"symbol": "Cu", "name": "Copper", "atomic_number": 29},
+       {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+       {"symbol": "Ga", "name": "Gallium", "atomic_number": 31},
+       {"symbol": "Ge", "name": "Germanium", "atomic_number": 32},
+       {"symbol": "As", "name": "Arsenic", "atomic_number": 33},
+       {"symbol": "Se", "name": "Selenium", "atomic_number": 34},
+       {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+       {"symbol": "Zr", "name": "Zirconium", "atomic_number": 40},
+       {"symbol": "Nb", "name": "Niobium", "atomic_number": 41},
+       {"symbol": "Mo", "name": "Molybdenum", "atomic_number": 42},
+       {"symbol": "Ru", "name": "Ruthenium", "atomic_number": 44},
+       {"symbol": "Rh", "name": "Rhodium", "atomic_number": 45},
+       {"symbol": "Pd", "name": "Palladium", "atomic_number": 46},
+       {"symbol": "Ag", "name": "Silver", "atomic_number": 47},
+       {"symbol": "Cd", "name": "Cadmium", "atomic_number": 48},
+       {"symbol": "In", "name": "Indium", "atomic_number": 49},
+       {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+       {"symbol": "Sb", "name": "Antimony", "atomic_number": 51},
+       {"symbol": "Te", "name": "Tellurium", "atomic_number": 52},
+       {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+       {"symbol": "Hf", "name": "Hafnium", "atomic_number": 72},
+       {"symbol": "Ta", "name": "Tantalum", "atomic_number": 73},
+       {"symbol": "W", "name": "Tungsten", "atomic_number": 74},
+       {"symbol": "Re", "name": "Rhenium", "atomic_number": 75},
+       {"symbol": "Os", "name": "Osmium", "atomic_number": 76},
+       {"symbol": "Ir", "name": "Iridium", "atomic_number": 77},
+       {"symbol": "Pt", "name": "Platinum", "atomic_number": 78},
+       {"symbol": "Au", "name": "Gold", "atomic_number": 79},
+       {"symbol": "Hg", "name": "Mercury", "atomic_number": 80},
+       {"symbol": "Pb", "name": "Lead", "atomic_number": 82},
+       {"symbol": "Bi", "name": "Bismuth", "atomic_number": 83}
+    ],
+    "PM7": [
+        {"symbol": "H", "name": "Hydrogen", "atomic_number": 1},
+        {"symbol": "Li", "name": "Lithium", "atomic_number": 3},
+        {"symbol": "Be", "name": "Beryllium", "atomic_number": 4},
+        {"symbol": "B", "name": "Boron", "atomic_number": 5},
+        {"symbol": "C", "name": "Carbon", "atomic_number": 6},
+        {"symbol": "N", "name": "Nitrogen", "atomic_number": 7},
+        {"symbol": "O", "name": "Oxygen", "atomic_number": 8},
+        {"symbol": "F", "name": "Fluorine", "atomic_number": 9},
+        {"symbol": "Na", "name": "Sodium", "atomic_number": 11},
+        {"symbol": "Mg", "name": "Magnesium", "atomic_number": 12},
+        {"symbol": "Al", "name": "Aluminum", "atomic_number": 13},
+        {"symbol": "Si", "name": "Silicon", "atomic_number": 14},
+        {"symbol": "P", "name": "Phosphorus", "atomic_number": 15},
+        {"symbol": "S", "name": "Sulfur", "atomic_number": 16},
+        {"symbol": "Cl", "name": "Chlorine", "atomic_number": 17},
+        {"symbol": "K", "name": "Potassium", "atomic_number": 19},
+        {"symbol": "Ca", "name": "Calcium", "atomic_number": 20},
+        {"symbol": "Sc", "name": "Scandium", "atomic_number": 21},
+        {"symbol": "Ti", "name": "Titanium", "atomic_number": 22},
+        {"symbol": "V", "name": "Vanadium", "atomic_number": 23},
+        {"symbol": "Cr", "name": "Chromium", "atomic_number": 24},
+        {"symbol": "Mn", "name": "Manganese", "atomic_number": 25},
+        {"symbol": "Fe", "name": "Iron", "atomic_number": 26},
+        {"symbol": "Co", "name": "Cobalt", "atomic_number": 27},
+        {"symbol": "Ni", "name": "Nickel", "atomic_number": 28},
+        {"symbol": "Cu", "name": "Copper", "atomic_number": 29},
+        {"symbol": "Zn", "name": "Zinc", "atomic_number": 30},
+        {"symbol": "Ga", "name": "Gallium", "atomic_number": 31},
+        {"symbol": "Ge", "name": "Germanium", "atomic_number": 32},
+        {"symbol": "As", "name": "Arsenic", "atomic_number": 33},
+        {"symbol": "Se", "name": "Selenium", "atomic_number": 34},
+        {"symbol": "Br", "name": "Bromine", "atomic_number": 35},
+        {"symbol": "Y", "name": "Yttrium", "atomic_number": 39},
+        {"symbol": "Zr", "name": "Zirconium", "atomic_number": 40},
+        {"symbol": "Nb", "name": "Niobium", "atomic_number": 41},
+        {"symbol": "Mo", "name": "Molybdenum", "atomic_number": 42},
+        {"symbol": "Ru", "name": "Ruthenium", "atomic_number": 44},
+        {"symbol": "Rh", "name": "Rhodium", "atomic_number": 45},
+        {"symbol": "Pd", "name": "Palladium", "atomic_number": 46},
+        {"symbol": "Ag", "name": "Silver", "atomic_number": 47},
+        {"symbol": "Cd", "name": "Cadmium", "atomic_number": 48},
+        {"symbol": "In", "name": "Indium", "atomic_number": 49},
+        {"symbol": "Sn", "name": "Tin", "atomic_number": 50},
+        {"symbol": "Sb", "name": "Antimony", "atomic_number": 51},
+        {"symbol": "Te", "name": "Tellurium", "atomic_number": 52},
+        {"symbol": "I", "name": "Iodine", "atomic_number": 53},
+        {"symbol": "Hf", "name": "Hafnium", "atomic_number": 72},
+        {"symbol": "Ta", "name": "Tantalum", "atomic_number": 73},
+        {"symbol": "W", "name": "Tungsten", "atomic_number": 74},
+        {"symbol": "Re", "name": "Rhenium", "atomic_number": 75},
+        {"symbol": "Os", "name": "Osmium", "atomic_number": 76},
+        {"symbol": "Ir", "name": "Iridium", "atomic_number": 77},
+        {"symbol": "Pt", "name": "Platinum", "atomic_number": 78},
+        {"symbol": "Au", "name": "Gold", "atomic_number": 79},
+        {"symbol": "Hg", "name": "Mercury", "atomic_number": 80},
+        {"symbol": "Tl", "name": "Thallium", "atomic_number": 81},
+        {"symbol": "Pb", "name": "Lead", "atomic_number": 82},
+        {"symbol": "Bi", "name": "Bismuth", "atomic_number": 83}
+    ]
+}
+
+
+
+# Lista completa de elementos da tabela periódica com sua posição
+elements = [
+    {"symbol": "H", "row": 0, "col": 0, "color": "#ffcccc"},
+    {"symbol": "He", "row": 0, "col": 17, "color": "#ffcccc"},
+    {"symbol": "Li", "row": 1, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Be", "row": 1, "col": 1, "color": "#ffcc99"},
+    {"symbol": "B", "row": 1, "col": 12, "color": "#ccccff"},
+    {"symbol": "C", "row": 1, "col": 13, "color": "#ccccff"},
+    {"symbol": "N", "row": 1, "col": 14, "color": "#ccccff"},
+    {"symbol": "O", "row": 1, "col": 15, "color": "#ccccff"},
+    {"symbol": "F", "row": 1, "col": 16, "color": "#ccccff"},
+    {"symbol": "Ne", "row": 1, "col": 17, "color": "#ffcccc"},
+    {"symbol": "Na", "row": 2, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Mg", "row": 2, "col": 1, "color": "#ffcc99"},
+    {"symbol": "Al", "row": 2, "col": 12, "color": "#cccc99"},
+    {"symbol": "Si", "row": 2, "col": 13, "color": "#cccc99"},
+    {"symbol": "P", "row": 2, "col": 14, "color": "#cccc99"},
+    {"symbol": "S", "row": 2, "col": 15, "color": "#cccc99"},
+    {"symbol": "Cl", "row": 2, "col": 16, "color": "#cccc99"},
+    {"symbol": "Ar", "row": 2, "col": 17, "color": "#ffcccc"},
+    {"symbol": "K", "row": 3, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Ca", "row": 3, "col": 1, "color": "#ffcc99"},
+    {"symbol": "Sc", "row": 3, "col": 2, "color": "#ccccff"},
+    {"symbol": "Ti", "row": 3, "col": 3, "color": "#ccccff"},
+    {"symbol": "V", "row": 3, "col": 4, "color": "#ccccff"},
+    {"symbol": "Cr", "row": 3, "col": 5, "color": "#ccccff"},
+    {"symbol": "Mn", "row": 3, "col": 6, "color": "#ccccff"},
+    {"symbol": "Fe", "row": 3, "col": 7, "color": "#ccccff"},
+    {"symbol": "Co", "row": 3, "col": 8, "color": "#ccccff"},
+    {"symbol": "Ni", "row": 3, "col": 9, "color": "#ccccff"},
+    {"symbol": "Cu", "row": 3, "col": 10, "color": "#ccccff"},
+    {"symbol": "Zn", "row": 3, "col": 11, "color": "#ccccff"},
+    {"symbol": "Ga", "row": 3, "col": 12, "color": "#cccc99"},
+    {"symbol": "Ge", "row": 3, "col": 13, "color": "#cccc99"},
+    {"symbol": "As", "row": 3, "col": 14, "color": "#cccc99"},
+    {"symbol": "Se", "row": 3, "col": 15, "color": "#cccc99"},
+    {"symbol": "Br", "row": 3, "col": 16, "color": "#cccc99"},
+    {"symbol": "Kr", "row": 3, "col": 17, "color": "#ffcccc"},
+    {"symbol": "Rb", "row": 4, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Sr", "row": 4, "col": 1, "color": "#ffcc99"},
+    {"symbol": "Y", "row": 4, "col": 2, "color": "#ccccff"},
+    {"symbol": "Zr", "row": 4, "col": 3, "color": "#ccccff"},
+    {"symbol": "Nb", "row": 4, "col": 4, "color": "#ccccff"},
+    {"symbol": "Mo", "row": 4, "col": 5, "color": "#ccccff"},
+    {"symbol": "Tc", "row": 4, "col": 6, "color": "#ccccff"},
+    {"symbol": "Ru", "row": 4, "col": 7, "color": "#ccccff"},
+    {"symbol": "Rh", "row": 4, "col": 8, "color": "#ccccff"},
+    {"symbol": "Pd", "row": 4, "col": 9, "color": "#ccccff"},
+    {"symbol": "Ag", "row": 4, "col": 10, "color": "#ccccff"},
+    {"symbol": "Cd", "row": 4, "col": 11, "color": "#ccccff"},
+    {"symbol": "In", "row": 4, "col": 12, "color": "#cccc99"},
+    {"symbol": "Sn", "row": 4, "col": 13, "color": "#cccc99"},
+    {"symbol": "Sb", "row": 4, "col": 14, "color": "#cccc99"},
+    {"symbol": "Te", "row": 4, "col": 15, "color": "#cccc99"},
+    {"symbol": "I", "row": 4, "col": 16, "color": "#cccc99"},
+    {"symbol": "Xe", "row": 4, "col": 17, "color": "#ffcccc"},
+    {"symbol": "Cs", "row": 5, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Ba", "row": 5, "col": 1, "color": "#ffcc99"},
+    {"symbol": "La", "row": 6, "col": 2, "color": "#ffcc66"},
+    {"symbol": "Ce", "row": 6, "col": 3, "color": "#ffcc66"},
+    {"symbol": "Pr", "row": 6, "col": 4, "color": "#ffcc66"},
+    {"symbol": "Nd", "row": 6, "col": 5, "color": "#ffcc66"},
+    {"symbol": "Pm", "row": 6, "col": 6, "color": "#ffcc66"},
+    {"symbol": "Sm", "row": 6, "col": 7, "color": "#ffcc66"},
+    {"symbol": "Eu", "row": 6, "col": 8, "color": "#ffcc66"},
+    {"symbol": "Gd", "row": 6, "col": 9, "color": "#ffcc66"},
+    {"symbol": "Tb", "row": 6, "col": 10, "color": "#ffcc66"},
+    {"symbol": "Dy", "row": 6, "col": 11, "color": "#ffcc66"},
+    {"symbol": "Ho", "row": 6, "col": 12, "color": "#ffcc66"},
+    {"symbol": "Er", "row": 6, "col": 13, "color": "#ffcc66"},
+    {"symbol": "Tm", "row": 6, "col": 14, "color": "#ffcc66"},
+    {"symbol": "Yb", "row": 6, "col": 15, "color": "#ffcc66"},
+    {"symbol": "Lu", "row": 6, "col": 16, "color": "#ffcc66"},
+    {"symbol": "Hf", "row": 5, "col": 3, "color": "#ccccff"},
+    {"symbol": "Ta", "row": 5, "col": 4, "color": "#ccccff"},
+    {"symbol": "W", "row": 5, "col": 5, "color": "#ccccff"},
+    {"symbol": "Re", "row": 5, "col": 6, "color": "#ccccff"},
+    {"symbol": "Os", "row": 5, "col": 7, "color": "#ccccff"},
+    {"symbol": "Ir", "row": 5, "col": 8, "color": "#ccccff"},
+    {"symbol": "Pt", "row": 5, "col": 9, "color": "#ccccff"},
+    {"symbol": "Au", "row": 5, "col": 10, "color": "#ccccff"},
+    {"symbol": "Hg", "row": 5, "col": 11, "color": "#ccccff"},
+    {"symbol": "Tl", "row": 5, "col": 12, "color": "#cccc99"},
+    {"symbol": "Pb", "row": 5, "col": 13, "color": "#cccc99"},
+    {"symbol": "Bi", "row": 5, "col": 14, "color": "#cccc99"},
+    {"symbol": "Po", "row": 5, "col": 15, "color": "#cccc99"},
+    {"symbol": "At", "row": 5, "col": 16, "color": "#cccc99"},
+    {"symbol": "Rn", "row": 5, "col": 17, "color": "#ffcccc"},
+    {"symbol": "Fr", "row": 6, "col": 0, "color": "#ffcc99"},
+    {"symbol": "Ra", "row": 6, "col": 1, "color": "#ffcc99"},
+    {"symbol": "Ac", "row": 7, "col": 2, "color": "#ffcc66"},
+    {"symbol": "Th", "row": 7, "col": 3, "color": "#ffcc66"},
+    {"symbol": "Pa", "row": 7, "col": 4, "color": "#ffcc66"},
+    {"symbol": "U", "row": 7, "col": 5, "color": "#ffcc66"},
+    {"symbol": "Np", "row": 7, "col": 6, "color": "#ffcc66"},
+    {"symbol": "Pu", "row": 7, "col": 7, "color": "#ffcc66"},
+    {"symbol": "Am", "row": 7, "col": 8, "color": "#ffcc66"},
+    {"symbol": "Cm", "row": 7, "col": 9, "color": "#ffcc66"},
+]
+
+
+# Registro dos números atômicos: símbolo -> Z, na ordem da tabela periódica
+SYMBOLS_BY_Z = (
+    "H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne", "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar",
+    "K", "Ca", "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn", "Ga", "Ge", "As", "Se", "Br", "Kr",
+    "Rb", "Sr", "Y", "Zr", "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn", "Sb", "Te", "I", "Xe",
+    "Cs", "Ba", "La", "Ce", "Pr", "Nd", "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb", "Lu", "Hf",
+    "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg", "Tl", "Pb", "Bi", "Po", "At", "Rn", "Fr", "Ra", "Ac", "Th",
+    "Pa", "U", "Np", "Pu", "Am", "Cm",
+)
+atomic_numbers = {symbol: z for z, symbol in enumerate(SYMBOLS_BY_Z, 1)}
+
+
+# Índice invertido elemento -> métodos, construído uma única vez na importação.
+# Cada elemento da tabela ocupa um bit; cada método guarda a máscara dos elementos que suporta.
+element_bits = {element["symbol"]: 1 << i for i, element in enumerate(elements)}
+element_index = {}
+method_masks = {}
+
+def build_index():
+    """Monta o índice elemento -> métodos e as máscaras de bits de cada método"""
+    element_index.clear()
+    method_masks.clear()
+    for method, elems in methods_data.items():
+        mask = 0
+        for element in elems:
+            element_index.setdefault(element["symbol"], []).append((method, element))
+            mask |= element_bits.get(element["symbol"], 0)
+        method_masks[method] = mask
+    methods_for_mask.cache_clear()
+    coverage_colors.cache_clear()
+    for mask in method_masks.values():
+        coverage_colors(mask)  # Mapas de cor de cada método já prontos para a tabela periódica
+
+def set_method(method, entries):
+    """Troca (ou cria) um método, refazendo só as entradas dele no índice"""
+    old_symbols = {element["symbol"] for element in methods_data.get(method, ())}
+    methods_data[method] = entries
+    for symbol in old_symbols:
+        remaining = [pair for pair in element_index.get(symbol, ()) if pair[0] != method]
+        if remaining:
+            element_index[symbol] = remaining
+        else:
+            element_index.pop(symbol, None)
+    mask = 0
+    for element in entries:
+        element_index.setdefault(element["symbol"], []).append((method, element))
+        mask |= element_bits.get(element["symbol"], 0)
+    if old_symbols:
+        # Um método substituído continua na mesma posição da lista de cada elemento
+        order = {name: position for position, name in enumerate(methods_data)}
+        for element in entries:
+            element_index[element["symbol"]].sort(key=lambda pair: order[pair[0]])
+    method_masks[method] = mask
+    methods_for_mask.cache_clear()
+    coverage_colors(mask)
+
+def remove_method(method):
+    """Remove um método externo; um embutido volta aos dados originais"""
+    if method in builtin_methods:
+        set_method(method, builtin_methods[method])
+        return
+    for element in methods_data.pop(method, ()):
+        remaining = [pair for pair in element_index.get(element["symbol"], ()) if pair[0] != method]
+        if remaining:
+            element_index[element["symbol"]] = remaining
+        else:
+            element_index.pop(element["symbol"], None)
+    method_masks.pop(method, None)
+    methods_for_mask.cache_clear()
+
+def symbols_mask(symbols):
+    """Converte um conjunto de símbolos na máscara de bits (None se algum não estiver na tabela)"""
+    mask = 0
+    for symbol in symbols:
+        bit = element_bits.get(symbol)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+@lru_cache(maxsize=4096)
+def methods_for_mask(mask):
+    """Métodos cuja máscara contém todos os bits de `mask`"""
+    return tuple(method for method, method_mask in method_masks.items() if mask & method_mask == mask)
+
+def methods_supporting(symbols):
+    """Retorna os métodos que suportam todos os elementos (ex.: a composição de uma molécula)"""
+    mask = symbols_mask(symbols)
+    if mask is None:
+        return ()
+    return methods_for_mask(mask)
+
+# Cores da tabela periódica quando ela mostra a cobertura de um ou mais métodos
+COVERAGE_COLORS = ("#e9ecef", "#8fd18f")  # (não suportado, suportado)
+
+def combined_mask(methods, intersection=False):
+    """Máscara dos elementos suportados por algum dos métodos (ou por todos, com intersection)"""
+    masks = [method_masks[method] for method in methods]
+    if not masks:
+        return 0
+    mask = masks[0]
+    for other in masks[1:]:
+        mask = mask & other if intersection else mask | other
+    return mask
+
+@lru_cache(maxsize=256)
+def coverage_colors(mask):
+    """{símbolo: cor} com os elementos de `mask` em verde e os demais em cinza (compartilhado, não alterar)"""
+    unsupported, supported = COVERAGE_COLORS
+    return {symbol: supported if bit & mask else unsupported for symbol, bit in element_bits.items()}
+
+build_index()
+
+
+# Métodos externos: um JSON por método em metodos/, acompanhados por mtime e tamanho
+_base_dir = os.path.dirname(sys.executable if getattr(sys, "frozen", False) else os.path.abspath(__file__))
+METHODS_DIR = os.environ.get("METODOS_DIR") or os.path.join(_base_dir, "metodos")
+builtin_methods = {method: list(entries) for method, entries in methods_data.items()}
+known_elements = {element["symbol"]: element for entries in builtin_methods.values() for element in entries}
+method_listeners = []  # Funções chamadas com os nomes dos métodos alterados
+
+def element_entry(symbol, fields=None):
+    """Dados de um elemento num método externo: os embutidos, com os campos dados por cima"""
+    if symbol not in atomic_numbers:
+        raise ValueError(f"elemento desconhecido: {symbol}")
+    entry = known_elements.get(symbol) or {"symbol": symbol, "name": symbol, "atomic_number": atomic_numbers[symbol]}
+    if fields:
+        entry = {**entry, **fields, "symbol": symbol, "name": str(fields.get("name") or entry["name"]),
+                 "atomic_number": atomic_numbers[symbol]}
+    return entry
+
+def method_entries(definition, method=None):
+    """Lista de elementos de uma definição externa (elements, symbols ou base com add/remove)
+
+    Um método que usa a si mesmo como base parte sempre dos dados embutidos, para as
+    edições do arquivo não se acumularem a cada vez que ele é relido.
+    """
+    if "elements" in definition:
+        entries = []
+        for element in definition["elements"]:
+            if not isinstance(element, dict) or "symbol" not in element:
+                raise ValueError(f"elemento sem \"symbol\": {element!r}")
+            entries.append(element_entry(element["symbol"], element))
+        return entries
+    if "symbols" in definition:
+        symbols = list(definition["symbols"])
+    else:
+        base = definition.get("base")
+        source = builtin_methods if base == method else methods_data
+        if base not in source:
+            raise ValueError(f"método base desconhecido: {base}")
+        removed = set(definition.get("remove", ()))
+        symbols = [element["symbol"] for element in source[base] if element["symbol"] not in removed]
+        symbols += [symbol for symbol in definition.get("add", ()) if symbol not in symbols]
+    return [element_entry(symbol) for symbol in symbols]
+
+class MethodWatcher:
+    """Acompanha a pasta de métodos externos; `check` aplica só os arquivos novos, alterados ou apagados"""
+
+    def __init__(self, directory=METHODS_DIR):
+        self.directory = directory
+        self.files = {}    # caminho -> (mtime_ns, tamanho, método)
+        self.bases = {}    # método -> método base, para reaplicar os derivados quando a base muda
+        self.errors = {}   # caminho -> mensagem do último erro de leitura
+
+    def load(self, path):
+        import json
+
+        with open(path, encoding="utf-8") as file:
+            definition = json.load(file)
+        if not isinstance(definition, dict):
+            raise ValueError("a definição do método precisa ser um objeto JSON")
+        method = str(definition.get("name") or os.path.splitext(os.path.basename(path))[0]).upper()
+        return method, definition
+
+    def apply(self, path, signature):
+        """Lê e aplica um arquivo; devolve os métodos alterados (uma falha fica em errors até o arquivo mudar)"""
+        known = self.files.get(path)
+        try:
+            method, definition = self.load(path)
+            entries = method_entries(definition, method)
+        except Exception as error:  # Um arquivo com problema não pode derrubar a importação do nucleo
+            self.errors[path] = str(error)
+            self.files[path] = (*signature, known[2] if known else None)
+            return []
+        self.errors.pop(path, None)
+        changed = []
+        if known is not None and known[2] not in (None, method):
+            remove_method(known[2])  # O arquivo passou a definir outro método
+            changed.append(known[2])
+        self.files[path] = (*signature, method)
+        self.bases[method] = definition.get("base")
+        set_method(method, entries)
+        changed.append(method)
+        return changed
+
+    def check(self):
+        """Relê o que mudou desde a última verificação; devolve os métodos alterados"""
+        current = {}
+        if os.path.isdir(self.directory):
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(".json") and entry.is_file():
+                        info = entry.stat()
+                        current[entry.path] = (info.st_mtime_ns, info.st_size)
+
+        changed = []
+        for path in set(self.files) - set(current):
+            method = self.files.pop(path)[2]
+            self.errors.pop(path, None)
+            if method is not None:
+                self.bases.pop(method, None)
+                remove_method(method)
+                changed.append(method)
+        for path, signature in current.items():
+            known = self.files.get(path)
+            if known is None or known[:2] != signature:
+                changed += self.apply(path, signature)
+
+        pending = list(changed)
+        while pending:
+            # Variantes definidas por "base" acompanham a base quando ela muda
+            while pending:
+                base = pending.pop()
+                for path, (mtime, size, method) in self.files.items():
+                    if self.bases.get(method) == base and method not in changed:
+                        try:
+                            set_method(method, method_entries(self.load(path)[1], method))
+                        except Exception as error:
+                            self.errors[path] = str(error)
+                            continue
+                        changed.append(method)
+                        pending.append(method)
+            # Um arquivo que falhou pode usar como base um método que só agora foi carregado
+            for path in list(self.errors):
+                if path in self.files:
+                    retried = self.apply(path, self.files[path][:2])
+                    changed += retried
+                    pending += retried
+
+        changed = list(dict.fromkeys(changed))
+        if changed:
+            for listener in list(method_listeners):
+                listener(changed)
+        return changed
+
+method_watcher = MethodWatcher()
+method_watcher.check()
+
+
+# Keywords e descrições completas, lidas sob demanda do pacote gerado a partir de keywords.json
+keywords = carregar_keywords()
+
+
+def element_methods(symbol):
+    """Lista os métodos que contêm o elemento, com os dados do elemento em cada um"""
+    return [{"method": method, **element} for method, element in element_index.get(symbol, ())]
+
+def element_info_text(symbol):
+    """Texto exibido pela tabela periódica para o elemento"""
+    entries = element_index.get(symbol)
+    if not entries:
+        return f"{symbol} não pertence a nenhum método."
+    method_info = []
+    for method, element in entries:
+        element_details = f"{element['symbol']} ({element['name']}, Atômico: {element['atomic_number']})"
+        method_info.append(f"{method}: {element_details}")
+    return "\n".join(method_info)
+
+def descricao_keyword(keyword, padrao=None):
+    """Descrição completa da keyword (lida do pacote na primeira consulta)"""
+    return keywords.get(keyword, padrao)
+
+def referencias_keyword(keyword):
+    """Menções a outras keywords na descrição: lista de (keyword, início, fim)"""
+    if keyword not in keywords:
+        return []
+    return keywords.referencias(keyword)
+
+
+# Grafo não dirigido de referências (A cita B ou B cita A), montado na primeira consulta
+_vizinhas = None
+
+def grafo_keywords():
+    global _vizinhas
+    if _vizinhas is None:
+        vizinhas = {nome: set() for nome in keywords}
+        for nome in keywords:
+            for citada in keywords.citadas(nome):
+                vizinhas[nome].add(citada)
+                vizinhas[citada].add(nome)
+        _vizinhas = vizinhas
+    return _vizinhas
+
+def keywords_relacionadas(keyword, saltos=2):
+    """Keywords a até `saltos` referências de distância, como lista de (keyword, distância)"""
+    vizinhas = grafo_keywords()
+    if keyword not in vizinhas:
+        return []
+    distancias = {keyword: 0}
+    fila = deque([keyword])
+    while fila:
+        atual = fila.popleft()
+        if distancias[atual] == saltos:
+            continue
+        for vizinha in sorted(vizinhas[atual]):
+            if vizinha not in distancias:
+                distancias[vizinha] = distancias[atual] + 1
+                fila.append(vizinha)
+    del distancias[keyword]
+    return list(distancias.items())
+
+
+def consultar(comando, consulta):
+    """Responde uma consulta da linha de comando como dicionário"""
+    if comando == "elemento":
+        return {"symbol": consulta, "methods": element_methods(consulta)}
+    if comando == "metodos":
+        symbols = sorted(set(consulta.replace(",", " ").split()))
+        return {"symbols": symbols, "methods": list(methods_supporting(symbols))}
+    if comando == "relacionadas":
+        return {"keyword": consulta, "related": [{"keyword": nome, "hops": saltos}
+                                                 for nome, saltos in keywords_relacionadas(consulta)]}
+    return {"keyword": consulta, "description": descricao_keyword(consulta)}
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog="python -m nucleo", description="Consultas em lote sobre métodos, elementos e keywords.")
+    parser.add_argument("comando", choices=("elemento", "metodos", "keyword", "relacionadas"),
+                        help="elemento: métodos de cada símbolo; metodos: métodos que cobrem todos os símbolos da linha; "
+                             "keyword: descrição; relacionadas: keywords a até 2 referências")
+    parser.add_argument("consultas", nargs="*", help="consultas (sem nenhuma, lê uma por linha do stdin)")
+    args = parser.parse_args(argv)
+
+    entradas = args.consultas or (linha.strip() for linha in sys.stdin)
+    escrever = sys.stdout.write
+    for consulta in entradas:
+        if consulta:
+            escrever(json.dumps(consultar(args.comando, consulta), ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Armazenamento empacotado das descrições das keywords.
+
+O texto-fonte fica em keywords.json. Ele é convertido para keywords.pack, que tem:
+
+    cabeçalho    "KWPK", versão (u16), quantidade (u32), tamanho dos nomes (u32),
+                 total de referências (u32)
+    tabela       quantidade x (offset u32, tamanho u32, primeira referência u32,
+                 referências u32); offsets relativos ao início do blob
+    referências  total x (keyword citada u32, início u32, fim u32)
+    nomes        nomes das keywords em UTF-8, separados por "\\n"
+    blob         descrições em UTF-8, concatenadas
+
+As referências são as menções a outras keywords dentro de cada descrição
+("See also RELSCF", "add keyword EF"), extraídas uma vez ao empacotar; início
+e fim são posições em caracteres no texto decodificado.
+
+Só o cabeçalho, as tabelas e os nomes são lidos ao abrir o pacote; cada descrição
+é lida do blob (mapeado em memória) e decodificada na primeira vez que é pedida.
+
+Para reconstruir o pacote depois de editar o JSON:
+    python pacote_keywords.py
+"""
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+FONTE = os.path.join(PASTA, "keywords.json")
+PACOTE = os.path.join(PASTA, "keywords.pack")
+
+MAGICO = b"KWPK"
+VERSAO = 2
+CABECALHO = struct.Struct("<4sHIII")
+ENTRADA = struct.Struct("<IIII")
+REFERENCIA = struct.Struct("<III")
+
+
+def extrair_referencias(descricoes):
+    """Para cada keyword, a lista de (índice da keyword citada, início, fim) no seu texto
+
+    Só contam menções em maiúsculas e palavra inteira, pela forma base (GNORM cita
+    GNORM=n.nn); CAMP-KING ou L-BFGS não citam CAMP ou BFGS. Menções a si mesma são ignoradas.
+    """
+    import re
+
+    nomes = list(descricoes)
+    por_base = {}
+    for i, nome in enumerate(nomes):
+        por_base.setdefault(nome.split("=")[0], i)
+    alternativas = "|".join(sorted(map(re.escape, por_base), key=len, reverse=True))
+    padrao = re.compile(r"(?<![\w-])(" + alternativas + r")(?:=n\.nn)?(?![\w-])")
+
+    referencias = []
+    for i, texto in enumerate(descricoes.values()):
+        referencias.append([(por_base[m.group(1)], m.start(), m.end())
+                            for m in padrao.finditer(texto) if por_base[m.group(1)] != i])
+    return referencias
+
+
+def empacotar(fonte=FONTE, destino=PACOTE):
+    """Gera o arquivo empacotado a partir do JSON de keywords"""
+    import json  # Só é preciso ao empacotar; fica fora da importação do app
+
+    with open(fonte, encoding="utf-8") as arquivo:
+        descricoes = json.load(arquivo)
+
+    tabela = bytearray()
+    tabela_referencias = bytearray()
+    blob = bytearray()
+    total = 0
+    for texto, referencias in zip(descricoes.values(), extrair_referencias(descricoes)):
+        dados = texto.encode("utf-8")
+        tabela += ENTRADA.pack(len(blob), len(dados), total, len(referencias))
+        for referencia in referencias:
+            tabela_referencias += REFERENCIA.pack(*referencia)
+        total += len(referencias)
+        blob += dados
+    nomes = "\n".join(descricoes).encode("utf-8")
+
+    temporario = destino + ".tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, VERSAO, len(descricoes), len(nomes), total))
+        arquivo.write(tabela)
+        arquivo.write(tabela_referencias)
+        arquivo.write(nomes)
+        arquivo.write(blob)
+    os.replace(temporario, destino)
+
+
+class KeywordsEmpacotadas(Mapping):
+    """Dicionário somente leitura nome -> descrição, carregado sob demanda do pacote"""
+
+    def __init__(self, caminho=PACOTE):
+        with open(caminho, "rb") as arquivo:
+            magico, versao, quantidade, tamanho_nomes, total = CABECALHO.unpack(arquivo.read(CABECALHO.size))
+            if magico != MAGICO or versao != VERSAO:
+                raise ValueError(f"{caminho} não é um pacote de keywords válido")
+            tabela = arquivo.read(quantidade * ENTRADA.size)
+            self.tabela_referencias = arquivo.read(total * REFERENCIA.size)
+            nomes = arquivo.read(tamanho_nomes).decode("utf-8").split("\n") if quantidade else []
+
+        self.caminho = caminho
+        self.inicio_blob = CABECALHO.size + len(tabela) + len(self.tabela_referencias) + tamanho_nomes
+        self.nomes = nomes
+        self.posicoes = dict(zip(nomes, ENTRADA.iter_unpack(tabela)))
+        self.descricoes = {}
+        self.mapa = None
+
+    def __getitem__(self, nome):
+        texto = self.descricoes.get(nome)
+        if texto is None:
+            offset, tamanho, _, _ = self.posicoes[nome]
+            if self.mapa is None:
+                with open(self.caminho, "rb") as arquivo:
+                    self.mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            inicio = self.inicio_blob + offset
+            texto = self.descricoes[nome] = self.mapa[inicio:inicio + tamanho].decode("utf-8")
+        return texto
+
+    def __iter__(self):
+        return iter(self.posicoes)
+
+    def __len__(self):
+        return len(self.posicoes)
+
+    def __contains__(self, nome):
+        return nome in self.posicoes
+
+    def referencias(self, nome):
+        """Menções a outras keywords no texto de `nome`: lista de (keyword, início, fim)"""
+        _, _, primeira, quantidade = self.posicoes[nome]
+        trecho = self.tabela_referencias[primeira * REFERENCIA.size:(primeira + quantidade) * REFERENCIA.size]
+        return [(self.nomes[destino], inicio, fim) for destino, inicio, fim in REFERENCIA.iter_unpack(trecho)]
+
+    def citadas(self, nome):
+        """Keywords citadas por `nome`, sem repetição, na ordem da primeira menção"""
+        return list(dict.fromkeys(destino for destino, _, _ in self.referencias(nome)))
+
+
+def carregar_keywords(pacote=PACOTE, fonte=FONTE):
+    """Abre o pacote de keywords, reconstruindo-o antes se o JSON for mais novo"""
+    if os.path.exists(fonte) and (not os.path.exists(pacote) or os.path.getmtime(fonte) > os.path.getmtime(pacote)):
+        try:
+            empacotar(fonte, pacote)
+        except OSError:
+            if not os.path.exists(pacote):  # Pasta somente leitura e nenhum pacote disponível
+                raise
+    try:
+        return KeywordsEmpacotadas(pacote)
+    except ValueError:
+        if not os.path.exists(fonte):
+            raise
+        empacotar(fonte, pacote)  # Pacote de uma versão anterior do formato
+        return KeywordsEmpacotadas(pacote)
+
+
+if __name__ == "__main__":
+    empacotar()
+    print(f"{PACOTE} gerado a partir de {FONTE}.")
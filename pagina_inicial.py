@@ -1,15 +1,22 @@
 import tkinter as tk
+from multiprocessing import freeze_support
 
 from BaseApp import BaseApp
-from elementosbotoes import ElementosApp
-from keywords import KeywordsApp
+from gerenciador_janelas import GerenciadorJanelas
+from importacao_tardia import importar, preaquecer
+from instrumentacao import instrumentar, medir, monitorar_laco
+
+instrumentar(BaseApp, "__init__")  # Só quando INSTRUMENTACAO_UI está definida
 
 
 
 class PaginaInicial(BaseApp):
     """Classe da Página Inicial"""
+    @medir
     def __init__(self):
         super().__init__("Home Page", "700x500")
+        self.janelas = GerenciadorJanelas()
+        monitorar_laco(self)
         
         
         frame = tk.Frame(self, bg="#f8f9fa")
@@ -21,15 +28,28 @@ class PaginaInicial(BaseApp):
         btn_metodos = tk.Button(frame, text="Methods", command=self.abrir_metodos, width=10, height=2, bg="#e0e0e0")
         btn_metodos.pack(pady=10)
 
+        btn_monitor = tk.Button(frame, text="Monitor", command=self.abrir_monitor, width=10, height=2, bg="#e0e0e0")
+        btn_monitor.pack(pady=10)
+
+        # As telas (e as tabelas de dados) só são importadas depois do primeiro quadro
+        self.after_idle(preaquecer)
+
+    @medir
     def abrir_keys(self):
-        KeywordsApp()  # Agora chama diretamente a classe da interface de Keywords
+        self.janelas.abrir("keywords", lambda: importar("keywords").KeywordsApp())  # Reaproveita a tela de Keywords se já foi aberta
 
+    @medir
     def abrir_metodos(self):
-        ElementosApp()  # Agora chama diretamente a classe da Tabela Periódica
+        self.janelas.abrir("metodos", lambda: importar("elementosbotoes").ElementosApp())  # Reaproveita a Tabela Periódica se já foi aberta
+
+    @medir
+    def abrir_monitor(self):
+        self.janelas.abrir("monitor", lambda: importar("monitor").MonitorApp())  # Escondida, continua seguindo os jobs
 
 
 
 if __name__ == "__main__":
+    freeze_support()  # O executável congelado do Windows roda os processos do pool por aqui
     app = PaginaInicial()
     #app.iconbitmap("software_assistant_icon.ico")
     app.mainloop()
@@ -0,0 +1,118 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+
+class PainelDescricao(ttk.Frame):
+    """Painel fixo com a descrição de uma keyword, num único Text reaproveitado.
+
+    O conteúdo já preparado (pedaços prontos para o Text.insert) fica num cache LRU
+    por keyword. Textos longos entram aos poucos: o primeiro pedaço aparece na hora
+    e o resto é inserido pelo after(), sem travar a janela. Menções a outras
+    keywords viram links que chamam `comando_link(nome)`.
+    """
+
+    def __init__(self, master, comando_link=None, tamanho_cache=64, primeiro_pedaco=2000, tamanho_pedaco=8000, **kwargs):
+        super().__init__(master, **kwargs)
+        self.comando_link = comando_link
+        self.tamanho_cache = tamanho_cache
+        self.primeiro_pedaco = primeiro_pedaco  # Caracteres: mais que uma tela cheia
+        self.tamanho_pedaco = tamanho_pedaco
+        self.cache = OrderedDict()
+        self.pendente = None  # after() que insere o próximo pedaço
+        self.atual = None
+
+        self.texto = tk.Text(self, wrap=tk.WORD, width=60, padx=12, pady=10, relief=tk.FLAT,
+                             font=("Helvetica", 11), state=tk.DISABLED, cursor="arrow")
+        self.barra = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.texto.yview)
+        self.texto.config(yscrollcommand=self.barra.set)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        self.texto.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.texto.tag_configure("titulo", font=("Helvetica", 14, "bold"), spacing3=8)
+        self.texto.tag_configure("paragrafo", spacing3=6)
+        self.texto.tag_configure("link", foreground="#0d6efd", underline=True)
+        self.texto.tag_bind("link", "<Enter>", lambda event: self.texto.config(cursor="hand2"))
+        self.texto.tag_bind("link", "<Leave>", lambda event: self.texto.config(cursor="arrow"))
+        self.texto.tag_bind("link", "<Button-1>", self.clicar_link)
+
+    def preparar(self, titulo, descricao, referencias=(), relacionadas=()):
+        """Divide o texto em pedaços no formato de argumentos de Text.insert (texto, tags, ...)
+
+        `referencias` são (keyword, início, fim) no texto; `relacionadas` entram no final
+        como uma linha de links.
+        """
+        mencoes = sorted(referencias, key=lambda referencia: referencia[1])
+        proxima = 0
+        pedacos = []
+        atual = [titulo + "\n", ("titulo",)]
+        tamanho = 0
+        limite = self.primeiro_pedaco
+        inicio_paragrafo = 0
+        for paragrafo in descricao.splitlines(keepends=True):
+            fim_paragrafo = inicio_paragrafo + len(paragrafo)
+            posicao = inicio_paragrafo
+            while proxima < len(mencoes) and mencoes[proxima][1] < fim_paragrafo:
+                destino, inicio, fim = mencoes[proxima]
+                if inicio > posicao:
+                    atual += [descricao[posicao:inicio], ("paragrafo",)]
+                atual += [descricao[inicio:fim], ("paragrafo", "link", "ref:" + destino)]
+                posicao = fim
+                proxima += 1
+            if posicao < fim_paragrafo:
+                atual += [descricao[posicao:fim_paragrafo], ("paragrafo",)]
+            inicio_paragrafo = fim_paragrafo
+            tamanho += len(paragrafo)
+            if tamanho >= limite:
+                pedacos.append(tuple(atual))
+                atual, tamanho, limite = [], 0, self.tamanho_pedaco
+
+        if relacionadas:
+            atual += ["\n\nRelacionadas: ", ("paragrafo",)]
+            for i, nome in enumerate(relacionadas):
+                atual += [(", " if i else ""), ("paragrafo",), nome, ("paragrafo", "link", "ref:" + nome)]
+        if atual:
+            pedacos.append(tuple(atual))
+        return pedacos
+
+    def pedacos(self, titulo, descricao, referencias=(), relacionadas=()):
+        pedacos = self.cache.get(titulo)
+        if pedacos is not None:
+            self.cache.move_to_end(titulo)
+            return pedacos
+        pedacos = self.cache[titulo] = self.preparar(titulo, descricao, referencias, relacionadas)
+        if len(self.cache) > self.tamanho_cache:
+            self.cache.popitem(last=False)
+        return pedacos
+
+    def mostrar(self, titulo, descricao, referencias=(), relacionadas=()):
+        """Troca o conteúdo do painel; um texto ainda sendo inserido é abandonado"""
+        if self.pendente is not None:
+            self.after_cancel(self.pendente)
+            self.pendente = None
+        self.atual = titulo
+        pedacos = self.pedacos(titulo, descricao, referencias, relacionadas)
+
+        self.texto.config(state=tk.NORMAL)
+        self.texto.delete("1.0", tk.END)
+        self.texto.insert(tk.END, *pedacos[0])
+        self.texto.config(state=tk.DISABLED)
+        self.texto.yview_moveto(0)
+        if len(pedacos) > 1:
+            self.pendente = self.after_idle(self.continuar, pedacos, 1)
+
+    def continuar(self, pedacos, indice):
+        self.texto.config(state=tk.NORMAL)
+        self.texto.insert(tk.END, *pedacos[indice])
+        self.texto.config(state=tk.DISABLED)
+        if indice + 1 < len(pedacos):
+            self.pendente = self.after(1, self.continuar, pedacos, indice + 1)
+        else:
+            self.pendente = None
+
+    def clicar_link(self, event):
+        indice = self.texto.index(f"@{event.x},{event.y}")
+        for tag in self.texto.tag_names(indice):
+            if tag.startswith("ref:") and self.comando_link:
+                self.comando_link(tag[len("ref:"):])
+                return "break"
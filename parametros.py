@@ -0,0 +1,216 @@
+"""Tabelas de parâmetros semiempíricos por elemento, uma por método, em NumPy.
+
+Cada método vira um array estruturado gravado em parametros/<MÉTODO>.npy: uma linha
+por elemento (ordenada pelo número atômico do registro de nucleo) e uma coluna
+float64 por parâmetro (USS, ZS, BETAS, GSS, ALP, FN11, ...; NaN quando o método
+não usa o parâmetro). As tabelas são abertas com mmap e só quando pedidas, então
+comparar PM6 com PM7 não carrega os outros métodos.
+
+Os valores vêm dos arquivos de parâmetros no formato EXTERNAL= do MOPAC
+(uma linha "PARÂMETRO  SÍMBOLO  VALOR", por exemplo "USS  H  -11.246958").
+
+Uso:
+    python parametros.py importar PM7 parametros_pm7.txt
+    python parametros.py coluna PM7 USS
+    python parametros.py diferenca PM6 PM7 --grupo transicao [--parametro USS]
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from nucleo import SYMBOLS_BY_Z, atomic_numbers
+
+PASTA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parametros")
+
+# Ordem das colunas conhecidas; parâmetros que não estão aqui (como ALPB_6 ou XFAC_6,
+# que são de pares de elementos no PM6/PM7) entram depois, em ordem alfabética
+ORDEM = (
+    "USS", "UPP", "UDD", "ZS", "ZP", "ZD", "BETAS", "BETAP", "BETAD",
+    "GSS", "GSP", "GPP", "GP2", "HSP", "F0SD", "G2SD", "POC", "ALP", "ZSN", "ZPN", "ZDN",
+    "FN11", "FN21", "FN31", "FN12", "FN22", "FN32", "FN13", "FN23", "FN33", "FN14", "FN24", "FN34",
+    "EISOL", "DD", "QQ", "AM", "AD", "AQ",
+)
+
+GRUPOS = {
+    "transicao": set(range(21, 31)) | set(range(39, 49)) | {57} | set(range(72, 81)),
+    "lantanideos": set(range(57, 72)),
+    "actinideos": set(range(89, len(SYMBOLS_BY_Z) + 1)),  # Só até o Cm, o último da tabela do nucleo
+}
+
+_tabelas = {}
+
+
+def ler_external(linhas):
+    """{símbolo: {parâmetro: valor}} de um arquivo de parâmetros no formato EXTERNAL="""
+    parametros = {}
+    for numero, linha in enumerate(linhas, 1):
+        partes = linha.split()
+        if not partes or partes[0].startswith(("*", "#")):
+            continue
+        if partes[0].upper() == "END":
+            break
+        if len(partes) < 3:
+            raise ValueError(f"linha {numero}: esperado 'PARÂMETRO SÍMBOLO VALOR'")
+        nome, simbolo, valor = partes[0].upper(), partes[1].capitalize(), partes[2]
+        if simbolo not in atomic_numbers:
+            raise ValueError(f"linha {numero}: elemento desconhecido {partes[1]}")
+        try:
+            parametros.setdefault(simbolo, {})[nome] = float(valor.upper().replace("D", "E"))
+        except ValueError:
+            raise ValueError(f"linha {numero}: valor inválido {valor}")
+    return parametros
+
+
+def montar_tabela(parametros):
+    """Array estruturado (z, simbolo, parâmetros...) ordenado pelo número atômico"""
+    nomes = {nome for valores in parametros.values() for nome in valores}
+    colunas = [nome for nome in ORDEM if nome in nomes] + sorted(nomes.difference(ORDEM))
+    tipo = np.dtype([("z", "u1"), ("simbolo", "U2")] + [(nome, "f8") for nome in colunas])
+
+    simbolos = sorted(parametros, key=atomic_numbers.get)
+    tabela = np.zeros(len(simbolos), dtype=tipo)
+    for nome in colunas:
+        tabela[nome] = np.nan
+    tabela["z"] = [atomic_numbers[simbolo] for simbolo in simbolos]
+    tabela["simbolo"] = simbolos
+    for linha, simbolo in enumerate(simbolos):
+        for nome, valor in parametros[simbolo].items():
+            tabela[nome][linha] = valor
+    return tabela
+
+
+def caminho_tabela(metodo, pasta=PASTA):
+    return os.path.join(pasta, f"{metodo.upper()}.npy")
+
+
+def salvar_tabela(metodo, tabela, pasta=PASTA):
+    os.makedirs(pasta, exist_ok=True)
+    destino = caminho_tabela(metodo, pasta)
+    temporario = destino + ".tmp"
+    with open(temporario, "wb") as arquivo:
+        np.save(arquivo, tabela, allow_pickle=False)
+    os.replace(temporario, destino)
+    _tabelas.pop(destino, None)
+
+
+def importar_external(metodo, caminho, pasta=PASTA):
+    """Converte um arquivo EXTERNAL= na tabela do método; devolve a tabela gravada"""
+    with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+        tabela = montar_tabela(ler_external(arquivo))
+    salvar_tabela(metodo, tabela, pasta)
+    return tabela
+
+
+def metodos_disponiveis(pasta=PASTA):
+    if not os.path.isdir(pasta):
+        return []
+    return sorted(entrada.name[:-4] for entrada in os.scandir(pasta) if entrada.name.endswith(".npy"))
+
+
+def tabela(metodo, pasta=PASTA):
+    """Tabela do método, mapeada em memória na primeira vez que é pedida"""
+    caminho = caminho_tabela(metodo, pasta)
+    aberta = _tabelas.get(caminho)
+    if aberta is None:
+        if not os.path.exists(caminho):
+            raise KeyError(f"sem parâmetros para {metodo} em {pasta}")
+        aberta = _tabelas[caminho] = np.load(caminho, mmap_mode="r", allow_pickle=False)
+    return aberta
+
+
+def parametros_de(metodo, pasta=PASTA):
+    return [nome for nome in tabela(metodo, pasta).dtype.names if nome not in ("z", "simbolo")]
+
+
+def simbolos_do_grupo(grupo):
+    return [SYMBOLS_BY_Z[z - 1] for z in sorted(GRUPOS[grupo])]
+
+
+def linhas_de(dados, simbolos):
+    """Posições dos símbolos na tabela (os ausentes ficam de fora)"""
+    zs = np.array([atomic_numbers[simbolo] for simbolo in simbolos if simbolo in atomic_numbers], dtype=np.uint8)
+    posicoes = np.searchsorted(dados["z"], zs)
+    dentro = posicoes < len(dados)
+    posicoes = posicoes[dentro]
+    return posicoes[dados["z"][posicoes] == zs[dentro]]
+
+
+def coluna(metodo, parametro, simbolos=None, pasta=PASTA):
+    """(símbolos, valores) de um parâmetro, por exemplo USS de todos os elementos do PM7"""
+    dados = tabela(metodo, pasta)
+    if simbolos is not None:
+        dados = dados[linhas_de(dados, simbolos)]
+    return dados["simbolo"], np.asarray(dados[parametro.upper()])
+
+
+def diferenca(metodo_a, metodo_b, parametros=None, simbolos=None, pasta=PASTA):
+    """Array estruturado com B - A de cada parâmetro em comum, nos elementos presentes nos dois métodos"""
+    a, b = tabela(metodo_a, pasta), tabela(metodo_b, pasta)
+    if simbolos is not None:
+        a, b = a[linhas_de(a, simbolos)], b[linhas_de(b, simbolos)]
+    _, linhas_a, linhas_b = np.intersect1d(a["z"], b["z"], assume_unique=True, return_indices=True)
+    comuns = [nome for nome in a.dtype.names if nome in b.dtype.names and nome not in ("z", "simbolo")]
+    if parametros is not None:
+        comuns = [nome for nome in comuns if nome in {parametro.upper() for parametro in parametros}]
+
+    resultado = np.empty(len(linhas_a), dtype=[("z", "u1"), ("simbolo", "U2")] + [(nome, "f8") for nome in comuns])
+    resultado["z"] = a["z"][linhas_a]
+    resultado["simbolo"] = a["simbolo"][linhas_a]
+    for nome in comuns:
+        resultado[nome] = b[nome][linhas_b] - a[nome][linhas_a]
+    return resultado
+
+
+def como_dicts(dados):
+    """Linhas do array estruturado como dicionários JSON (NaN vira None)"""
+    nomes = dados.dtype.names
+    for linha in dados.tolist():
+        yield {nome: (None if isinstance(valor, float) and valor != valor else valor) for nome, valor in zip(nomes, linha)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabelas de parâmetros semiempíricos por elemento e método.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    importar = comandos.add_parser("importar", help="converte um arquivo EXTERNAL= na tabela do método")
+    importar.add_argument("metodo")
+    importar.add_argument("arquivo")
+
+    col = comandos.add_parser("coluna", help="um parâmetro para todos os elementos do método")
+    col.add_argument("metodo")
+    col.add_argument("parametro")
+    col.add_argument("--grupo", choices=sorted(GRUPOS))
+
+    dif = comandos.add_parser("diferenca", help="B - A para os elementos em comum")
+    dif.add_argument("metodo_a")
+    dif.add_argument("metodo_b")
+    dif.add_argument("--grupo", choices=sorted(GRUPOS))
+    dif.add_argument("--parametro", action="append", help="pode ser repetido (padrão: todos em comum)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.comando == "importar":
+            dados = importar_external(args.metodo, args.arquivo)
+            print(f"{len(dados)} elementos e {len(dados.dtype.names) - 2} parâmetros gravados em {caminho_tabela(args.metodo)}",
+                  file=sys.stderr)
+            return 0
+        simbolos = simbolos_do_grupo(args.grupo) if args.grupo else None
+        if args.comando == "coluna":
+            nomes, valores = coluna(args.metodo, args.parametro, simbolos)
+            linhas = ({"simbolo": str(nome), args.parametro.upper(): None if np.isnan(valor) else float(valor)}
+                      for nome, valor in zip(nomes, valores))
+        else:
+            linhas = como_dicts(diferenca(args.metodo_a, args.metodo_b, args.parametro, simbolos))
+    except (KeyError, ValueError) as erro:
+        print(erro.args[0], file=sys.stderr)
+        return 1
+    for linha in linhas:
+        print(json.dumps(linha, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
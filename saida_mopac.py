@@ -0,0 +1,249 @@
+"""Leitura em lote de saídas do MOPAC (.out/.arc) com os arquivos mapeados em memória.
+
+De cada arquivo são extraídos:
+    - GNORM e ΔHf de cada ciclo da otimização ("CYCLE: ... GRAD.: ... HEAT: ...")
+    - o ΔHf final ("FINAL HEAT OF FORMATION") e o último "GRADIENT NORM"
+    - a geometria final (.arc: depois de "FINAL GEOMETRY OBTAINED"; .out: o último
+      bloco "CARTESIAN COORDINATES")
+    - se o menor ΔHf não é o último, seja porque o MOPAC imprimiu "CURRENT BEST
+      VALUE OF HEAT OF FORMATION" ou porque algum ciclo teve ΔHf menor que o final
+
+Os marcadores são procurados com mmap.find, e só as linhas encontradas são
+decodificadas, então arquivos de vários GB não são carregados inteiros.
+
+Uso:
+    python saida_mopac.py PASTA_OU_ARQUIVOS... -o resultados.npz [-j PROCESSOS]
+
+O .npz é colunar: uma linha por arquivo (arquivo, hf_final, gnorm_final, ...) e os
+ciclos e átomos de todos os arquivos concatenados, com offsets por arquivo (use
+`ciclos(dados, i)` e `geometria(dados, i)`). Os jobs marcados vão para o stdout em JSON lines.
+"""
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+from multiprocessing import freeze_support
+
+from lotes import mapear_em_lotes
+from verificador_decks import listar_decks
+
+EXTENSOES = (".out", ".arc")
+NUMERO = rb"([-+]?\d+\.?\d*(?:[EeDd][-+]?\d+)?)"
+CICLO = re.compile(rb"CYCLE:\s*(\d+).*?GRAD\.:\s*" + NUMERO + rb"\s+HEAT:\s*" + NUMERO)
+FINAL = re.compile(rb"FINAL HEAT OF FORMATION\s*=\s*" + NUMERO)
+GRADIENTE = re.compile(rb"GRADIENT NORM\s*=\s*" + NUMERO)
+MELHOR = b"CURRENT BEST VALUE OF HEAT OF FORMATION"
+TOLERANCIA = 1e-4  # kcal/mol: diferenças menores são arredondamento da impressão
+
+
+def numero(texto):
+    return float(texto.replace(b"D", b"E").replace(b"d", b"e"))
+
+
+def linhas_com(mapa, marcador, inicio=0):
+    """Gera cada linha (bytes) que contém o marcador, a partir de `inicio`"""
+    posicao = mapa.find(marcador, inicio)
+    while posicao != -1:
+        comeco = mapa.rfind(b"\n", 0, posicao) + 1
+        fim = mapa.find(b"\n", posicao)
+        if fim == -1:
+            fim = len(mapa)
+        yield mapa[comeco:fim]
+        posicao = mapa.find(marcador, fim)
+
+
+def ler_atomo(linha):
+    """(símbolo, x, y, z) de uma linha de geometria do .out ("1  C  0.0 0.0 0.0") ou .arc ("C 0.0 +1 0.0 +1 0.0 +1")"""
+    partes = linha.split()
+    if partes and partes[0].isdigit():
+        partes = partes[1:]
+    if len(partes) < 4 or not partes[0][:1].isalpha():
+        return None
+    numeros = partes[1:7:2] if len(partes) >= 7 else partes[1:4]
+    try:
+        x, y, z = (float(valor.replace("D", "E")) for valor in numeros)
+    except ValueError:
+        return None
+    simbolo = "".join(letra for letra in partes[0] if letra.isalpha())[:2]
+    return simbolo[:1].upper() + simbolo[1:].lower(), x, y, z
+
+
+def ler_geometria_final(mapa, arc):
+    """Átomos do último bloco de geometria: lista de (símbolo, x, y, z)"""
+    posicao = mapa.rfind(b"FINAL GEOMETRY OBTAINED" if arc else b"CARTESIAN COORDINATES")
+    if posicao == -1:
+        return []
+    atomos = []
+    inicio = mapa.find(b"\n", posicao) + 1
+    while 0 < inicio < len(mapa):
+        fim = mapa.find(b"\n", inicio)
+        if fim == -1:
+            fim = len(mapa)
+        linha = mapa[inicio:fim].decode("latin-1")
+        inicio = fim + 1
+        atomo = ler_atomo(linha)
+        if atomo:
+            atomos.append(atomo)
+        elif atomos and not linha.strip():
+            break  # Linha em branco depois dos átomos: fim do bloco
+        elif len(atomos) == 0 and inicio - posicao > 4096:
+            break  # Nenhum átomo logo depois do marcador
+    return atomos
+
+
+def ler_saida(caminho):
+    """Extrai ciclos, ΔHf, GNORM e geometria final de um .out/.arc"""
+    with open(caminho, "rb") as arquivo:
+        if os.fstat(arquivo.fileno()).st_size == 0:
+            raise ValueError("arquivo vazio")
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            numeros, gnorms, heats = [], [], []
+            for linha in linhas_com(mapa, b"CYCLE:"):
+                achado = CICLO.search(linha)
+                if achado:
+                    numeros.append(int(achado.group(1)))
+                    gnorms.append(numero(achado.group(2)))
+                    heats.append(numero(achado.group(3)))
+
+            hf_final = gnorm_final = float("nan")
+            posicao = mapa.rfind(b"FINAL HEAT OF FORMATION")
+            if posicao != -1:
+                achado = FINAL.search(mapa[posicao:posicao + 200])
+                if achado:
+                    hf_final = numero(achado.group(1))
+            posicao = mapa.rfind(b"GRADIENT NORM")
+            if posicao != -1:
+                achado = GRADIENTE.search(mapa[posicao:posicao + 200])
+                if achado:
+                    gnorm_final = numero(achado.group(1))
+            melhor_impresso = mapa.find(MELHOR) != -1
+            atomos = ler_geometria_final(mapa, caminho.lower().endswith(".arc"))
+
+    ultimo = hf_final if hf_final == hf_final else (heats[-1] if heats else float("nan"))
+    hf_minimo = min(heats + [ultimo]) if heats else ultimo
+    return {
+        "arquivo": caminho,
+        "ciclo_numero": numeros,
+        "ciclo_gnorm": gnorms,
+        "ciclo_heat": heats,
+        "hf_final": hf_final,
+        "hf_minimo": hf_minimo,
+        "gnorm_final": gnorm_final,
+        "melhor_impresso": melhor_impresso,
+        "melhor_nao_ultimo": melhor_impresso or (hf_minimo < ultimo - TOLERANCIA),
+        "atomos": atomos,
+    }
+
+
+def ler_lote(caminhos):
+    """Lê uma lista de arquivos — unidade de trabalho do pool"""
+    resultados = []
+    for caminho in caminhos:
+        try:
+            resultados.append(ler_saida(caminho))
+        except (OSError, ValueError) as erro:
+            resultados.append({"arquivo": caminho, "erro": str(erro)})
+    return resultados
+
+
+class Colunas:
+    """Acumula os resultados (que chegam fora de ordem) em listas para o .npz"""
+
+    ESCALARES = ("hf_final", "hf_minimo", "gnorm_final")
+
+    def __init__(self):
+        self.arquivos, self.erros = [], []
+        self.escalares = {nome: [] for nome in self.ESCALARES}
+        self.melhor_impresso, self.melhor_nao_ultimo = [], []
+        self.ciclos_fim, self.ciclo_numero, self.ciclo_gnorm, self.ciclo_heat = [], [], [], []
+        self.atomos_fim, self.simbolos, self.coordenadas = [], [], []
+
+    def adicionar(self, resultado):
+        self.arquivos.append(resultado["arquivo"])
+        self.erros.append(resultado.get("erro", ""))
+        for nome in self.ESCALARES:
+            self.escalares[nome].append(resultado.get(nome, float("nan")))
+        self.melhor_impresso.append(resultado.get("melhor_impresso", False))
+        self.melhor_nao_ultimo.append(resultado.get("melhor_nao_ultimo", False))
+        self.ciclo_numero.extend(resultado.get("ciclo_numero", ()))
+        self.ciclo_gnorm.extend(resultado.get("ciclo_gnorm", ()))
+        self.ciclo_heat.extend(resultado.get("ciclo_heat", ()))
+        self.ciclos_fim.append(len(self.ciclo_numero))
+        for simbolo, x, y, z in resultado.get("atomos", ()):
+            self.simbolos.append(simbolo)
+            self.coordenadas.append((x, y, z))
+        self.atomos_fim.append(len(self.simbolos))
+
+    def salvar(self, caminho, comprimir=False):
+        import numpy as np  # Só para gravar; o monitor de jobs usa este módulo sem precisar do NumPy
+
+        gravar = np.savez_compressed if comprimir else np.savez
+        gravar(
+            caminho,
+            arquivo=np.array(self.arquivos, dtype=str),
+            erro=np.array(self.erros, dtype=str),
+            **{nome: np.array(valores, dtype=np.float64) for nome, valores in self.escalares.items()},
+            melhor_impresso=np.array(self.melhor_impresso, dtype=bool),
+            melhor_nao_ultimo=np.array(self.melhor_nao_ultimo, dtype=bool),
+            ciclos_offset=np.array([0] + self.ciclos_fim, dtype=np.int64),
+            ciclo_numero=np.array(self.ciclo_numero, dtype=np.int32),
+            ciclo_gnorm=np.array(self.ciclo_gnorm, dtype=np.float64),
+            ciclo_heat=np.array(self.ciclo_heat, dtype=np.float64),
+            atomos_offset=np.array([0] + self.atomos_fim, dtype=np.int64),
+            atomo_simbolo=np.array(self.simbolos, dtype="U2"),
+            atomo_xyz=np.array(self.coordenadas, dtype=np.float64).reshape(-1, 3),
+        )
+
+
+def ciclos(dados, i):
+    """(número, GNORM, ΔHf) dos ciclos do i-ésimo arquivo de um .npz gravado por este módulo"""
+    inicio, fim = dados["ciclos_offset"][i], dados["ciclos_offset"][i + 1]
+    return dados["ciclo_numero"][inicio:fim], dados["ciclo_gnorm"][inicio:fim], dados["ciclo_heat"][inicio:fim]
+
+
+def geometria(dados, i):
+    """(símbolos, coordenadas n x 3) da geometria final do i-ésimo arquivo"""
+    inicio, fim = dados["atomos_offset"][i], dados["atomos_offset"][i + 1]
+    return dados["atomo_simbolo"][inicio:fim], dados["atomo_xyz"][inicio:fim]
+
+
+def listar_saidas(caminhos):
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            yield from listar_decks(caminho, EXTENSOES)
+        else:
+            yield caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extrai ciclos, ΔHf e geometrias finais de saídas do MOPAC.")
+    parser.add_argument("entradas", nargs="+", help="arquivos .out/.arc ou pastas com eles")
+    parser.add_argument("-o", "--saida", required=True, help="arquivo .npz com os resultados")
+    parser.add_argument("-j", "--processos", type=int, default=None, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument("--lote", type=int, default=4, help="arquivos por unidade de trabalho")
+    parser.add_argument("--comprimir", action="store_true", help="grava o .npz comprimido")
+    args = parser.parse_args(argv)
+
+    colunas = Colunas()
+    marcados = erros = 0
+    for resultado in mapear_em_lotes(ler_lote, listar_saidas(args.entradas), args.processos, args.lote):
+        colunas.adicionar(resultado)
+        if "erro" in resultado:
+            erros += 1
+        elif resultado["melhor_nao_ultimo"]:
+            marcados += 1
+            print(json.dumps({"arquivo": resultado["arquivo"], "hf_final": resultado["hf_final"],
+                              "hf_minimo": resultado["hf_minimo"], "melhor_impresso": resultado["melhor_impresso"]},
+                             ensure_ascii=False))
+    colunas.salvar(args.saida, args.comprimir)
+
+    print(f"{len(colunas.arquivos)} arquivos lidos, {marcados} com ΔHf menor antes do final, {erros} com erro.",
+          file=sys.stderr)
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())
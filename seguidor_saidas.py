@@ -0,0 +1,166 @@
+"""Acompanhamento incremental de saídas do MOPAC que ainda estão sendo escritas.
+
+Cada arquivo tem um SeguidorArquivo, que guarda o offset já lido e o inode: a cada
+consulta só os bytes novos são lidos (com limite por consulta), e um arquivo
+truncado ou substituído (rotação, job reiniciado) volta a ser lido do começo.
+As linhas de ciclo alimentam um EstadoJob, que guarda o histórico recente de
+GNORM e ΔHf e gera alertas quando o ΔHf sobe acima do melhor valor ou quando o
+GNORM para de cair.
+"""
+import os
+from collections import deque
+
+from saida_mopac import CICLO, FINAL, numero
+from verificador_decks import listar_decks
+
+EXTENSOES = (".out",)
+BLOCOS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(valores, largura=24):
+    """Os últimos `largura` valores como uma linha de blocos unicode"""
+    valores = list(valores)[-largura:]
+    if not valores:
+        return ""
+    menor, maior = min(valores), max(valores)
+    if maior - menor < 1e-12:
+        return BLOCOS[0] * len(valores)
+    escala = (len(BLOCOS) - 1) / (maior - menor)
+    return "".join(BLOCOS[int((valor - menor) * escala)] for valor in valores)
+
+
+class SeguidorArquivo:
+    """Lê só o que foi acrescentado ao arquivo desde a última consulta"""
+
+    def __init__(self, caminho, maximo_por_leitura=1 << 20):
+        self.caminho = caminho
+        self.maximo_por_leitura = maximo_por_leitura
+        self.offset = 0
+        self.identidade = None  # (st_dev, st_ino) do arquivo que está sendo lido
+        self.resto = b""        # Última linha, ainda incompleta
+
+    def ler_linhas(self):
+        """Devolve (linhas novas completas, reiniciou); reiniciou indica truncamento ou substituição"""
+        try:
+            estado = os.stat(self.caminho)
+        except FileNotFoundError:
+            return [], False
+        identidade = (estado.st_dev, estado.st_ino)
+        reiniciou = self.identidade is not None and (identidade != self.identidade or estado.st_size < self.offset)
+        if reiniciou or self.identidade is None:
+            self.identidade, self.offset, self.resto = identidade, 0, b""
+        if estado.st_size == self.offset:
+            return [], reiniciou
+
+        with open(self.caminho, "rb") as arquivo:
+            arquivo.seek(self.offset)
+            dados = arquivo.read(min(estado.st_size - self.offset, self.maximo_por_leitura))
+        self.offset += len(dados)
+        linhas = (self.resto + dados).split(b"\n")
+        self.resto = linhas.pop()
+        return linhas, reiniciou
+
+    def pendente(self):
+        """Se ainda há bytes além do limite lido nesta consulta"""
+        try:
+            return os.stat(self.caminho).st_size > self.offset
+        except FileNotFoundError:
+            return False
+
+
+class EstadoJob:
+    """Histórico recente de um job e os alertas de ΔHf subindo e GNORM estagnado"""
+
+    def __init__(self, nome, historico=64, tolerancia_hf=0.01, ciclos_estagnado=25):
+        self.nome = nome
+        self.tolerancia_hf = tolerancia_hf
+        self.ciclos_estagnado = ciclos_estagnado
+        self.heats = deque(maxlen=historico)
+        self.gnorms = deque(maxlen=historico)
+        self.limpar()
+
+    def limpar(self):
+        self.heats.clear()
+        self.gnorms.clear()
+        self.ciclo = 0
+        self.melhor_hf = float("inf")
+        self.melhor_gnorm = float("inf")
+        self.ciclo_melhor_gnorm = 0
+        self.hf_final = None
+        self.alertas = set()  # Tipos de alerta ativos ("hf_subiu", "gnorm_estagnado")
+
+    def processar(self, linhas):
+        """Atualiza o estado com as linhas novas; devolve os alertas que acabaram de aparecer"""
+        novos = []
+        for linha in linhas:
+            if b"CYCLE:" in linha:
+                achado = CICLO.search(linha)
+                if achado:
+                    novos.extend(self.registrar_ciclo(int(achado.group(1)), numero(achado.group(2)), numero(achado.group(3))))
+            elif b"FINAL HEAT OF FORMATION" in linha:
+                achado = FINAL.search(linha)
+                if achado:
+                    self.hf_final = numero(achado.group(1))
+                    self.alertas.discard("gnorm_estagnado")
+        return novos
+
+    def registrar_ciclo(self, ciclo, gnorm, heat):
+        self.ciclo = ciclo
+        self.heats.append(heat)
+        self.gnorms.append(gnorm)
+        novos = []
+
+        if heat < self.melhor_hf:
+            self.melhor_hf = heat
+            self.alertas.discard("hf_subiu")
+        elif heat > self.melhor_hf + self.tolerancia_hf and "hf_subiu" not in self.alertas:
+            self.alertas.add("hf_subiu")
+            novos.append(f"{self.nome}: ΔHf subiu para {heat:.4f} (melhor {self.melhor_hf:.4f}) no ciclo {ciclo}")
+
+        if gnorm < self.melhor_gnorm * 0.95:
+            self.melhor_gnorm, self.ciclo_melhor_gnorm = gnorm, ciclo
+            self.alertas.discard("gnorm_estagnado")
+        elif ciclo - self.ciclo_melhor_gnorm >= self.ciclos_estagnado and "gnorm_estagnado" not in self.alertas:
+            self.alertas.add("gnorm_estagnado")
+            novos.append(f"{self.nome}: GNORM parado em torno de {gnorm:.3f} há {ciclo - self.ciclo_melhor_gnorm} ciclos")
+        return novos
+
+
+class MonitorJobs:
+    """Segue todas as saídas de uma pasta; novas saídas são descobertas a cada `varrer_a_cada` consultas"""
+
+    def __init__(self, pasta, extensoes=EXTENSOES, varrer_a_cada=10, **opcoes_estado):
+        self.pasta = pasta
+        self.extensoes = extensoes
+        self.varrer_a_cada = varrer_a_cada
+        self.opcoes_estado = opcoes_estado
+        self.seguidores = {}
+        self.estados = {}
+        self.consultas = 0
+
+    def varrer(self):
+        for caminho in listar_decks(self.pasta, self.extensoes):
+            if caminho not in self.seguidores:
+                self.seguidores[caminho] = SeguidorArquivo(caminho)
+                self.estados[caminho] = EstadoJob(os.path.relpath(caminho, self.pasta), **self.opcoes_estado)
+
+    def atualizar(self):
+        """Lê o que foi acrescentado em cada arquivo; devolve (caminhos alterados, alertas novos)"""
+        if self.consultas % self.varrer_a_cada == 0:
+            self.varrer()
+        self.consultas += 1
+
+        alterados, alertas = [], []
+        for caminho, seguidor in self.seguidores.items():
+            linhas, reiniciou = seguidor.ler_linhas()
+            estado = self.estados[caminho]
+            if reiniciou:
+                estado.limpar()
+            if linhas or reiniciou:
+                alertas.extend(estado.processar(linhas))
+                alterados.append(caminho)
+        return alterados, alertas
+
+    def atrasados(self):
+        """Se algum arquivo ainda tem bytes além do limite de leitura (para consultar de novo logo)"""
+        return any(seguidor.pendente() for seguidor in self.seguidores.values())
@@ -0,0 +1,226 @@
+"""Serviço HTTP/JSON local (asyncio) para consultas de métodos, elementos e keywords.
+
+Uso:
+    python servico_consultas.py [--host 127.0.0.1] [--porta 8765] [--cache 4096]
+
+Rotas:
+    GET  /elemento/<símbolo>          métodos que contêm o elemento
+    GET  /metodos?simbolos=C,H,O      métodos que cobrem todos os símbolos
+    GET  /keyword/<nome>              descrição da keyword
+    GET  /keywords                    nomes de todas as keywords
+    POST /lote                        {"elementos": [...], "moleculas": [[...] ou "C,H,O", ...], "keywords": [...]}
+    GET  /estatisticas                acertos do cache e latência
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from nucleo import descricao_keyword, element_methods, keywords, methods_supporting
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+          500: "Internal Server Error"}
+MAXIMO_CORPO = 1 << 20  # Bytes aceitos no corpo de uma requisição
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def resposta(status, corpo, manter_conexao=True):
+    dados = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+    cabecalho = (f"HTTP/1.1 {status} {STATUS[status]}\r\n"
+                 "Content-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(dados)}\r\n"
+                 f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n\r\n")
+    return cabecalho.encode("ascii") + dados
+
+
+def tamanho_do_corpo(campos):
+    """Content-Length validado antes de ler o corpo"""
+    texto = campos.get("content-length", "") or "0"
+    if not (texto.isascii() and texto.isdigit()):
+        raise ErroHTTP(400, f"Content-Length inválido: {texto[:20]}")
+    tamanho = int(texto)
+    if tamanho > MAXIMO_CORPO:
+        raise ErroHTTP(413, f"corpo maior que {MAXIMO_CORPO} bytes")
+    return tamanho
+
+
+def lista_de_textos(pedido, campo):
+    valor = pedido.get(campo, [])
+    if not isinstance(valor, list) or not all(isinstance(item, str) for item in valor):
+        raise ErroHTTP(400, f'"{campo}" deve ser uma lista de strings')
+    return valor
+
+
+def simbolos_da_molecula(valor):
+    """Símbolos de uma molécula dada como lista ou como texto "C,H,O" (a mesma forma do GET /metodos)"""
+    if isinstance(valor, str):
+        return valor.replace(",", " ").split()
+    if isinstance(valor, list) and all(isinstance(simbolo, str) for simbolo in valor):
+        return valor
+    raise ErroHTTP(400, 'cada molécula deve ser uma lista de símbolos ou um texto como "C,H,O"')
+
+
+def consultar_lote(pedido):
+    """Responde várias consultas em uma única requisição"""
+    if not isinstance(pedido, dict):
+        raise ErroHTTP(400, "o corpo deve ser um objeto JSON")
+    moleculas = pedido.get("moleculas", [])
+    if not isinstance(moleculas, list):
+        raise ErroHTTP(400, '"moleculas" deve ser uma lista')
+    return {
+        "elementos": {simbolo: element_methods(simbolo) for simbolo in lista_de_textos(pedido, "elementos")},
+        "moleculas": [list(methods_supporting(simbolos_da_molecula(valor))) for valor in moleculas],
+        "keywords": {nome: descricao_keyword(nome) for nome in lista_de_textos(pedido, "keywords")},
+    }
+
+
+def rotear(metodo, alvo, corpo):
+    """Devolve (status, objeto JSON) da consulta"""
+    partes = urlsplit(alvo)
+    caminho = unquote(partes.path)
+    if metodo == "POST":
+        if caminho != "/lote":
+            raise ErroHTTP(404, f"rota inexistente: {caminho}")
+        try:
+            return 200, consultar_lote(json.loads(corpo or b"{}"))
+        except ValueError:
+            raise ErroHTTP(400, "JSON inválido")
+    if metodo != "GET":
+        raise ErroHTTP(405, f"método não suportado: {metodo}")
+
+    if caminho.startswith("/elemento/"):
+        simbolo = caminho[len("/elemento/"):]
+        return 200, {"symbol": simbolo, "methods": element_methods(simbolo)}
+    if caminho == "/metodos":
+        simbolos = sorted({s for valor in parse_qs(partes.query).get("simbolos", ()) for s in valor.split(",") if s})
+        return 200, {"symbols": simbolos, "methods": list(methods_supporting(simbolos))}
+    if caminho.startswith("/keyword/"):
+        nome = caminho[len("/keyword/"):]
+        descricao = descricao_keyword(nome)
+        if descricao is None:
+            raise ErroHTTP(404, f"keyword inexistente: {nome}")
+        return 200, {"keyword": nome, "description": descricao}
+    if caminho == "/keywords":
+        return 200, {"keywords": list(keywords)}
+    raise ErroHTTP(404, f"rota inexistente: {caminho}")
+
+
+class ServicoConsultas:
+    """Servidor HTTP mínimo com cache LRU das respostas já serializadas"""
+
+    def __init__(self, tamanho_cache=4096, amostras_latencia=10000):
+        self.cache = OrderedDict()
+        self.tamanho_cache = tamanho_cache
+        self.acertos = 0
+        self.falhas = 0
+        self.requisicoes = 0
+        self.latencias = deque(maxlen=amostras_latencia)  # Em segundos, só as mais recentes
+
+    def responder(self, metodo, alvo, corpo, manter_conexao):
+        if alvo == "/estatisticas":
+            return resposta(200, self.estatisticas(), manter_conexao)
+
+        chave = (metodo, alvo, corpo, manter_conexao)
+        pronta = self.cache.get(chave)
+        if pronta is not None:
+            self.acertos += 1
+            self.cache.move_to_end(chave)
+            return pronta
+
+        self.falhas += 1
+        try:
+            status, objeto = rotear(metodo, alvo, corpo)
+        except ErroHTTP as erro:
+            return resposta(erro.status, {"erro": str(erro)}, manter_conexao)
+        except Exception as erro:  # Qualquer falha ainda recebe uma resposta, em vez de derrubar a conexão
+            return resposta(500, {"erro": f"{type(erro).__name__}: {erro}"}, manter_conexao)
+        pronta = self.cache[chave] = resposta(status, objeto, manter_conexao)
+        if len(self.cache) > self.tamanho_cache:
+            self.cache.popitem(last=False)
+        return pronta
+
+    def estatisticas(self):
+        ordenadas = sorted(self.latencias)
+
+        def percentil(p):
+            return ordenadas[min(len(ordenadas) - 1, int(p * len(ordenadas)))] * 1000 if ordenadas else 0.0
+
+        consultas = self.acertos + self.falhas
+        return {
+            "requisicoes": self.requisicoes,
+            "cache": {"entradas": len(self.cache), "acertos": self.acertos, "falhas": self.falhas,
+                      "taxa_acerto": self.acertos / consultas if consultas else 0.0},
+            "latencia_ms": {"p50": percentil(0.50), "p90": percentil(0.90), "p99": percentil(0.99),
+                            "max": ordenadas[-1] * 1000 if ordenadas else 0.0},
+        }
+
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão, com várias requisições em sequência (keep-alive)"""
+        try:
+            while True:
+                try:
+                    cabecalho = await leitor.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                inicio = time.perf_counter()
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                try:
+                    metodo, alvo, versao = linhas[0].split(" ", 2)
+                except ValueError:
+                    escritor.write(resposta(400, {"erro": "linha de requisição inválida"}, False))
+                    break
+                campos = {}
+                for linha in linhas[1:]:
+                    nome, _, valor = linha.partition(":")
+                    campos[nome.strip().lower()] = valor.strip()
+                try:
+                    tamanho = tamanho_do_corpo(campos)
+                except ErroHTTP as erro:
+                    # O corpo não é lido, então a conexão não pode ser reaproveitada
+                    escritor.write(resposta(erro.status, {"erro": str(erro)}, False))
+                    break
+                corpo = await leitor.readexactly(tamanho) if tamanho else b""
+                conexao = campos.get("connection", "").lower()
+                manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+
+                escritor.write(self.responder(metodo, alvo, corpo, manter))
+                self.requisicoes += 1
+                self.latencias.append(time.perf_counter() - inicio)
+                await escritor.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+
+async def servir(host, porta, tamanho_cache):
+    servico = ServicoConsultas(tamanho_cache)
+    servidor = await asyncio.start_server(servico.atender, host, porta)
+    print(f"Servindo em http://{host}:{porta}")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço local de consultas JSON sobre métodos, elementos e keywords.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--cache", type=int, default=4096, help="respostas guardadas no cache LRU")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.porta, args.cache))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Sugestões para keywords digitadas errado ("você quis dizer ...?").
+
+O índice é de deleções simétricas: cada nome conhecido é guardado junto com todas
+as formas obtidas apagando até `distancia_maxima` letras. Uma consulta gera as
+próprias deleções e só os nomes que compartilham alguma delas têm a distância
+(Damerau-Levenshtein, transposições adjacentes) calculada — nada de varrer a lista.
+
+Uso:
+    python sugestoes_keywords.py [TOKEN ...]
+
+Sem tokens, lê um por linha do stdin. Cada token gera uma linha JSON com a
+correção e as sugestões.
+"""
+import argparse
+import json
+import sys
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from nucleo import keywords, methods_data
+
+
+def limite_para(palavra, distancia_maxima):
+    """Palavras curtas toleram menos erros: com 3 letras, 2 erros acham qualquer coisa"""
+    if len(palavra) <= 4:
+        return min(1, distancia_maxima)
+    if len(palavra) <= 7:
+        return min(2, distancia_maxima)
+    return distancia_maxima
+
+
+def delecoes(palavra, distancia):
+    """A palavra e todas as formas com até `distancia` letras apagadas"""
+    formas = {palavra}
+    nivel = formas
+    for _ in range(distancia):
+        nivel = {forma[:i] + forma[i + 1:] for forma in nivel for i in range(len(forma))}
+        formas |= nivel
+    return formas
+
+
+def distancia_edicao(a, b, limite):
+    """Distância de Damerau-Levenshtein (OSA); devolve limite + 1 assim que passar do limite"""
+    if abs(len(a) - len(b)) > limite:
+        return limite + 1
+    anterior2 = None
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        atual = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            custo = a[i - 1] != b[j - 1]
+            atual[j] = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + custo)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                atual[j] = min(atual[j], anterior2[j - 2] + 1)
+        if min(atual) > limite:
+            return limite + 1
+        anterior2, anterior = anterior, atual
+    return anterior[-1]
+
+
+def separar_token(token):
+    """GNROM=0.5 -> ("GNROM", "=0.5"); LET(20) -> ("LET", "(20)")"""
+    for i, letra in enumerate(token):
+        if letra in "=(":
+            return token[:i].upper(), token[i:]
+    return token.upper(), ""
+
+
+class CorretorKeywords:
+    """Índice de deleções simétricas sobre um vocabulário de keywords"""
+
+    def __init__(self, nomes, distancia_maxima=3, tamanho_cache=65536):
+        self.distancia_maxima = distancia_maxima
+        self.formas = {}  # Nome normalizado (GNORM) -> nome como aparece na fonte (GNORM=n.nn)
+        self.indice = defaultdict(list)
+        for nome in nomes:
+            base = separar_token(nome)[0]
+            if base and base not in self.formas:
+                self.formas[base] = nome
+                for forma in delecoes(base, distancia_maxima):
+                    self.indice[forma].append(base)
+        self.sugerir = lru_cache(maxsize=tamanho_cache)(self.sugerir)
+
+    def __contains__(self, nome):
+        return separar_token(nome)[0] in self.formas
+
+    def sugerir(self, palavra, quantidade=3):
+        """Até `quantidade` tuplas (nome, distância), das mais próximas para as mais distantes
+
+        Um nome conhecido devolve só ele mesmo, com distância 0.
+        """
+        palavra = separar_token(palavra)[0]
+        if not palavra:
+            return ()
+        if palavra in self.formas:
+            return ((palavra, 0),)
+        limite = limite_para(palavra, self.distancia_maxima)
+        # Nível k: deleções da consulta com k letras a menos. Depois do nível k todos os
+        # nomes a distância <= k já foram vistos, então dá para parar cedo.
+        vistos, encontrados = set(), []
+        nivel = {palavra}
+        for k in range(limite + 1):
+            if k:
+                nivel = {forma[:i] + forma[i + 1:] for forma in nivel for i in range(len(forma))}
+            for forma in nivel:
+                for nome in self.indice.get(forma, ()):
+                    if nome not in vistos:
+                        vistos.add(nome)
+                        distancia = distancia_edicao(palavra, nome, limite)
+                        if distancia <= limite:
+                            encontrados.append((distancia, nome))
+            if sum(1 for distancia, _ in encontrados if distancia <= k) >= quantidade:
+                break
+        encontrados.sort()
+        return tuple((nome, distancia) for distancia, nome in encontrados[:quantidade])
+
+    def corrigir(self, token):
+        """Token com o nome corrigido e o valor preservado (GNROM=0.5 -> GNORM=0.5), ou None"""
+        nome, resto = separar_token(token)
+        sugestoes = self.sugerir(nome, 1)
+        if not sugestoes:
+            return None
+        return sugestoes[0][0] + resto
+
+    def corrigir_lote(self, tokens, quantidade=1):
+        """Lista de {"token", "correcao", "sugestoes"} — correcao é None quando nada é próximo"""
+        resultado = []
+        for token in tokens:
+            sugestoes = self.sugerir(token, quantidade)
+            resultado.append({
+                "token": token,
+                "correcao": sugestoes[0][0] + separar_token(token)[1] if sugestoes else None,
+                "sugestoes": [nome for nome, _ in sugestoes],
+            })
+        return resultado
+
+
+_corretor = None
+_trava = threading.Lock()
+
+
+def corretor_padrao():
+    """Corretor sobre as keywords (e suas formas base, como GNORM) e os nomes dos métodos
+
+    O índice é montado uma vez só; o app o monta na thread de preaquecimento
+    (importacao_tardia), e uma chamada que chegue durante a montagem espera por ela.
+    """
+    global _corretor
+    if _corretor is None:
+        with _trava:
+            if _corretor is None:
+                _corretor = CorretorKeywords(list(keywords) + list(methods_data))
+    return _corretor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sugere keywords do MOPAC para tokens digitados errado.")
+    parser.add_argument("tokens", nargs="*", help="tokens a corrigir (padrão: um por linha do stdin)")
+    parser.add_argument("-n", "--sugestoes", type=int, default=3, help="sugestões por token")
+    args = parser.parse_args(argv)
+
+    tokens = args.tokens or (linha.strip() for linha in sys.stdin if linha.strip())
+    corretor = corretor_padrao()
+    for resultado in corretor.corrigir_lote(tokens, args.sugestoes):
+        print(json.dumps(resultado, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import tkinter as tk
+
+
+class TabelaCanvas(tk.Canvas):
+    """Tabela periódica desenhada em um único Canvas: um retângulo e um texto por elemento.
+
+    Os cliques são resolvidos pelo item sob o cursor e as trocas de cor são
+    enviadas ao Tcl em um único script, em vez de um `config` por botão.
+    """
+
+    def __init__(self, master, elementos, comando, largura_celula=48, altura_celula=40, espaco=6, **kwargs):
+        linhas = max(e["row"] for e in elementos) + 1
+        colunas = max(e["col"] for e in elementos) + 1
+        super().__init__(master, width=colunas * (largura_celula + espaco) + espaco,
+                         height=linhas * (altura_celula + espaco) + espaco, highlightthickness=0, **kwargs)
+        self.comando = comando
+        self.cores_originais = {}
+        self.cores_atuais = {}
+        self.retangulos = {}         # símbolo -> id do retângulo
+        self.simbolo_por_item = {}   # id do retângulo ou do texto -> símbolo
+
+        for element in elementos:
+            x0 = espaco + element["col"] * (largura_celula + espaco)
+            y0 = espaco + element["row"] * (altura_celula + espaco)
+            tag = f"el_{element['symbol']}"
+            retangulo = self.create_rectangle(x0, y0, x0 + largura_celula, y0 + altura_celula,
+                                              fill=element["color"], outline="#808080", tags=(tag, "celula", "elemento"))
+            texto = self.create_text(x0 + largura_celula / 2, y0 + altura_celula / 2, text=element["symbol"],
+                                     font="TkDefaultFont", tags=(tag, "rotulo", "elemento"))
+            self.retangulos[element["symbol"]] = retangulo
+            self.simbolo_por_item[retangulo] = self.simbolo_por_item[texto] = element["symbol"]
+            self.cores_originais[element["symbol"]] = element["color"]
+        self.cores_atuais.update(self.cores_originais)
+
+        self.tag_bind("elemento", "<Enter>", lambda event: self.config(cursor="hand2"))
+        self.tag_bind("elemento", "<Leave>", lambda event: self.config(cursor=""))
+        self.bind("<Button-1>", self.clicar)
+
+    def clicar(self, event):
+        itens = self.find_withtag("current")
+        if itens and itens[0] in self.simbolo_por_item:
+            self.comando(self.simbolo_por_item[itens[0]])
+
+    def colorir(self, cores):
+        """Aplica {símbolo: cor} a todos os elementos de uma vez, em uma única chamada ao Tcl
+
+        Só as células cuja cor muda entram no script.
+        """
+        comandos = []
+        for simbolo, cor in cores.items():
+            if simbolo in self.retangulos and self.cores_atuais[simbolo] != cor:
+                comandos.append(f"{self._w} itemconfigure {self.retangulos[simbolo]} -fill {{{cor}}}")
+                self.cores_atuais[simbolo] = cor
+        if comandos:
+            self.tk.eval("\n".join(comandos))
+
+    def restaurar_cores(self):
+        self.colorir(self.cores_originais)
@@ -0,0 +1,218 @@
+"""Ponte entre o mainloop do Tk e trabalho pesado em threads ou processos.
+
+O trabalho roda num pool (ThreadPoolExecutor ou ProcessPoolExecutor, compartilhados
+por todas as telas) e os resultados voltam por uma fila que a janela esvazia com
+after(): os callbacks sempre rodam na thread do Tk e podem mexer nos widgets. A
+fila só é consultada enquanto há tarefas em andamento, e cada consulta tem um
+limite de tempo para não atrasar o próximo quadro.
+
+    tarefas = ExecutorTarefas(janela)
+    tarefas.enviar("indice", montar, dados, ao_concluir=mostrar)
+    tarefas.mapear("decks", verificar_lote, listar_decks(pasta), ao_parcial=..., ao_progresso=...)
+
+`mapear` usa o mesmo formato de lotes.mapear_em_lotes (a função recebe uma lista e
+devolve uma lista) e informa o progresso a cada lote concluído. Com processos, a
+função precisa ser de nível de módulo. Uma tarefa enviada com a chave de outra
+ainda em andamento é unida a ela (os callbacks novos são acrescentados); com
+substituir=True a anterior é cancelada.
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from instrumentacao import ATIVA, registrar
+
+INTERVALO_MS = 16   # Um quadro a 60 fps
+ORCAMENTO = 0.008   # Segundos de callbacks por consulta da fila, para sobrar tempo para o desenho
+
+_pools = {}
+_trava = threading.Lock()
+
+
+def pool(processos=False):
+    """Pool compartilhado, criado no primeiro uso"""
+    tipo = "processos" if processos else "threads"
+    with _trava:
+        executor = _pools.get(tipo)
+        if executor is None:
+            executor = ProcessPoolExecutor() if processos else ThreadPoolExecutor(thread_name_prefix="tarefas")
+            _pools[tipo] = executor
+    return executor
+
+
+class Tarefa:
+    """Uma tarefa em andamento, com os callbacks de quem pediu"""
+
+    def __init__(self, chave):
+        self.chave = chave
+        self.callbacks = {"concluida": [], "erro": [], "parcial": [], "progresso": []}
+        self.futuros = set()
+        self.cancelada = False
+        self.lotes = None       # Só em mapear: gerador dos lotes ainda não enviados
+        self.funcao = self.pool = None
+        self.pendentes = 0
+        self.esgotada = False
+        self.feitos = 0
+        self.total = None
+        self.inicio = time.perf_counter()
+
+    def juntar(self, ao_concluir=None, ao_falhar=None, ao_parcial=None, ao_progresso=None):
+        for evento, callback in (("concluida", ao_concluir), ("erro", ao_falhar),
+                                 ("parcial", ao_parcial), ("progresso", ao_progresso)):
+            if callback is not None:
+                self.callbacks[evento].append(callback)
+
+    def emitir(self, evento, *args):
+        for callback in self.callbacks[evento]:
+            callback(*args)
+
+    def cancelar(self):
+        """Descarta os lotes que não começaram; os que já estão rodando terminam, mas o resultado é ignorado"""
+        self.cancelada = True
+        for futuro in list(self.futuros):
+            futuro.cancel()
+
+    @property
+    def ativa(self):
+        return not self.cancelada and not (self.esgotada and not self.futuros)
+
+
+class ExecutorTarefas:
+    """Envia trabalho ao pool e entrega os resultados na thread do Tk da `janela`"""
+
+    def __init__(self, janela, intervalo_ms=INTERVALO_MS, orcamento=ORCAMENTO):
+        self.janela = janela
+        self.intervalo_ms = intervalo_ms
+        self.orcamento = orcamento
+        self.fila = queue.SimpleQueue()
+        self.tarefas = {}   # chave -> Tarefa em andamento
+        self.agendado = None
+
+    def em_andamento(self, chave):
+        tarefa = self.tarefas.get(chave)
+        return tarefa is not None and tarefa.ativa
+
+    def nova(self, chave, substituir, callbacks):
+        """Devolve (tarefa, criada): a tarefa em andamento com a mesma chave, ou uma nova"""
+        existente = self.tarefas.get(chave)
+        if existente is not None and existente.ativa:
+            if not substituir:
+                existente.juntar(**callbacks)
+                return existente, False
+            existente.cancelar()
+        tarefa = self.tarefas[chave] = Tarefa(chave)
+        tarefa.juntar(**callbacks)
+        return tarefa, True
+
+    def enviar(self, chave, funcao, *args, processos=False, substituir=False, ao_concluir=None, ao_falhar=None):
+        """Executa funcao(*args) no pool; ao_concluir recebe o resultado na thread do Tk"""
+        tarefa, criada = self.nova(chave, substituir, {"ao_concluir": ao_concluir, "ao_falhar": ao_falhar})
+        if criada:
+            tarefa.esgotada = True
+            self.acompanhar(tarefa, pool(processos).submit(funcao, *args), 0)
+        return tarefa
+
+    def mapear(self, chave, funcao, itens, tamanho_lote=64, pendentes=None, total=None, processos=False,
+               substituir=False, ao_concluir=None, ao_falhar=None, ao_parcial=None, ao_progresso=None):
+        """Aplica funcao a lotes de itens; ao_parcial recebe a lista de cada lote, ao_progresso (feitos, total)
+
+        No máximo `pendentes` lotes ficam no pool ao mesmo tempo, e os itens são tirados
+        do iterável aos poucos, na thread do Tk, conforme os lotes terminam.
+        """
+        tarefa, criada = self.nova(chave, substituir, {"ao_concluir": ao_concluir, "ao_falhar": ao_falhar,
+                                                       "ao_parcial": ao_parcial, "ao_progresso": ao_progresso})
+        if criada:
+            iterador = iter(itens)
+            tarefa.lotes = iter(lambda: list(islice(iterador, tamanho_lote)), [])
+            tarefa.total = total
+            tarefa.funcao, tarefa.pool = funcao, pool(processos)
+            tarefa.pendentes = pendentes or 2 * (os.cpu_count() or 1)
+            self.alimentar(tarefa)
+        return tarefa
+
+    def cancelar(self, chave):
+        tarefa = self.tarefas.pop(chave, None)
+        if tarefa is not None:
+            tarefa.cancelar()
+
+    def encerrar(self):
+        """Cancela tudo e para de consultar a fila (chamar ao destruir a janela)"""
+        for chave in list(self.tarefas):
+            self.cancelar(chave)
+        if self.agendado is not None:
+            self.janela.after_cancel(self.agendado)
+            self.agendado = None
+
+    def acompanhar(self, tarefa, futuro, quantidade):
+        tarefa.futuros.add(futuro)
+        futuro.add_done_callback(lambda feito: self.fila.put((tarefa, feito, quantidade)))
+        if self.agendado is None:
+            self.agendado = self.janela.after(self.intervalo_ms, self.consultar)
+
+    def alimentar(self, tarefa):
+        """Envia lotes até o limite de pendentes"""
+        while not tarefa.cancelada and not tarefa.esgotada and len(tarefa.futuros) < tarefa.pendentes:
+            lote = next(tarefa.lotes, None)
+            if lote is None:
+                tarefa.esgotada = True
+                break
+            self.acompanhar(tarefa, tarefa.pool.submit(tarefa.funcao, lote), len(lote))
+        if tarefa.esgotada and not tarefa.futuros and not tarefa.cancelada:
+            self.concluir(tarefa, tarefa.feitos)
+
+    def consultar(self):
+        """Entrega os resultados que chegaram, dentro do orçamento de tempo de um quadro"""
+        self.agendado = None
+        limite = time.perf_counter() + self.orcamento
+        try:
+            while time.perf_counter() < limite:
+                try:
+                    tarefa, futuro, quantidade = self.fila.get_nowait()
+                except queue.Empty:
+                    break
+                self.tratar(tarefa, futuro, quantidade)
+        finally:
+            # Reagenda mesmo se um callback falhar; sem tarefas, a fila deixa de ser consultada
+            pendentes = any(tarefa.futuros for tarefa in self.tarefas.values()) or not self.fila.empty()
+            if pendentes and self.agendado is None:
+                self.agendado = self.janela.after(self.intervalo_ms, self.consultar)
+
+    def tratar(self, tarefa, futuro, quantidade):
+        tarefa.futuros.discard(futuro)
+        if tarefa.cancelada or futuro.cancelled():
+            if not tarefa.futuros and self.tarefas.get(tarefa.chave) is tarefa:
+                del self.tarefas[tarefa.chave]
+            return
+        erro = futuro.exception()
+        if erro is not None:
+            tarefa.cancelar()
+            self.tarefas.pop(tarefa.chave, None)
+            tarefa.emitir("erro", erro)
+            return
+        if tarefa.lotes is None:
+            self.concluir(tarefa, futuro.result())
+            return
+        tarefa.feitos += quantidade
+        try:
+            tarefa.emitir("parcial", futuro.result())
+            tarefa.emitir("progresso", tarefa.feitos, tarefa.total)
+        except Exception as erro:
+            # Sem isso a tarefa ficaria parada em self.tarefas e absorveria os próximos pedidos com a mesma chave
+            tarefa.cancelar()
+            if self.tarefas.get(tarefa.chave) is tarefa:
+                del self.tarefas[tarefa.chave]
+            if not tarefa.callbacks["erro"]:
+                raise
+            tarefa.emitir("erro", erro)
+            return
+        self.alimentar(tarefa)
+
+    def concluir(self, tarefa, resultado):
+        if self.tarefas.get(tarefa.chave) is tarefa:
+            del self.tarefas[tarefa.chave]
+        if ATIVA:
+            registrar(f"tarefa.{tarefa.chave}", time.perf_counter() - tarefa.inicio)
+        tarefa.emitir("concluida", resultado)
@@ -0,0 +1,40 @@
+"""Partes da suíte de benchmarks que não precisam medir nada."""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RAIZ, "benchmarks"))
+
+import executar_benchmarks  # noqa: E402
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_importacao_que_falha_e_pulada(self):
+        aviso = io.StringIO()
+        with contextlib.redirect_stderr(aviso):
+            self.assertIsNone(executar_benchmarks.tempo_importacao("modulo_que_nao_existe", repeticoes=1))
+        self.assertIn("medida pulada", aviso.getvalue())
+
+    def test_comparar(self):
+        regressoes = executar_benchmarks.comparar({"a": 1.3, "b": 1.2, "c": 5.0}, {"a": 1.0, "b": 1.0}, 0.25)
+        self.assertEqual(regressoes, [("a", 1.0, 1.3)])
+
+    def test_sem_baseline_falha(self):
+        with tempfile.TemporaryDirectory() as pasta, \
+                mock.patch.object(executar_benchmarks, "tempo_importacao", return_value=1.0), \
+                mock.patch.object(executar_benchmarks, "benchmarks_consultas"), \
+                contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            argumentos = ["--sem-interface", "-o", os.path.join(pasta, "r.json"), "--baseline", os.path.join(pasta, "b.json")]
+            self.assertEqual(executar_benchmarks.main(argumentos), 1)
+            self.assertEqual(executar_benchmarks.main(argumentos + ["--salvar-baseline"]), 0)
+            self.assertEqual(executar_benchmarks.main(argumentos), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
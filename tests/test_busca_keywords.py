@@ -0,0 +1,34 @@
+"""Ranqueamento da busca de keywords."""
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from busca_keywords import IndiceBusca  # noqa: E402
+from nucleo import keywords  # noqa: E402
+
+
+class TestBusca(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.indice = IndiceBusca(keywords)
+
+    def test_nome_exato_primeiro(self):
+        self.assertEqual(self.indice.buscar("force")[0], "FORCE")
+        self.assertEqual(self.indice.buscar("lbfgs")[0], "LBFGS")
+
+    def test_consulta_vazia_devolve_todas(self):
+        self.assertEqual(len(self.indice.buscar("")), len(keywords))
+
+    def test_resultado_nao_altera_o_cache(self):
+        primeiro = self.indice.buscar("force")
+        esperado = list(primeiro)
+        primeiro.clear()
+        self.assertEqual(self.indice.buscar("force"), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Cobertura vetorizada de fórmulas pelos métodos (precisa do NumPy)."""
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    cobertura = None
+else:
+    import cobertura
+    from nucleo import methods_supporting
+
+
+@unittest.skipIf(cobertura is None, "NumPy não instalado")
+class TestCobertura(unittest.TestCase):
+
+    def cobrir(self, formulas, tamanho=100_000):
+        blocos = list(cobertura.blocos_de_formulas(formulas, tamanho))
+        return [linha for bloco in blocos for linha in zip(bloco.mascaras, bloco.cobertura, bloco.primeiro)]
+
+    def test_igual_a_methods_supporting(self):
+        formulas = ["C6H6", "Fe2O3", "H2O", "C6H6", "LaCl3", "PtP2C4H12"]
+        for formula, (mascara, linha, primeiro) in zip(formulas, self.cobrir(formulas)):
+            simbolos = {simbolo for simbolo, _ in cobertura.ELEMENTO.findall(formula)}
+            esperados = list(methods_supporting(simbolos))
+            obtidos = [metodo for metodo, coberto in zip(cobertura.metodos, linha) if coberto]
+            self.assertEqual(obtidos, esperados, formula)
+            self.assertEqual(int(mascara), sum(1 << i for i, coberto in enumerate(linha) if coberto))
+            self.assertEqual(primeiro, cobertura.metodos.index(esperados[0]) if esperados else -1)
+
+    def test_formula_vazia_ou_desconhecida_nao_e_coberta(self):
+        for formula in ("", "Xx2", "C6H6Qq"):
+            mascara, linha, primeiro = self.cobrir([formula])[0]
+            self.assertEqual(int(mascara), 0, formula)
+            self.assertFalse(linha.any())
+            self.assertEqual(primeiro, -1)
+
+    def test_blocos_pequenos_dao_o_mesmo_resultado(self):
+        formulas = [f"C{i % 7 + 1}H{i % 5 + 1}" for i in range(50)] + ["Fe", ""]
+        grandes = [(int(m), p) for m, _, p in self.cobrir(formulas)]
+        pequenos = [(int(m), p) for m, _, p in self.cobrir(formulas, tamanho=3)]
+        self.assertEqual(grandes, pequenos)
+
+    def test_estatisticas(self):
+        estatisticas = cobertura.EstatisticasCobertura()
+        for bloco in cobertura.blocos_de_formulas(["C6H6", "", "H2O"]):
+            estatisticas.atualizar(bloco)
+        dados = estatisticas.como_dict()
+        self.assertEqual((dados["total"], dados["sem_metodo"]), (3, 1))
+        primeiro = dados["metodos"][cobertura.metodos[0]]["primeiro_que_cobre"]
+        self.assertEqual(primeiro, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
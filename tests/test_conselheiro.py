@@ -0,0 +1,44 @@
+"""Regras de conselho de método e keywords."""
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from conselheiro import aconselhar, conselho_de_metodo  # noqa: E402
+from nucleo import methods_supporting  # noqa: E402
+from validador_keywords import validar  # noqa: E402
+
+
+def ids(conselhos):
+    return [conselho["id"] for conselho in conselhos]
+
+
+class TestConselheiro(unittest.TestCase):
+
+    def test_precise_em_force(self):
+        sugeridas, conselhos = aconselhar(["PM7", "PRECISE", "FORCE"], {"C", "H"}, 8)
+        self.assertEqual(ids(conselhos), ["precise_force"])
+        self.assertEqual(sugeridas, "PM7 FORCE")
+
+    def test_sistema_organico_grande(self):
+        sugeridas, conselhos = aconselhar(["PM7", "PULAY", "GNORM=1"], {"C", "H", "N", "O"}, 800)
+        self.assertEqual(ids(conselhos)[:1], ["mozyme"])
+        self.assertIn("MOZYME", sugeridas.split())
+        self.assertNotIn("PULAY", sugeridas.split())
+        self.assertFalse([p for p in validar(sugeridas) if p["severidade"] == "erro"])
+
+    def test_metodo_que_nao_cobre(self):
+        suportados = methods_supporting({"C", "La"})
+        naocobre = next(metodo for metodo in ("MNDO", "AM1", "PM3", "RM1") if metodo not in suportados)
+        conselho = conselho_de_metodo(naocobre, {"C", "La"})
+        self.assertEqual(list(conselho["alternativas"]), list(suportados))
+        self.assertIsNone(conselho_de_metodo(suportados[0], {"C", "La"}))
+
+    def test_deck_pequeno_sem_conselhos(self):
+        self.assertEqual(aconselhar(["PM7"], {"C", "H"}, 5), ("PM7", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
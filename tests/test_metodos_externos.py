@@ -0,0 +1,148 @@
+"""Métodos externos (metodos/*.json): o índice incremental tem de bater com build_index().
+
+Uso:
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import nucleo  # noqa: E402
+
+
+def retrato():
+    """Cópia do índice e das máscaras, para comparar com o que build_index() monta"""
+    indice = {simbolo: [(metodo, dict(elemento)) for metodo, elemento in pares]
+              for simbolo, pares in nucleo.element_index.items()}
+    return indice, dict(nucleo.method_masks), list(nucleo.methods_data)
+
+
+class TestMetodosExternos(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.watcher = nucleo.MethodWatcher(self.pasta)
+        self.original = {metodo: list(entradas) for metodo, entradas in nucleo.methods_data.items()}
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta)
+        self.watcher.check()  # Arquivos apagados: os métodos externos saem e os embutidos voltam
+        self.assertEqual(nucleo.methods_data, self.original)
+        self.assertIndiceConsistente()
+
+    def escrever(self, nome, conteudo):
+        caminho = os.path.join(self.pasta, nome)
+        anterior = os.stat(caminho).st_mtime_ns if os.path.exists(caminho) else None
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo if isinstance(conteudo, str) else json.dumps(conteudo))
+        if anterior is not None:
+            # Garante que o mtime mude mesmo em sistemas de arquivos com pouca resolução
+            os.utime(caminho, ns=(anterior + 1_000_000_000, anterior + 1_000_000_000))
+        return caminho
+
+    def assertIndiceConsistente(self):
+        incremental = retrato()
+        nucleo.build_index()
+        self.assertEqual(incremental, retrato())
+        self.assertEqual(nucleo.methods_for_mask(nucleo.element_bits["H"]),
+                         tuple(m for m, mascara in nucleo.method_masks.items() if mascara & nucleo.element_bits["H"]))
+
+    def simbolos(self, metodo):
+        return [elemento["symbol"] for elemento in nucleo.methods_data[metodo]]
+
+    def test_incremental_igual_a_build_index(self):
+        self.escrever("novo.json", {"name": "TESTE1", "symbols": ["H", "C", "Fe"]})
+        self.escrever("variante.json", {"name": "TESTE2", "base": "TESTE1", "remove": ["Fe"], "add": ["Co"]})
+        self.escrever("pm6.json", {"name": "PM6", "base": "PM6", "remove": ["H"]})
+        self.assertEqual(set(self.watcher.check()), {"TESTE1", "TESTE2", "PM6"})
+        self.assertEqual(self.simbolos("TESTE2"), ["H", "C", "Co"])
+        self.assertNotIn("H", self.simbolos("PM6"))
+        self.assertIndiceConsistente()
+
+        # A base muda e a variante acompanha
+        self.escrever("novo.json", {"name": "TESTE1", "symbols": ["H", "N"]})
+        self.assertEqual(set(self.watcher.check()), {"TESTE1", "TESTE2"})
+        self.assertEqual(self.simbolos("TESTE2"), ["H", "N", "Co"])
+        self.assertIndiceConsistente()
+
+        # O arquivo passa a definir outro método
+        self.escrever("novo.json", {"name": "TESTE3", "symbols": ["O"]})
+        self.watcher.check()
+        self.assertNotIn("TESTE1", nucleo.methods_data)
+        self.assertIndiceConsistente()
+
+        os.remove(os.path.join(self.pasta, "pm6.json"))
+        self.assertIn("PM6", self.watcher.check())
+        self.assertEqual(nucleo.methods_data["PM6"], self.original["PM6"])
+        self.assertIndiceConsistente()
+
+    def test_definicao_que_nao_e_objeto(self):
+        caminho = self.escrever("lista.json", ["PM6"])
+        outro = self.escrever("texto.json", '"PM6"')
+        self.assertEqual(self.watcher.check(), [])
+        self.assertIn(caminho, self.watcher.errors)
+        self.assertIn(outro, self.watcher.errors)
+        self.assertEqual(nucleo.methods_data, self.original)
+
+    def test_erro_num_arquivo_nao_impede_os_outros(self):
+        ruim = self.escrever("ruim.json", {"name": "RUIM", "symbols": 5})
+        self.escrever("bom.json", {"name": "BOM", "symbols": ["H"]})
+        self.assertEqual(self.watcher.check(), ["BOM"])
+        self.assertIn(ruim, self.watcher.errors)
+
+    def test_elements_normalizados(self):
+        self.escrever("elementos.json", {"name": "TESTE1", "elements": [
+            {"symbol": "Fe"}, {"symbol": "Cm", "name": "Curium"}, {"symbol": "H", "name": ""}]})
+        self.watcher.check()
+        self.assertEqual(nucleo.methods_data["TESTE1"][0], {"symbol": "Fe", "name": "Iron", "atomic_number": 26})
+        self.assertEqual(nucleo.methods_data["TESTE1"][1]["atomic_number"], 96)
+        self.assertEqual(nucleo.methods_data["TESTE1"][2]["name"], "Hydrogen")
+        self.assertIn("TESTE1: Fe (Iron", nucleo.element_info_text("Fe"))
+        self.assertIndiceConsistente()
+
+    def test_elements_invalidos(self):
+        for nome, elementos in (("desconhecido", [{"symbol": "Zz"}]), ("sem_simbolo", [{"name": "Iron"}]),
+                                ("texto", ["Fe"])):
+            caminho = self.escrever(f"{nome}.json", {"name": nome.upper(), "elements": elementos})
+            self.watcher.check()
+            self.assertIn(caminho, self.watcher.errors)
+            self.assertNotIn(nome.upper(), nucleo.methods_data)
+
+    def test_base_em_outro_arquivo_externo(self):
+        # A variante é lida antes ou depois da base, conforme a ordem do diretório
+        self.escrever("a.json", {"name": "A-DER", "base": "Z-BASE", "remove": ["H"]})
+        self.escrever("z.json", {"name": "Z-BASE", "base": "PM6"})
+        self.assertEqual(set(self.watcher.check()), {"A-DER", "Z-BASE"})
+        self.assertEqual(self.watcher.errors, {})
+        self.assertEqual(self.simbolos("A-DER"), [s for s in self.simbolos("PM6") if s != "H"])
+        self.assertEqual(self.watcher.check(), [])
+        self.assertIndiceConsistente()
+
+        # A base some: a variante fica com erro e volta quando a base reaparece
+        os.remove(os.path.join(self.pasta, "z.json"))
+        self.watcher.check()
+        self.assertIn(os.path.join(self.pasta, "a.json"), self.watcher.errors)
+        self.escrever("z.json", {"name": "Z-BASE", "symbols": ["C"]})
+        self.assertEqual(set(self.watcher.check()), {"A-DER", "Z-BASE"})
+        self.assertEqual(self.simbolos("A-DER"), ["C"])
+        self.assertIndiceConsistente()
+
+    def test_base_propria_nao_acumula_edicoes(self):
+        self.escrever("pm6.json", {"name": "PM6", "base": "PM6", "add": ["Cm"]})
+        self.watcher.check()
+        self.assertIn("Cm", self.simbolos("PM6"))
+        self.escrever("pm6.json", {"name": "PM6", "base": "PM6", "add": ["Am"]})
+        self.watcher.check()
+        self.assertIn("Am", self.simbolos("PM6"))
+        self.assertNotIn("Cm", self.simbolos("PM6"))
+        self.assertIndiceConsistente()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Leitura de saídas .out/.arc do MOPAC."""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from saida_mopac import ler_atomo, ler_lote, ler_saida  # noqa: E402
+from seguidor_saidas import EstadoJob  # noqa: E402
+
+SAIDA = """ PM7 PRECISE
+ CYCLE:     1 TIME:   0.10 TIME LEFT:  2.00D  GRAD.:    10.123 HEAT:  -12.3456
+ CYCLE:     2 TIME:   0.10 TIME LEFT:  2.00D  GRAD.:     2.500 HEAT:  -13.5000
+ CYCLE:     3 TIME:   0.10 TIME LEFT:  2.00D  GRAD.:     0.900 HEAT:  -13.2000
+
+          FINAL HEAT OF FORMATION =        -13.20000 KCAL/MOL
+          GRADIENT NORM           =          0.90000
+
+                             CARTESIAN COORDINATES
+
+   NO.       ATOM               X         Y         Z
+
+     1       C          0.0000    0.0000    0.0000
+     2       H          1.0900    0.0000    0.0000
+
+ TOTAL CPU TIME:             0.20 SECONDS
+"""
+
+
+class TestSaida(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta)
+
+    def escrever(self, nome, conteudo):
+        caminho = os.path.join(self.pasta, nome)
+        with open(caminho, "w", encoding="latin-1") as arquivo:
+            arquivo.write(conteudo)
+        return caminho
+
+    def test_ciclos_final_e_geometria(self):
+        resultado = ler_saida(self.escrever("job.out", SAIDA))
+        self.assertEqual(resultado["ciclo_numero"], [1, 2, 3])
+        self.assertEqual(resultado["ciclo_gnorm"], [10.123, 2.5, 0.9])
+        self.assertEqual(resultado["hf_final"], -13.2)
+        self.assertEqual(resultado["gnorm_final"], 0.9)
+        self.assertEqual(resultado["hf_minimo"], -13.5)
+        self.assertTrue(resultado["melhor_nao_ultimo"])
+        self.assertEqual(resultado["atomos"], [("C", 0.0, 0.0, 0.0), ("H", 1.09, 0.0, 0.0)])
+
+    def test_arquivo_vazio_vira_erro_no_lote(self):
+        caminho = self.escrever("vazio.out", "")
+        self.assertEqual(ler_lote([caminho]), [{"arquivo": caminho, "erro": "arquivo vazio"}])
+
+    def test_ler_atomo(self):
+        self.assertEqual(ler_atomo("C 0.5 +1 -1.0D0 +1 2.0 +1"), ("C", 0.5, -1.0, 2.0))
+        self.assertEqual(ler_atomo("  3  Cl  1.0 2.0 3.0"), ("Cl", 1.0, 2.0, 3.0))
+        self.assertIsNone(ler_atomo("NO. ATOM X Y Z"))
+
+    def test_alertas_do_monitor(self):
+        estado = EstadoJob("job", ciclos_estagnado=3)
+        linhas = [linha.encode() for linha in SAIDA.splitlines()]
+        alertas = estado.processar(linhas[:4])
+        self.assertEqual(len(alertas), 1)
+        self.assertIn("hf_subiu", estado.alertas)
+        estado.processar(linhas[4:])
+        self.assertEqual(estado.hf_final, -13.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Serviço local de consultas: validação das requisições."""
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from nucleo import methods_supporting  # noqa: E402
+from servico_consultas import MAXIMO_CORPO, ErroHTTP, ServicoConsultas, consultar_lote, tamanho_do_corpo  # noqa: E402
+
+
+async def trocar(requisicao):
+    """Sobe o serviço numa porta livre, envia a requisição e devolve (status, corpo JSON)"""
+    servico = ServicoConsultas(16)
+    servidor = await asyncio.start_server(servico.atender, "127.0.0.1", 0)
+    porta = servidor.sockets[0].getsockname()[1]
+    async with servidor:
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+        escritor.write(requisicao)
+        dados = await asyncio.wait_for(leitor.read(), 5)
+        escritor.close()
+    cabecalho, _, corpo = dados.partition(b"\r\n\r\n")
+    return int(cabecalho.split()[1]), json.loads(corpo)
+
+
+class TestServico(unittest.TestCase):
+
+    def test_lote(self):
+        resposta = consultar_lote({"moleculas": ["C,H,O", ["Fe", "C"]], "keywords": []})
+        self.assertEqual(resposta["moleculas"], [list(methods_supporting({"C", "H", "O"})),
+                                                 list(methods_supporting({"Fe", "C"}))])
+
+    def test_lote_com_tipos_errados(self):
+        for pedido in ([], {"moleculas": "C"}, {"moleculas": [5]}, {"elementos": "Fe"}, {"keywords": [1]}):
+            with self.assertRaises(ErroHTTP) as contexto:
+                consultar_lote(pedido)
+            self.assertEqual(contexto.exception.status, 400)
+
+    def test_tamanho_do_corpo(self):
+        self.assertEqual(tamanho_do_corpo({}), 0)
+        self.assertEqual(tamanho_do_corpo({"content-length": "12"}), 12)
+        for valor, status in (("abc", 400), ("-5", 400), ("²", 400), (str(MAXIMO_CORPO + 1), 413)):
+            with self.assertRaises(ErroHTTP) as contexto:
+                tamanho_do_corpo({"content-length": valor})
+            self.assertEqual(contexto.exception.status, status)
+
+    def test_conexao_recebe_resposta(self):
+        status, corpo = asyncio.run(trocar(b"POST /lote HTTP/1.1\r\nContent-Length: abc\r\n\r\n{}"))
+        self.assertEqual(status, 400)
+        corpo_pedido = json.dumps({"moleculas": 5}).encode()
+        status, corpo = asyncio.run(trocar(b"POST /lote HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s"
+                                           % (len(corpo_pedido), corpo_pedido)))
+        self.assertEqual(status, 400)
+        self.assertIn("moleculas", corpo["erro"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Corretor de keywords digitadas errado."""
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from importacao_tardia import preaquecer  # noqa: E402
+import sugestoes_keywords  # noqa: E402
+from sugestoes_keywords import CorretorKeywords, distancia_edicao, separar_token  # noqa: E402
+
+
+class TestCorretor(unittest.TestCase):
+
+    def setUp(self):
+        self.corretor = CorretorKeywords(["GNORM=n.nn", "MOZYME", "PRECISE", "LET", "PM7"])
+
+    def test_corrige_preservando_o_valor(self):
+        self.assertEqual(self.corretor.corrigir("GNROM=0.5"), "GNORM=0.5")
+        self.assertEqual(self.corretor.corrigir("mozime"), "MOZYME")
+        self.assertEqual(self.corretor.corrigir("LTE(20)"), "LET(20)")
+
+    def test_nada_proximo(self):
+        self.assertIsNone(self.corretor.corrigir("XYZZYQ"))
+        self.assertEqual(self.corretor.sugerir("PM7"), (("PM7", 0),))
+
+    def test_distancia_e_tokens(self):
+        self.assertEqual(distancia_edicao("GNORM", "GNROM", 3), 1)  # Transposição conta como um erro
+        self.assertEqual(distancia_edicao("ABCDEFGH", "A", 2), 3)   # Para no limite + 1
+        self.assertEqual(separar_token("let(20)"), ("LET", "(20)"))
+
+    def test_preaquecimento_monta_o_corretor_padrao(self):
+        sugestoes_keywords._corretor = None
+        preaquecer(()).join()
+        corretor = sugestoes_keywords._corretor
+        self.assertIsNotNone(corretor)
+        self.assertIs(sugestoes_keywords.corretor_padrao(), corretor)
+
+
+if __name__ == "__main__":
+    unittest.main()
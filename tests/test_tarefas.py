@@ -0,0 +1,81 @@
+"""ExecutorTarefas com uma janela falsa, sem Tk."""
+import os
+import sys
+import time
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from tarefas import ExecutorTarefas  # noqa: E402
+
+
+class JanelaFalsa:
+    """Guarda os after() e os roda quando o teste pede, como o mainloop faria"""
+
+    def __init__(self):
+        self.agendados = []
+
+    def after(self, intervalo, funcao):
+        self.agendados.append(funcao)
+        return len(self.agendados)
+
+    def after_cancel(self, identificador):
+        pass
+
+    def rodar(self, condicao, limite=5.0):
+        fim = time.perf_counter() + limite
+        while not condicao() and time.perf_counter() < fim:
+            time.sleep(0.005)
+            agendados, self.agendados = self.agendados, []
+            for funcao in agendados:
+                funcao()
+
+
+def dobrar(lote):
+    return [2 * item for item in lote]
+
+
+class TestTarefas(unittest.TestCase):
+
+    def setUp(self):
+        self.janela = JanelaFalsa()
+        self.tarefas = ExecutorTarefas(self.janela)
+
+    def test_mapear_com_progresso(self):
+        parciais, progresso, concluidas = [], [], []
+        self.tarefas.mapear("dobro", dobrar, range(10), tamanho_lote=3, pendentes=2, total=10,
+                            ao_parcial=parciais.extend, ao_progresso=lambda feitos, total: progresso.append(feitos),
+                            ao_concluir=concluidas.append)
+        self.janela.rodar(lambda: concluidas)
+        self.assertEqual(sorted(parciais), [2 * i for i in range(10)])
+        self.assertEqual(progresso[-1], 10)
+        self.assertEqual(concluidas, [10])
+        self.assertFalse(self.tarefas.em_andamento("dobro"))
+
+    def test_pedidos_iguais_sao_unidos(self):
+        resultados = []
+        primeira = self.tarefas.enviar("soma", sum, [1, 2, 3], ao_concluir=resultados.append)
+        segunda = self.tarefas.enviar("soma", sum, [1, 2, 3], ao_concluir=resultados.append)
+        self.assertIs(primeira, segunda)
+        self.janela.rodar(lambda: len(resultados) == 2)
+        self.assertEqual(resultados, [6, 6])
+
+    def test_callback_com_erro_libera_a_chave(self):
+        erros, concluidas = [], []
+
+        def falhar(lote):
+            raise RuntimeError("callback")
+
+        self.tarefas.mapear("k", dobrar, range(6), tamanho_lote=2, ao_parcial=falhar, ao_falhar=erros.append)
+        self.janela.rodar(lambda: erros)
+        self.assertEqual([str(erro) for erro in erros], ["callback"])
+        self.assertFalse(self.tarefas.em_andamento("k"))
+
+        self.tarefas.mapear("k", dobrar, range(4), tamanho_lote=2, ao_concluir=concluidas.append)
+        self.janela.rodar(lambda: concluidas)
+        self.assertEqual(concluidas, [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
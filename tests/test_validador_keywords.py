@@ -0,0 +1,44 @@
+"""Regras do validador de linhas de keywords."""
+import os
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from validador_keywords import analisar_linha, validar  # noqa: E402
+
+
+def severidades(linha):
+    return {(p["tipo"], p["severidade"]) for p in validar(linha)}
+
+
+class TestValidador(unittest.TestCase):
+
+    def test_keywords_validas(self):
+        self.assertEqual(validar("PM7 THREADS=4 CYCLES=200 NOINTER PRTXYZ"), [])
+        self.assertEqual(validar('PM7 EXTERNAL=params.txt "GEO_DAT=a b.xyz"'), [])
+
+    def test_erro_de_digitacao_e_erro(self):
+        problemas = validar("PM7 GNROM=0.5 MOZIME")
+        self.assertEqual([p["severidade"] for p in problemas], ["erro", "erro"])
+        self.assertEqual([p["sugestao"] for p in problemas], ["GNORM=0.5", "MOZYME"])
+
+    def test_desconhecida_sem_nome_proximo_e_aviso(self):
+        self.assertEqual(severidades("PM7 XYZZYQ"), {("desconhecida", "aviso")})
+
+    def test_conflito_e_valores(self):
+        self.assertIn(("conflito", "erro"), severidades("PM7 MOZYME PULAY"))
+        self.assertIn(("numerica", "erro"), severidades("PM7 GNORM=abc"))
+        self.assertIn(("minimo", "aviso"), severidades("PM7 GNORM=0.001"))
+        self.assertEqual(validar("PM7 GNORM=1.D-1"), [])
+
+    def test_analisar_linha(self):
+        lidas = analisar_linha("pm7 LET(20) GNORM=0.1 + CHARGE=-1")
+        self.assertEqual([k.nome for k in lidas], ["PM7", "LET", "GNORM", "CHARGE"])
+        self.assertEqual(lidas[1].argumento, "20")
+        self.assertEqual(lidas[3].valor, "-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
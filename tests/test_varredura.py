@@ -0,0 +1,67 @@
+"""Geração de decks da varredura método x keywords."""
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from varredura import combinacoes, filtrar_combinacoes, gerar_lote, juntar_estado, main  # noqa: E402
+
+
+class TestVarredura(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta)
+
+    def geometria(self, nome, conteudo):
+        caminho = os.path.join(self.pasta, nome)
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+        return caminho
+
+    def test_combinacoes(self):
+        geradas = list(combinacoes([["PRECISE", "GNORM=0.01"], ["PULAY", ""]], "CHARGE=0"))
+        self.assertEqual([rotulo for rotulo, _ in geradas], ["PRECISE_PULAY", "PRECISE", "GNORM0.01_PULAY", "GNORM0.01"])
+        validas, descartadas = filtrar_combinacoes(combinacoes([["LBFGS", "EF"], ["BFGS", ""]]))
+        self.assertEqual([rotulo for rotulo, _ in descartadas], ["LBFGS_BFGS"])
+        self.assertEqual(len(validas), 3)
+
+    def test_juntar_estado(self):
+        estado = ("CHARGE=1", "UHF", "DOUBLET")
+        self.assertEqual(juntar_estado(("PULAY",), estado), (("PULAY", "CHARGE=1", "UHF", "DOUBLET"), []))
+        self.assertEqual(juntar_estado(("CHARGE=1",), estado)[1], [])
+        self.assertEqual(juntar_estado(("CHARGE=0",), estado)[1], ["CHARGE=1"])
+        self.assertEqual(juntar_estado(("TRIPLET",), estado)[1], ["DOUBLET"])
+
+    def test_decks_mantem_carga_e_spin(self):
+        caminho = self.geometria("cation.mop", "PM7 CHARGE=1 UHF DOUBLET\nt\n\nC 0 0 0\nH 1 0 0\n\n")
+        saida = os.path.join(self.pasta, "saida")
+        os.makedirs(os.path.join(saida, "PM7"))
+        resultados = gerar_lote([(0, caminho)], ["PM7"], [("PULAY", ("PULAY",)), ("neutro", ("CHARGE=0",))], saida)
+        gerado, pulado = resultados
+        with open(gerado["arquivo"], encoding="utf-8") as arquivo:
+            self.assertEqual(arquivo.readline().split(), ["PM7", "PULAY", "CHARGE=1", "UHF", "DOUBLET"])
+        self.assertEqual(pulado["combinacao"], "neutro")
+        self.assertIn("pulado", pulado)
+
+    def test_main_grava_manifesto(self):
+        self.geometria("agua.xyz", "3\nagua\nO 0 0 0\nH 1 0 0\nH 0 1 0\n")
+        saida = os.path.join(self.pasta, "saida")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main([self.pasta, "-o", saida, "-m", "PM7", "-k", "PULAY|", "-j", "1"]), 0)
+        with open(os.path.join(saida, "manifesto.jsonl"), encoding="utf-8") as manifesto:
+            linhas = [json.loads(linha) for linha in manifesto]
+        self.assertEqual(sorted(linha["keywords"] for linha in linhas), ["PM7", "PM7 PULAY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
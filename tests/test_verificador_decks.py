@@ -0,0 +1,74 @@
+"""Leitura de decks .mop/.xyz e verificação contra methods_data."""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from verificador_decks import ler_mop, ler_xyz, simbolo_do_atomo, verificar_deck  # noqa: E402
+
+
+class TestLeitura(unittest.TestCase):
+
+    def test_simbolo_do_atomo(self):
+        self.assertEqual(simbolo_do_atomo("C 0.0 1 0.0 1 0.0 1"), "C")
+        self.assertEqual(simbolo_do_atomo("  CB  0.0 0.0 0.0"), "C")
+        self.assertEqual(simbolo_do_atomo("cl 0.0 0.0 0.0"), "Cl")
+        self.assertEqual(simbolo_do_atomo("26 1.0 0 0"), "Fe")
+        self.assertEqual(simbolo_do_atomo("99 0.0 0.0 0.0"), "X")
+        self.assertIsNone(simbolo_do_atomo("1.5 0.0 0.0 0.0"))
+
+    def test_mop_com_numero_atomico(self):
+        geometria = []
+        palavras, simbolos = ler_mop(io.StringIO("PM7 CHARGE=1\ntitulo\n\n26 1.0 0 0\n8 0.0 0 0\n\n"), geometria)
+        self.assertEqual(palavras, ["PM7", "CHARGE=1"])
+        self.assertEqual(simbolos, {"Fe", "O"})
+        self.assertEqual(len(geometria), 2)
+
+    def test_linha_sem_elemento(self):
+        with self.assertRaises(ValueError):
+            ler_mop(io.StringIO("PM7\ntitulo\n\nC 0 0 0\n?? 1 1 1\n\n"))
+
+    def test_xyz_com_atomo_faltando(self):
+        with self.assertRaises(ValueError):
+            ler_xyz(io.StringIO("3\nPM6\nC 0 0 0\nH 1 0 0\n"))
+
+
+class TestVerificacao(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta)
+
+    def deck(self, nome, conteudo):
+        caminho = os.path.join(self.pasta, nome)
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+        return verificar_deck(caminho)
+
+    def test_deck_coberto(self):
+        resultado = self.deck("ok.mop", "PM6-D3H4\nt\n\nC 0 0 0\nH 1 0 0\n\n")
+        self.assertEqual(resultado["metodo"], "PM6")
+        self.assertTrue(resultado["ok"])
+
+    def test_metodo_desconhecido(self):
+        resultado = self.deck("mndod.mop", "MNDOD\nt\n\nC 0 0 0\n\n")
+        self.assertFalse(resultado["ok"])
+        self.assertEqual(resultado["metodo"], "MNDOD")
+        self.assertIn("método desconhecido: MNDOD", resultado["problemas"])
+
+    def test_deck_sem_atomos(self):
+        for nome, conteudo in (("vazio.mop", "PM7\nt\n\n\n"), ("ficticio.mop", "PM7\nt\n\nXX 0 0 0\n\n")):
+            resultado = self.deck(nome, conteudo)
+            self.assertFalse(resultado["ok"])
+            self.assertIn("deck sem átomos", resultado["problemas"])
+
+
+if __name__ == "__main__":
+    unittest.main()
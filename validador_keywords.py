@@ -0,0 +1,193 @@
+"""Validação de linhas de keywords do MOPAC contra a tabela de regras (regras_keywords.json).
+
+As regras foram tiradas das descrições em keywords.json; cada uma guarda a keyword
+de origem e o trecho que a justifica. Uma keyword desconhecida perto de um nome
+conhecido é um erro de digitação provável (erro, com a sugestão); se nada é
+próximo, pode ser uma keyword do MOPAC que falta na tabela, e fica como aviso.
+
+Uso:
+    python validador_keywords.py [ARQUIVO ...] [-o problemas.jsonl] [-j PROCESSOS] [--todas]
+
+Sem arquivos, lê as linhas do stdin. Cada linha com problema gera uma linha JSON.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache, partial
+from multiprocessing import freeze_support
+
+from lotes import mapear_em_lotes
+from nucleo import keywords, methods_data
+from sugestoes_keywords import CorretorKeywords
+
+REGRAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regras_keywords.json")
+
+Keyword = namedtuple("Keyword", "nome valor argumento texto")
+
+# Um token vai até o próximo espaço, mas mantém juntos trechos entre aspas ou parênteses
+TOKEN = re.compile(r'(?:"[^"]*"|\([^)]*\)|[^\s"(])+')
+CONTINUACAO = ("+", "&")
+
+
+def nome_base(nome):
+    """GNORM=n.nn -> GNORM"""
+    return nome.split("=")[0].upper()
+
+
+def numero(valor):
+    """Converte valores no estilo Fortran (1.D-9) para float, ou None"""
+    try:
+        return float(valor.upper().replace("D", "E"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def carregar_regras(caminho=REGRAS):
+    with open(caminho, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    conhecidas = {nome_base(nome) for nome in keywords} | set(methods_data) | set(dados["keywords_conhecidas"])
+    return dados["regras"], frozenset(conhecidas)
+
+
+regras, conhecidas = carregar_regras()
+conflitos = [(frozenset(regra["keywords"]), regra) for regra in regras if regra["tipo"] == "conflito"]
+limites = [regra for regra in regras if regra["tipo"] in ("minimo", "faixa")]
+numericas = {nome: regra for regra in regras if regra["tipo"] == "numerica" for nome in regra["keywords"]}
+inteiras = {nome: regra for regra in regras if regra["tipo"] == "argumento_inteiro" for nome in regra["keywords"]}
+corretor = CorretorKeywords(conhecidas)
+
+
+def analisar_linha(linha):
+    """Separa a linha em keywords, reconhecendo as formas KEY, KEY=valor e KEY(args)"""
+    resultado = []
+    for texto in TOKEN.findall(linha):
+        if texto in CONTINUACAO:
+            continue
+        nome, valor, argumento = texto, None, None
+        if len(nome) > 1 and nome[0] == nome[-1] == '"':
+            nome = nome[1:-1]  # Keyword inteira entre aspas, como "GEO_DAT=arquivo com espaço.xyz"
+        if "=" in nome:
+            nome, valor = nome.split("=", 1)
+        if "(" in nome:
+            nome, _, argumento = nome.partition("(")
+            argumento = argumento.rstrip(")")
+        resultado.append(Keyword(nome.upper(), valor, argumento, texto))
+    return resultado
+
+
+def conhecida(nome):
+    if nome in conhecidas:
+        return True
+    base = nome.split("-")[0]
+    return base in methods_data  # Variantes de método, como PM6-D3H4
+
+
+def problema(regra, keywords_envolvidas, mensagem=None):
+    return {
+        "tipo": regra["tipo"],
+        "severidade": regra["severidade"],
+        "keywords": keywords_envolvidas,
+        "mensagem": mensagem or regra["mensagem"],
+        "fonte": regra["fonte"],
+    }
+
+
+def validar(linha):
+    """Lista os problemas encontrados em uma linha de keywords"""
+    lidas = analisar_linha(linha)
+    por_nome = {keyword.nome: keyword for keyword in lidas}
+    presentes = por_nome.keys()
+    problemas = []
+
+    for keyword in lidas:
+        nome = keyword.nome
+        if not conhecida(nome):
+            desconhecida = {"tipo": "desconhecida", "severidade": "aviso", "keywords": [keyword.texto],
+                            "mensagem": f"Keyword desconhecida: {keyword.texto}"}
+            sugestao = corretor.corrigir(keyword.texto)  # Só devolve nomes dentro do limite de distância
+            if sugestao:
+                desconhecida["severidade"] = "erro"
+                desconhecida["sugestao"] = sugestao
+                desconhecida["mensagem"] += f" (você quis dizer {sugestao}?)"
+            problemas.append(desconhecida)
+        elif nome in numericas and numero(keyword.valor) is None:
+            regra = numericas[nome]
+            problemas.append(problema(regra, [keyword.texto], f"{nome} {regra['mensagem']}"))
+        elif nome in inteiras and keyword.argumento is not None and not keyword.argumento.strip().isdigit():
+            problemas.append(problema(inteiras[nome], [keyword.texto]))
+
+    for envolvidas, regra in conflitos:
+        if envolvidas <= presentes:
+            problemas.append(problema(regra, regra["keywords"]))
+
+    for regra in limites:
+        keyword = por_nome.get(regra["keyword"])
+        if keyword is None or any(exceto in presentes for exceto in regra.get("exceto", ())):
+            continue
+        valor = numero(keyword.valor)
+        if valor is not None and (valor < regra["minimo"] or valor > regra.get("maximo", valor)):
+            problemas.append(problema(regra, [keyword.texto]))
+    return problemas
+
+
+@lru_cache(maxsize=65536)
+def validar_em_cache(linha):
+    """validar() com cache: filas de jobs repetem muito as mesmas linhas de keywords"""
+    return validar(linha)
+
+
+def validar_lote(linhas, todas=False):
+    """Valida uma lista de (arquivo, número, linha) — unidade de trabalho do pool"""
+    resultados = []
+    for arquivo, numero_linha, linha in linhas:
+        problemas = validar_em_cache(linha.strip())
+        if problemas or todas:
+            resultados.append({"arquivo": arquivo, "linha": numero_linha, "keywords": linha.strip(), "problemas": problemas})
+    return resultados
+
+
+def ler_linhas(caminhos):
+    """Gera (arquivo, número, linha) de cada linha não vazia, sem carregar os arquivos inteiros"""
+    if not caminhos:
+        for numero_linha, linha in enumerate(sys.stdin, 1):
+            if linha.strip():
+                yield "-", numero_linha, linha
+        return
+    for caminho in caminhos:
+        with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+            for numero_linha, linha in enumerate(arquivo, 1):
+                if linha.strip():
+                    yield caminho, numero_linha, linha
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valida linhas de keywords do MOPAC (conflitos, valores e keywords desconhecidas).")
+    parser.add_argument("arquivos", nargs="*", help="arquivos com uma linha de keywords por linha (padrão: stdin)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON lines de saída (padrão: stdout)")
+    parser.add_argument("-j", "--processos", type=int, default=None, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument("--lote", type=int, default=5000, help="linhas por unidade de trabalho")
+    parser.add_argument("--todas", action="store_true", help="escreve também as linhas sem problemas")
+    args = parser.parse_args(argv)
+
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    com_erro = 0
+    try:
+        tarefa = partial(validar_lote, todas=args.todas)
+        for resultado in mapear_em_lotes(tarefa, ler_linhas(args.arquivos), args.processos, args.lote):
+            if any(p["severidade"] == "erro" for p in resultado["problemas"]):
+                com_erro += 1
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    print(f"{com_erro} linhas com erros.", file=sys.stderr)
+    return 1 if com_erro else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""Gera decks .mop para varreduras método x keywords sobre um conjunto de geometrias.
+
+Cada grupo (-k) é uma lista de alternativas separadas por "|"; as combinações são
+o produto dos grupos. Uma alternativa vazia desliga o grupo ("PULAY|" = com e sem
+PULAY). Combinações que o validador acusa como erro (conflitos, valores
+inválidos, keywords desconhecidas parecidas com uma conhecida) são descartadas antes
+de começar; keywords fora da tabela do validador sem nenhum nome próximo só geram
+um aviso no stderr (com --rigoroso, descartam a combinação). Um método
+só gera decks para as geometrias cujos elementos ele cobre.
+
+As keywords de estado da geometria de origem (CHARGE=, MS=, UHF e a multiplicidade,
+como DOUBLET) vão para todos os decks gerados a partir dela. Se a combinação define
+uma delas com outro valor, ou se a linha resultante tem erro no validador, o deck
+não é gerado e o motivo vai para o manifesto.
+
+Uso:
+    python varredura.py GEOMETRIAS... -o saida [-m PM6 -m PM7] -k "PRECISE|GNORM=0.01" -k "PULAY|" -k "LBFGS|EF"
+    python varredura.py pasta_xyz -o saida --grade grade.json
+
+grade.json: {"metodos": [...], "grupos": [["PRECISE", "GNORM=0.01"], ["PULAY", ""]], "fixas": "CHARGE=0"}
+
+Os decks vão para saida/<MÉTODO>/ e cada deck (ou combinação pulada) gera uma linha
+em saida/manifesto.jsonl. Os workers leem as geometrias e gravam os arquivos;
+nenhum deck fica na memória.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from functools import partial
+from itertools import product
+from multiprocessing import freeze_support
+
+from lotes import mapear_em_lotes
+from nucleo import element_bits, method_masks, methods_data, methods_supporting
+from validador_keywords import analisar_linha, validar, validar_em_cache
+from verificador_decks import ATOMOS_IGNORADOS, EXTENSOES, listar_decks, ler_mop, ler_xyz
+
+NAO_NOME = re.compile(r"[^A-Za-z0-9.+-]+")
+ESTADO = {"CHARGE", "MS", "UHF"}
+MULTIPLICIDADES = {"SINGLET", "DOUBLET", "TRIPLET", "QUARTET", "QUINTET", "SEXTET", "SEPTET", "OCTET", "NONET"}
+
+
+def combinacoes(grupos, fixas=""):
+    """Gera (rótulo, keywords) para cada escolha de uma alternativa por grupo"""
+    vistas = set()
+    for escolha in product(*(grupo or [""] for grupo in grupos)):
+        palavras = tuple(" ".join((*escolha, fixas)).split())
+        if palavras in vistas:
+            continue
+        vistas.add(palavras)
+        rotulo = "_".join(NAO_NOME.sub("", alternativa) for alternativa in escolha if alternativa.strip()) or "padrao"
+        yield rotulo, palavras
+
+
+def filtrar_combinacoes(candidatas, rigoroso=False):
+    """Separa as combinações válidas das que o validador rejeita; devolve (válidas, [(rótulo, problemas)])"""
+    barrar = {"erro", "aviso"} if rigoroso else {"erro"}
+    validas, descartadas = [], []
+    for rotulo, palavras in candidatas:
+        problemas = [p for p in validar(" ".join(palavras)) if p["severidade"] in barrar]
+        if problemas:
+            descartadas.append((rotulo, problemas))
+        else:
+            validas.append((rotulo, palavras))
+    return validas, descartadas
+
+
+def chave_de_estado(keyword):
+    """Nome com que a keyword define o estado eletrônico (None se não define)"""
+    if keyword.nome in MULTIPLICIDADES:
+        return "multiplicidade"
+    return keyword.nome if keyword.nome in ESTADO else None
+
+
+def keywords_de_estado(palavras):
+    return tuple(keyword.texto for keyword in analisar_linha(" ".join(palavras)) if chave_de_estado(keyword))
+
+
+def juntar_estado(palavras, estado):
+    """Acrescenta à combinação as keywords de estado do deck; devolve (keywords, as que divergem da combinação)"""
+    definidas = {}
+    for keyword in analisar_linha(" ".join(palavras)):
+        chave = chave_de_estado(keyword)
+        if chave:
+            definidas[chave] = keyword.texto.upper()
+    extras, divergentes = [], []
+    for keyword in analisar_linha(" ".join(estado)):
+        definida = definidas.get(chave_de_estado(keyword))
+        if definida is None:
+            extras.append(keyword.texto)
+        elif definida != keyword.texto.upper():
+            divergentes.append(keyword.texto)
+    return (*palavras, *extras), divergentes
+
+
+def ler_geometria(caminho):
+    """Devolve (linhas dos átomos, símbolos, keywords de estado) de um .xyz ou do bloco de geometria de um .mop"""
+    atomos = []
+    leitor = ler_xyz if caminho.lower().endswith(".xyz") else ler_mop
+    with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+        palavras, simbolos = leitor(arquivo, atomos)
+    if not atomos:
+        raise ValueError("geometria vazia")
+    return "\n".join(atomos), simbolos - ATOMOS_IGNORADOS, keywords_de_estado(palavras)
+
+
+def gerar_lote(geometrias, metodos, escolhas, saida):
+    """Grava os decks de uma lista de (índice, caminho) — unidade de trabalho do pool"""
+    resultados = []
+    for indice, caminho in geometrias:
+        try:
+            atomos, simbolos, estado = ler_geometria(caminho)
+        except (OSError, ValueError) as erro:
+            resultados.append({"geometria": caminho, "erro": str(erro)})
+            continue
+        nome = f"{indice:06d}_{NAO_NOME.sub('', os.path.splitext(os.path.basename(caminho))[0])}"
+        suportados = methods_supporting(simbolos)
+        for metodo in metodos:
+            if metodo not in suportados:
+                mascara = method_masks[metodo]
+                resultados.append({"geometria": caminho, "metodo": metodo, "pulado": "elementos não suportados",
+                                   "nao_suportados": sorted(s for s in simbolos if not element_bits.get(s, 0) & mascara)})
+                continue
+            for rotulo, palavras in escolhas:
+                palavras, divergentes = juntar_estado(palavras, estado)
+                if divergentes:
+                    resultados.append({"geometria": caminho, "metodo": metodo, "combinacao": rotulo,
+                                       "pulado": "a combinação muda o estado do deck", "estado": list(estado)})
+                    continue
+                linha = " ".join((metodo, *palavras))
+                problemas = [p["mensagem"] for p in validar_em_cache(linha) if p["severidade"] == "erro"]
+                if problemas:
+                    resultados.append({"geometria": caminho, "metodo": metodo, "combinacao": rotulo,
+                                       "pulado": "keywords inválidas com o estado do deck", "problemas": problemas})
+                    continue
+                destino = os.path.join(saida, metodo, f"{nome}__{rotulo}.mop")
+                with open(destino, "w", encoding="utf-8", newline="\n") as arquivo:
+                    arquivo.write(f"{linha}\n{nome} {metodo} {rotulo}\n\n{atomos}\n\n")
+                resultados.append({"arquivo": destino, "geometria": caminho, "metodo": metodo, "keywords": linha})
+    return resultados
+
+
+def listar_geometrias(caminhos):
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            yield from listar_decks(caminho)
+        elif caminho.lower().endswith(EXTENSOES):
+            yield caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera decks .mop para todas as combinações de método e keywords.")
+    parser.add_argument("geometrias", nargs="+", help="arquivos .xyz/.mop ou pastas com eles")
+    parser.add_argument("-o", "--saida", required=True, help="pasta onde os decks são gravados")
+    parser.add_argument("-m", "--metodo", action="append", choices=sorted(methods_data),
+                        help="método da varredura; pode ser repetido (padrão: todos)")
+    parser.add_argument("-k", "--grupo", action="append", default=[],
+                        help='alternativas separadas por "|", por exemplo "PRECISE|GNORM=0.01" ou "PULAY|"')
+    parser.add_argument("--fixas", default="", help="keywords presentes em todos os decks")
+    parser.add_argument("--grade", help="arquivo JSON com metodos, grupos e fixas")
+    parser.add_argument("--rigoroso", action="store_true", help="descarta também combinações com avisos")
+    parser.add_argument("-j", "--processos", type=int, default=None, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument("--lote", type=int, default=8, help="geometrias por unidade de trabalho")
+    args = parser.parse_args(argv)
+
+    metodos, grupos, fixas = args.metodo, [grupo.split("|") for grupo in args.grupo], args.fixas
+    if args.grade:
+        with open(args.grade, encoding="utf-8") as arquivo:
+            grade = json.load(arquivo)
+        metodos = metodos or grade.get("metodos")
+        grupos = grupos or grade.get("grupos", [])
+        fixas = fixas or grade.get("fixas", "")
+    metodos = metodos or list(methods_data)
+    desconhecidos = [metodo for metodo in metodos if metodo not in methods_data]
+    if desconhecidos:
+        parser.error(f"métodos desconhecidos: {', '.join(desconhecidos)}")
+
+    validas, descartadas = filtrar_combinacoes(combinacoes(grupos, fixas), args.rigoroso)
+    for rotulo, problemas in descartadas:
+        print(f"descartada {rotulo}: " + "; ".join(p["mensagem"] for p in problemas), file=sys.stderr)
+    if not validas:
+        print("Nenhuma combinação de keywords válida.", file=sys.stderr)
+        return 1
+    fora_da_tabela = sorted({texto for _, palavras in validas for p in validar(" ".join(palavras))
+                             if p["tipo"] == "desconhecida" and p["severidade"] == "aviso" for texto in p["keywords"]})
+    if fora_da_tabela:
+        print(f"keywords fora da tabela do validador (mantidas): {', '.join(fora_da_tabela)}", file=sys.stderr)
+
+    for metodo in metodos:
+        os.makedirs(os.path.join(args.saida, metodo), exist_ok=True)
+    tarefa = partial(gerar_lote, metodos=metodos, escolhas=validas, saida=args.saida)
+    geometrias = enumerate(listar_geometrias(args.geometrias))
+
+    gerados = pulados = erros = 0
+    with open(os.path.join(args.saida, "manifesto.jsonl"), "w", encoding="utf-8") as manifesto:
+        for resultado in mapear_em_lotes(tarefa, geometrias, args.processos, args.lote):
+            if "arquivo" in resultado:
+                gerados += 1
+            elif "erro" in resultado:
+                erros += 1
+            else:
+                pulados += 1
+            manifesto.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+    print(f"{gerados} decks gerados ({len(validas)} combinações de keywords, {len(descartadas)} descartadas); "
+          f"{pulados} pulados (ver o manifesto); {erros} geometrias com erro.", file=sys.stderr)
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""Verificação em lote de decks de entrada do MOPAC (.mop/.xyz) contra methods_data.
+
+Uso:
+    python verificador_decks.py PASTA [-o resultado.jsonl] [-j PROCESSOS] [--metodo PM7]
+
+Cada arquivo gera uma linha JSON com o método usado, os elementos do deck e os
+elementos que o método não suporta. Um deck que pede um hamiltoniano fora de
+methods_data (como MNDOD) ou que não tem átomos também é acusado, em "problemas".
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from functools import partial
+from multiprocessing import freeze_support
+
+from nucleo import SYMBOLS_BY_Z, methods_data, element_bits, method_masks
+from lotes import mapear_em_lotes
+
+EXTENSOES = (".mop", ".xyz")
+METODO_PADRAO = "PM7"  # Método usado pelo MOPAC quando nenhum é informado no deck
+ATOMOS_IGNORADOS = {"X", "Xx", "Tv"}  # Átomos fictícios e vetores de translação
+# Hamiltonianos do MOPAC; os que não estão em methods_data não podem ser verificados
+HAMILTONIANOS = {"MNDO", "MNDOD", "MINDO3", "AM1", "PM3", "PM5", "PM6", "PM7", "RM1"}
+
+ATOMO = re.compile(r"\s*(?:([A-Za-z]{1,2})|(\d{1,3})(?![\d.]))")
+NUMEROS_ESPECIAIS = {99: "X", 107: "Tv"}  # Átomo fictício e vetor de translação dados por número
+
+
+def listar_decks(pasta, extensoes=EXTENSOES):
+    """Percorre a pasta recursivamente devolvendo os decks, sem montar a lista inteira"""
+    with os.scandir(pasta) as entradas:
+        for entrada in entradas:
+            if entrada.is_dir(follow_symlinks=False):
+                yield from listar_decks(entrada.path, extensoes)
+            elif entrada.name.lower().endswith(extensoes):
+                yield entrada.path
+
+
+def detectar_metodo(palavras, padrao=METODO_PADRAO):
+    """Procura o método entre as keywords (variantes como PM6-D3H4 contam como PM6)"""
+    for palavra in palavras:
+        nome = palavra.upper()
+        if nome in methods_data:
+            return nome
+        base = nome.split("-")[0]
+        if base in methods_data:
+            return base
+    return padrao
+
+
+def hamiltoniano_desconhecido(palavras):
+    """Hamiltoniano pedido no deck que não está em methods_data, ou None"""
+    for palavra in palavras:
+        nome = palavra.upper()
+        if nome.split("-")[0] in HAMILTONIANOS and detectar_metodo([nome], None) is None:
+            return nome
+    return None
+
+
+def simbolo_do_atomo(linha):
+    """Extrai o símbolo do elemento do início de uma linha de geometria (símbolo ou número atômico)"""
+    achado = ATOMO.match(linha)
+    if not achado:
+        return None
+    if achado.group(2):
+        numero = int(achado.group(2))
+        if 1 <= numero <= len(SYMBOLS_BY_Z):
+            return SYMBOLS_BY_Z[numero - 1]
+        return NUMEROS_ESPECIAIS.get(numero)
+    texto = achado.group(1)
+    simbolo = texto[0].upper() + texto[1:].lower()
+    if simbolo not in element_bits and len(simbolo) == 2 and simbolo[0] in element_bits:
+        simbolo = simbolo[0]  # Rótulos colados ao símbolo, como "CB"
+    return simbolo
+
+
+def ler_mop(arquivo, geometria=None):
+    """Lê a linha de keywords e o bloco de geometria de um .mop, parando no fim da geometria
+
+    Se `geometria` for uma lista, as linhas dos átomos são acrescentadas a ela.
+    """
+    palavras = []
+    linhas_titulo = 2
+    while True:
+        tokens = arquivo.readline().split()
+        palavras.extend(t for t in tokens if t not in ("+", "&"))
+        if "&" in tokens:
+            linhas_titulo -= 1
+        elif "+" not in tokens:
+            break
+    for _ in range(max(linhas_titulo, 0)):
+        arquivo.readline()
+
+    simbolos = set()
+    for numero_linha, linha in enumerate(arquivo, 1):
+        if not linha.strip():
+            break
+        simbolo = simbolo_do_atomo(linha)
+        if not simbolo:
+            raise ValueError(f"linha {numero_linha} da geometria sem elemento reconhecível: {linha.strip()[:40]}")
+        simbolos.add(simbolo)
+        if geometria is not None:
+            geometria.append(linha.rstrip())
+    return palavras, simbolos
+
+
+def ler_xyz(arquivo, geometria=None):
+    """Lê o comentário e os átomos de um .xyz (o método pode vir no comentário)"""
+    try:
+        quantidade = int(arquivo.readline().split()[0])
+    except (IndexError, ValueError):
+        raise ValueError("cabeçalho .xyz sem o número de átomos")
+    palavras = arquivo.readline().split()
+
+    simbolos = set()
+    for numero_linha in range(1, quantidade + 1):
+        linha = arquivo.readline()
+        simbolo = simbolo_do_atomo(linha)
+        if not simbolo:
+            raise ValueError(f"átomo {numero_linha} de {quantidade} sem elemento reconhecível: {linha.strip()[:40] or '(faltando)'}")
+        simbolos.add(simbolo)
+        if geometria is not None:
+            geometria.append(linha.rstrip())
+    return palavras, simbolos
+
+
+def ler_deck(caminho, metodo_padrao=METODO_PADRAO):
+    """Devolve (keywords, método, símbolos) de um deck .mop ou .xyz"""
+    leitor = ler_xyz if caminho.lower().endswith(".xyz") else ler_mop
+    with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+        palavras, simbolos = leitor(arquivo)
+    return palavras, detectar_metodo(palavras, metodo_padrao), simbolos - ATOMOS_IGNORADOS
+
+
+def verificar_deck(caminho, metodo_padrao=METODO_PADRAO):
+    """Verifica um deck e devolve o resultado como dicionário"""
+    try:
+        palavras, metodo, simbolos = ler_deck(caminho, metodo_padrao)
+    except (OSError, ValueError) as erro:
+        return {"arquivo": caminho, "erro": str(erro)}
+
+    problemas = []
+    if detectar_metodo(palavras, None) is None:
+        desconhecido = hamiltoniano_desconhecido(palavras)
+        if desconhecido:
+            metodo = desconhecido
+            problemas.append(f"método desconhecido: {desconhecido}")
+    if not simbolos:
+        problemas.append("deck sem átomos")
+    mascara = method_masks.get(metodo, 0)
+    nao_suportados = [] if metodo not in method_masks else sorted(s for s in simbolos if not element_bits.get(s, 0) & mascara)
+    return {
+        "arquivo": caminho,
+        "metodo": metodo,
+        "elementos": sorted(simbolos),
+        "nao_suportados": nao_suportados,
+        "problemas": problemas,
+        "ok": not nao_suportados and not problemas,
+    }
+
+
+def verificar_lote(caminhos, metodo_padrao=METODO_PADRAO):
+    """Verifica uma lista de decks (unidade de trabalho enviada ao pool)"""
+    return [verificar_deck(caminho, metodo_padrao) for caminho in caminhos]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica se os elementos de cada deck são suportados pelo método.")
+    parser.add_argument("pasta", help="pasta com os arquivos .mop/.xyz")
+    parser.add_argument("-o", "--saida", help="arquivo JSON lines de saída (padrão: stdout)")
+    parser.add_argument("-j", "--processos", type=int, default=None, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument("--metodo", default=METODO_PADRAO, choices=sorted(methods_data),
+                        help="método assumido quando o deck não informa nenhum")
+    parser.add_argument("--lote", type=int, default=64, help="arquivos por unidade de trabalho")
+    parser.add_argument("--apenas-erros", action="store_true", help="escreve só os decks com problemas")
+    args = parser.parse_args(argv)
+
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    total = com_problemas = 0
+    try:
+        tarefa = partial(verificar_lote, metodo_padrao=args.metodo)
+        for resultado in mapear_em_lotes(tarefa, listar_decks(args.pasta), args.processos, args.lote):
+            total += 1
+            if resultado.get("ok"):
+                if args.apenas_erros:
+                    continue
+            else:
+                com_problemas += 1
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    print(f"{total} decks verificados, {com_problemas} com problemas.", file=sys.stderr)
+    return 1 if com_problemas else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())